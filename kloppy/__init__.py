@@ -14,3 +14,20 @@ except NameError:
 #     from .domain.services.state_builder import add_state
 
 __version__ = "3.14.0"
+
+# The Arrow functions are imported on first use, so importing kloppy doesn't
+# import the domain models. They are also available from `kloppy.arrow`.
+_ARROW_FUNCTIONS = [
+    "load_events",
+    "load_tracking",
+    "save_events",
+    "save_tracking",
+]
+
+
+def __getattr__(name):
+    if name in _ARROW_FUNCTIONS and not __KLOPPY_SETUP__:
+        from ._providers import arrow
+
+        return getattr(arrow, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,144 @@
+from pathlib import PurePath
+from typing import Optional, Union
+
+from kloppy.config import get_config
+from kloppy.domain import EventDataset, EventFactory, TrackingDataset
+from kloppy.exceptions import KloppyParameterError
+from kloppy.infra.serializers.arrow.common import FORMATS
+from kloppy.infra.serializers.arrow.event import (
+    EventDataArrowDeserializer,
+    EventDataArrowSerializer,
+)
+from kloppy.infra.serializers.arrow.tracking import (
+    TrackingDataArrowDeserializer,
+    TrackingDataArrowSerializer,
+)
+from kloppy.io import FileLike, get_file_extension, open_as_file
+
+# The file extensions of the formats
+EXTENSIONS = {
+    ".parquet": "parquet",
+    ".pq": "parquet",
+    ".arrow": "arrow",
+    ".feather": "arrow",
+    ".ipc": "arrow",
+}
+
+
+def _get_format(path: FileLike, format: Optional[str]) -> str:
+    if format is not None:
+        if format not in FORMATS:
+            raise KloppyParameterError(
+                f"Format {format} is not valid. Use one of: "
+                f"{', '.join(FORMATS)}"
+            )
+        return format
+
+    try:
+        extension = get_file_extension(path).lower()
+    except Exception:
+        extension = None
+    if extension not in EXTENSIONS:
+        raise KloppyParameterError(
+            f"Could not determine the format from the file extension. "
+            f"Specify the format, one of: {', '.join(FORMATS)}"
+        )
+    return EXTENSIONS[extension]
+
+
+def save_tracking(
+    dataset: TrackingDataset,
+    path: Union[str, PurePath],
+    format: Optional[str] = None,
+):
+    """
+    Save a tracking dataset to a Parquet or Arrow IPC file.
+
+    The metadata is stored in the key-value metadata of the file, so the
+    dataset can be loaded without the original provider files.
+
+    Parameters:
+        dataset: the tracking dataset to save
+        path: filename of the file to write
+        format: 'parquet' or 'arrow'. Determined from the file extension
+            when not specified
+    """
+    serializer = TrackingDataArrowSerializer()
+    serializer.serialize(dataset, str(path), format=_get_format(path, format))
+
+
+def load_tracking(
+    path: FileLike, format: Optional[str] = None
+) -> TrackingDataset:
+    """
+    Load a tracking dataset saved with `save_tracking`.
+
+    Arrow IPC files on the local disk are memory mapped, and the frames of
+    the dataset are backed by the mapped file without copying it. The arrays
+    of those frames are read-only.
+
+    Parameters:
+        path: filename of the Parquet or Arrow IPC file
+        format: 'parquet' or 'arrow'. Determined from the file extension
+            when not specified
+    """
+    format = _get_format(path, format)
+    deserializer = TrackingDataArrowDeserializer()
+
+    if isinstance(path, PurePath):
+        path = str(path)
+    if isinstance(path, str) and "://" not in path:
+        return deserializer.deserialize(path, format=format)
+
+    with open_as_file(path) as fp:
+        return deserializer.deserialize(fp, format=format)
+
+
+def save_events(
+    dataset: EventDataset,
+    path: Union[str, PurePath],
+    format: Optional[str] = None,
+):
+    """
+    Save an event dataset to a Parquet or Arrow IPC file.
+
+    The events are stored in typed columns, and the metadata in the
+    key-value metadata of the file, so the dataset can be loaded without the
+    original provider files.
+
+    Parameters:
+        dataset: the event dataset to save
+        path: filename of the file to write
+        format: 'parquet' or 'arrow'. Determined from the file extension
+            when not specified
+    """
+    serializer = EventDataArrowSerializer()
+    serializer.serialize(dataset, str(path), format=_get_format(path, format))
+
+
+def load_events(
+    path: FileLike,
+    format: Optional[str] = None,
+    event_factory: Optional[EventFactory] = None,
+) -> EventDataset:
+    """
+    Load an event dataset saved with `save_events`.
+
+    Parameters:
+        path: filename of the Parquet or Arrow IPC file
+        format: 'parquet' or 'arrow'. Determined from the file extension
+            when not specified
+        event_factory: the factory that builds the events
+    """
+    format = _get_format(path, format)
+    deserializer = EventDataArrowDeserializer(
+        event_factory=event_factory or get_config("event_factory")
+    )
+
+    if isinstance(path, PurePath):
+        path = str(path)
+    if isinstance(path, str) and "://" not in path:
+        return deserializer.deserialize(path, format=format)
+
+    with open_as_file(path) as fp:
+        return deserializer.deserialize(fp, format=format)
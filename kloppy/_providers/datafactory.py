@@ -4,9 +4,11 @@ from kloppy.infra.serializers.event.datafactory import (
     DatafactoryInputs,
 )
 from kloppy.domain import EventDataset, Optional, List, EventFactory
+from kloppy.infra.dataset_cache import cached_dataset
 from kloppy.io import open_as_file, FileLike
 
 
+@cached_dataset
 def load(
     event_data: FileLike,
     event_types: Optional[List[str]] = None,
@@ -1,7 +1,13 @@
+from contextlib import ExitStack
 from typing import Optional, List, Union
 
 from kloppy.config import get_config
-from kloppy.domain import EventDataset, TrackingDataset, EventFactory
+from kloppy.domain import (
+    EventDataset,
+    TrackingDataset,
+    TrackingDataStream,
+    EventFactory,
+)
 from kloppy.exceptions import KloppyError
 from kloppy.infra.serializers.event.metrica import (
     MetricaJsonEventDataDeserializer,
@@ -15,18 +21,33 @@ from kloppy.infra.serializers.tracking.metrica_epts import (
     MetricaEPTSTrackingDataDeserializer,
     MetricaEPTSTrackingDataInputs,
 )
+from kloppy.infra.serializers.tracking.window import Timestamp
+from kloppy.infra.dataset_cache import cached_dataset
 from kloppy.io import FileLike, open_as_file
 
 
+@cached_dataset
 def load_tracking_csv(
     home_data: FileLike,
     away_data: FileLike,
     sample_rate: Optional[float] = None,
     limit: Optional[int] = None,
     coordinates: Optional[str] = None,
+    target_frame_rate: Optional[float] = None,
+    periods: Optional[List[int]] = None,
+    start: Optional[Timestamp] = None,
+    end: Optional[Timestamp] = None,
+    objects: Optional[List[str]] = None,
 ) -> TrackingDataset:
     deserializer = MetricaCSVTrackingDataDeserializer(
-        sample_rate=sample_rate, limit=limit, coordinate_system=coordinates
+        sample_rate=sample_rate,
+        limit=limit,
+        coordinate_system=coordinates,
+        target_frame_rate=target_frame_rate,
+        periods=periods,
+        start=start,
+        end=end,
+        objects=objects,
     )
     with open_as_file(home_data) as home_data_fp, open_as_file(
         away_data
@@ -38,15 +59,28 @@ def load_tracking_csv(
         )
 
 
+@cached_dataset
 def load_tracking_epts(
     meta_data: FileLike,
     raw_data: FileLike,
     sample_rate: Optional[float] = None,
     limit: Optional[int] = None,
     coordinates: Optional[str] = None,
+    target_frame_rate: Optional[float] = None,
+    periods: Optional[List[int]] = None,
+    start: Optional[Timestamp] = None,
+    end: Optional[Timestamp] = None,
+    objects: Optional[List[str]] = None,
 ) -> TrackingDataset:
     deserializer = MetricaEPTSTrackingDataDeserializer(
-        sample_rate=sample_rate, limit=limit, coordinate_system=coordinates
+        sample_rate=sample_rate,
+        limit=limit,
+        coordinate_system=coordinates,
+        target_frame_rate=target_frame_rate,
+        periods=periods,
+        start=start,
+        end=end,
+        objects=objects,
     )
     with open_as_file(raw_data) as raw_data_fp, open_as_file(
         meta_data
@@ -58,6 +92,79 @@ def load_tracking_epts(
         )
 
 
+def iter_tracking_csv(
+    home_data: FileLike,
+    away_data: FileLike,
+    sample_rate: Optional[float] = None,
+    limit: Optional[int] = None,
+    coordinates: Optional[str] = None,
+    target_frame_rate: Optional[float] = None,
+    periods: Optional[List[int]] = None,
+    start: Optional[Timestamp] = None,
+    end: Optional[Timestamp] = None,
+    objects: Optional[List[str]] = None,
+) -> TrackingDataStream:
+    """
+    Same as `load_tracking_csv`, but returns a [`TrackingDataStream`][kloppy.domain.models.tracking.TrackingDataStream]
+    that parses the frames one at a time while iterating over it.
+    """
+    deserializer = MetricaCSVTrackingDataDeserializer(
+        sample_rate=sample_rate,
+        limit=limit,
+        coordinate_system=coordinates,
+        target_frame_rate=target_frame_rate,
+        periods=periods,
+        start=start,
+        end=end,
+        objects=objects,
+    )
+    with ExitStack() as stack:
+        stream = deserializer.iter_records(
+            inputs=MetricaCSVTrackingDataInputs(
+                home_data=stack.enter_context(open_as_file(home_data)),
+                away_data=stack.enter_context(open_as_file(away_data)),
+            )
+        )
+        return stream.closing(stack.pop_all())
+
+
+def iter_tracking_epts(
+    meta_data: FileLike,
+    raw_data: FileLike,
+    sample_rate: Optional[float] = None,
+    limit: Optional[int] = None,
+    coordinates: Optional[str] = None,
+    target_frame_rate: Optional[float] = None,
+    periods: Optional[List[int]] = None,
+    start: Optional[Timestamp] = None,
+    end: Optional[Timestamp] = None,
+    objects: Optional[List[str]] = None,
+) -> TrackingDataStream:
+    """
+    Same as `load_tracking_epts`, but returns a [`TrackingDataStream`][kloppy.domain.models.tracking.TrackingDataStream]
+    that parses the frames one at a time while iterating over it.
+    """
+    deserializer = MetricaEPTSTrackingDataDeserializer(
+        sample_rate=sample_rate,
+        limit=limit,
+        coordinate_system=coordinates,
+        target_frame_rate=target_frame_rate,
+        periods=periods,
+        start=start,
+        end=end,
+        objects=objects,
+    )
+    with ExitStack() as stack:
+        stream = deserializer.iter_records(
+            inputs=MetricaEPTSTrackingDataInputs(
+                raw_data=stack.enter_context(open_as_file(raw_data)),
+                meta_data=stack.enter_context(open_as_file(meta_data)),
+            )
+        )
+        return stream.closing(stack.pop_all())
+
+
+@cached_dataset
 def load_event(
     event_data: FileLike,
     meta_data: FileLike,
@@ -4,9 +4,11 @@ from kloppy.infra.serializers.event.opta import (
     OptaInputs,
 )
 from kloppy.domain import EventDataset, Optional, List, EventFactory
+from kloppy.infra.dataset_cache import cached_dataset
 from kloppy.io import open_as_file, FileLike
 
 
+@cached_dataset
 def load(
     f7_data: FileLike,
     f24_data: FileLike,
@@ -1,14 +1,17 @@
-from typing import Optional
-import contextlib
+from typing import List, Optional, Tuple
+from contextlib import ExitStack
 
-from kloppy.domain import TrackingDataset
+from kloppy.domain import TrackingDataset, TrackingDataStream
 from kloppy.infra.serializers.tracking.secondspectrum import (
     SecondSpectrumDeserializer,
     SecondSpectrumInputs,
 )
+from kloppy.infra.serializers.tracking.window import Timestamp
+from kloppy.infra.dataset_cache import cached_dataset
 from kloppy.io import FileLike, open_as_file, Source
 
 
+@cached_dataset
 def load(
     meta_data: FileLike,
     raw_data: FileLike,
@@ -17,12 +20,53 @@ def load(
     limit: Optional[int] = None,
     coordinates: Optional[str] = None,
     only_alive: Optional[bool] = False,
+    frame_range: Optional[Tuple[int, int]] = None,
+    periods: Optional[List[int]] = None,
+    use_frame_index: Optional[bool] = False,
+    target_frame_rate: Optional[float] = None,
+    start: Optional[Timestamp] = None,
+    end: Optional[Timestamp] = None,
+    objects: Optional[List[str]] = None,
 ) -> TrackingDataset:
+    """
+    Load Second Spectrum tracking data.
+
+    Parameters:
+        meta_data: filename of the XML or JSON file containing the match information
+        raw_data: filename of the JSONL file containing the tracking data
+        additional_meta_data: filename of the JSON file containing the players
+        sample_rate:
+        limit:
+        coordinates:
+        only_alive: only include frames in which the ball is alive
+        frame_range: only load the frames with a frameIdx within this (inclusive) range
+        periods: only load the frames of these period ids
+        start: only load the frames at or after this time (a timedelta or
+            seconds) from the start of their period
+        end: only load the frames at or before this time from the start of
+            their period. Reading stops once the frames are past `end` of the
+            last loaded period.
+        objects: only load these objects: "ball", and the team ids (or
+            "home" and "away") of the teams whose players are loaded. The
+            data of the other objects is not parsed.
+        use_frame_index: use an index of the byte offsets of the frames to
+            seek directly to the requested `frame_range` and `periods`. The
+            index is built on first use and stored next to the raw data file.
+        target_frame_rate: downsample the frames to this frame rate instead
+            of using `sample_rate`. 5 keeps every 5th frame of 25 fps data.
+    """
     deserializer = SecondSpectrumDeserializer(
         sample_rate=sample_rate,
+        target_frame_rate=target_frame_rate,
         limit=limit,
         coordinate_system=coordinates,
         only_alive=only_alive,
+        frame_range=frame_range,
+        periods=periods,
+        use_frame_index=use_frame_index,
+        start=start,
+        end=end,
+        objects=objects,
     )
     with open_as_file(meta_data) as meta_data_fp, open_as_file(
         raw_data
@@ -36,3 +80,51 @@ def load(
                 additional_meta_data=additional_meta_data_fp,
             )
         )
+
+
+def iter_frames(
+    meta_data: FileLike,
+    raw_data: FileLike,
+    additional_meta_data: Optional[FileLike] = None,
+    sample_rate: Optional[float] = None,
+    limit: Optional[int] = None,
+    coordinates: Optional[str] = None,
+    only_alive: Optional[bool] = False,
+    frame_range: Optional[Tuple[int, int]] = None,
+    periods: Optional[List[int]] = None,
+    use_frame_index: Optional[bool] = False,
+    target_frame_rate: Optional[float] = None,
+    start: Optional[Timestamp] = None,
+    end: Optional[Timestamp] = None,
+    objects: Optional[List[str]] = None,
+) -> TrackingDataStream:
+    """
+    Same as `load`, but returns a [`TrackingDataStream`][kloppy.domain.models.tracking.TrackingDataStream]
+    that parses the frames one at a time while iterating over it.
+    """
+    deserializer = SecondSpectrumDeserializer(
+        sample_rate=sample_rate,
+        target_frame_rate=target_frame_rate,
+        limit=limit,
+        coordinate_system=coordinates,
+        only_alive=only_alive,
+        frame_range=frame_range,
+        periods=periods,
+        use_frame_index=use_frame_index,
+        start=start,
+        end=end,
+        objects=objects,
+    )
+    with ExitStack() as stack:
+        stream = deserializer.iter_records(
+            inputs=SecondSpectrumInputs(
+                meta_data=stack.enter_context(open_as_file(meta_data)),
+                raw_data=stack.enter_context(open_as_file(raw_data)),
+                additional_meta_data=stack.enter_context(
+                    open_as_file(
+                        Source.create(additional_meta_data, optional=True)
+                    )
+                ),
+            )
+        )
+        return stream.closing(stack.pop_all())
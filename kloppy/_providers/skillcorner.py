@@ -1,13 +1,17 @@
-from typing import Optional, Union
+from contextlib import ExitStack
+from typing import List, Optional, Union
 
-from kloppy.domain import TrackingDataset
+from kloppy.domain import TrackingDataset, TrackingDataStream
 from kloppy.infra.serializers.tracking.skillcorner import (
     SkillCornerDeserializer,
     SkillCornerInputs,
 )
+from kloppy.infra.serializers.tracking.window import Timestamp
+from kloppy.infra.dataset_cache import cached_dataset
 from kloppy.io import FileLike, open_as_file
 
 
+@cached_dataset
 def load(
     meta_data: FileLike,
     raw_data: FileLike,
@@ -15,12 +19,24 @@ def load(
     limit: Optional[int] = None,
     coordinates: Optional[str] = None,
     include_empty_frames: Optional[bool] = False,
+    incremental: Optional[bool] = False,
+    target_frame_rate: Optional[float] = None,
+    periods: Optional[List[int]] = None,
+    start: Optional[Timestamp] = None,
+    end: Optional[Timestamp] = None,
+    objects: Optional[List[str]] = None,
 ) -> TrackingDataset:
     deserializer = SkillCornerDeserializer(
         sample_rate=sample_rate,
+        target_frame_rate=target_frame_rate,
         limit=limit,
         coordinate_system=coordinates,
         include_empty_frames=include_empty_frames,
+        incremental=incremental,
+        periods=periods,
+        start=start,
+        end=end,
+        objects=objects,
     )
     with open_as_file(meta_data) as meta_data_fp, open_as_file(
         raw_data
@@ -32,6 +48,46 @@ def load(
         )
 
 
+def iter_frames(
+    meta_data: FileLike,
+    raw_data: FileLike,
+    sample_rate: Optional[float] = None,
+    limit: Optional[int] = None,
+    coordinates: Optional[str] = None,
+    include_empty_frames: Optional[bool] = False,
+    incremental: Optional[bool] = False,
+    target_frame_rate: Optional[float] = None,
+    periods: Optional[List[int]] = None,
+    start: Optional[Timestamp] = None,
+    end: Optional[Timestamp] = None,
+    objects: Optional[List[str]] = None,
+) -> TrackingDataStream:
+    """
+    Same as `load`, but returns a [`TrackingDataStream`][kloppy.domain.models.tracking.TrackingDataStream]
+    that parses the frames one at a time while iterating over it.
+    """
+    deserializer = SkillCornerDeserializer(
+        sample_rate=sample_rate,
+        target_frame_rate=target_frame_rate,
+        limit=limit,
+        coordinate_system=coordinates,
+        include_empty_frames=include_empty_frames,
+        incremental=incremental,
+        periods=periods,
+        start=start,
+        end=end,
+        objects=objects,
+    )
+    with ExitStack() as stack:
+        stream = deserializer.iter_records(
+            inputs=SkillCornerInputs(
+                meta_data=stack.enter_context(open_as_file(meta_data)),
+                raw_data=stack.enter_context(open_as_file(raw_data)),
+            )
+        )
+        return stream.closing(stack.pop_all())
+
+
 def load_open_data(
     match_id: Union[str, int] = "4039",
     sample_rate: Optional[float] = None,
@@ -1,7 +1,13 @@
+from contextlib import ExitStack
 from typing import Optional, List
 
 from kloppy.config import get_config
-from kloppy.domain import EventDataset, EventFactory, TrackingDataset
+from kloppy.domain import (
+    EventDataset,
+    EventFactory,
+    TrackingDataset,
+    TrackingDataStream,
+)
 from kloppy.infra.serializers.event.sportec import (
     SportecEventDataDeserializer,
     SportecEventDataInputs,
@@ -10,10 +16,13 @@ from kloppy.infra.serializers.tracking.sportec import (
     SportecTrackingDataDeserializer,
     SportecTrackingDataInputs,
 )
+from kloppy.infra.serializers.tracking.window import Timestamp
+from kloppy.infra.dataset_cache import cached_dataset
 from kloppy.io import open_as_file, FileLike
 from kloppy.utils import deprecated
 
 
+@cached_dataset
 def load_event(
     event_data: FileLike,
     meta_data: FileLike,
@@ -47,6 +56,7 @@ def load_event(
         )
 
 
+@cached_dataset
 def load_tracking(
     meta_data: FileLike,
     raw_data: FileLike,
@@ -54,12 +64,22 @@ def load_tracking(
     limit: Optional[int] = None,
     coordinates: Optional[str] = None,
     only_alive: Optional[bool] = True,
+    target_frame_rate: Optional[float] = None,
+    periods: Optional[List[int]] = None,
+    start: Optional[Timestamp] = None,
+    end: Optional[Timestamp] = None,
+    objects: Optional[List[str]] = None,
 ) -> TrackingDataset:
     deserializer = SportecTrackingDataDeserializer(
         sample_rate=sample_rate,
+        target_frame_rate=target_frame_rate,
         limit=limit,
         coordinate_system=coordinates,
         only_alive=only_alive,
+        periods=periods,
+        start=start,
+        end=end,
+        objects=objects,
     )
     with open_as_file(meta_data) as meta_data_fp, open_as_file(
         raw_data
@@ -71,6 +91,44 @@ def load_tracking(
         )
 
 
+def iter_tracking(
+    meta_data: FileLike,
+    raw_data: FileLike,
+    sample_rate: Optional[float] = None,
+    limit: Optional[int] = None,
+    coordinates: Optional[str] = None,
+    only_alive: Optional[bool] = True,
+    target_frame_rate: Optional[float] = None,
+    periods: Optional[List[int]] = None,
+    start: Optional[Timestamp] = None,
+    end: Optional[Timestamp] = None,
+    objects: Optional[List[str]] = None,
+) -> TrackingDataStream:
+    """
+    Same as `load_tracking`, but returns a [`TrackingDataStream`][kloppy.domain.models.tracking.TrackingDataStream]
+    that parses the frames one at a time while iterating over it.
+    """
+    deserializer = SportecTrackingDataDeserializer(
+        sample_rate=sample_rate,
+        target_frame_rate=target_frame_rate,
+        limit=limit,
+        coordinate_system=coordinates,
+        only_alive=only_alive,
+        periods=periods,
+        start=start,
+        end=end,
+        objects=objects,
+    )
+    with ExitStack() as stack:
+        stream = deserializer.iter_records(
+            inputs=SportecTrackingDataInputs(
+                meta_data=stack.enter_context(open_as_file(meta_data)),
+                raw_data=stack.enter_context(open_as_file(raw_data)),
+            )
+        )
+        return stream.closing(stack.pop_all())
+
+
 @deprecated("sportec.load_event should be used")
 def load(
     event_data: FileLike,
@@ -9,6 +9,7 @@ from kloppy.infra.serializers.event.statsbomb import (
     StatsBombInputs,
 )
 from kloppy.domain import EventDataset, Optional, List, EventFactory
+from kloppy.infra.dataset_cache import cached_dataset
 from kloppy.io import open_as_file, FileLike, Source
 
 
@@ -17,6 +18,7 @@ def dummy_context_mgr():
     yield None
 
 
+@cached_dataset
 def load(
     event_data: FileLike,
     lineup_data: FileLike,
@@ -1,13 +1,17 @@
-from typing import Optional
+from contextlib import ExitStack
+from typing import List, Optional
 
-from kloppy.domain import TrackingDataset
+from kloppy.domain import TrackingDataset, TrackingDataStream
 from kloppy.infra.serializers.tracking.statsperform import (
     StatsPerformDeserializer,
     StatsPerformInputs,
 )
+from kloppy.infra.serializers.tracking.window import Timestamp
+from kloppy.infra.dataset_cache import cached_dataset
 from kloppy.io import FileLike, open_as_file
 
 
+@cached_dataset
 def load(
     meta_data: FileLike,  # Stats Perform MA1 file - xml or json - single game, live data & lineups
     raw_data: FileLike,  # Stats Perform MA25 file - txt - tracking data
@@ -15,12 +19,22 @@ def load(
     limit: Optional[int] = None,
     coordinates: Optional[str] = None,
     only_alive: Optional[bool] = False,
+    target_frame_rate: Optional[float] = None,
+    periods: Optional[List[int]] = None,
+    start: Optional[Timestamp] = None,
+    end: Optional[Timestamp] = None,
+    objects: Optional[List[str]] = None,
 ) -> TrackingDataset:
     deserializer = StatsPerformDeserializer(
         sample_rate=sample_rate,
+        target_frame_rate=target_frame_rate,
         limit=limit,
         coordinate_system=coordinates,
         only_alive=only_alive,
+        periods=periods,
+        start=start,
+        end=end,
+        objects=objects,
     )
     with open_as_file(meta_data) as meta_data_fp, open_as_file(
         raw_data
@@ -30,3 +44,41 @@ def load(
                 meta_data=meta_data_fp, raw_data=raw_data_fp
             )
         )
+
+
+def iter_frames(
+    meta_data: FileLike,
+    raw_data: FileLike,
+    sample_rate: Optional[float] = None,
+    limit: Optional[int] = None,
+    coordinates: Optional[str] = None,
+    only_alive: Optional[bool] = False,
+    target_frame_rate: Optional[float] = None,
+    periods: Optional[List[int]] = None,
+    start: Optional[Timestamp] = None,
+    end: Optional[Timestamp] = None,
+    objects: Optional[List[str]] = None,
+) -> TrackingDataStream:
+    """
+    Same as `load`, but returns a [`TrackingDataStream`][kloppy.domain.models.tracking.TrackingDataStream]
+    that parses the frames one at a time while iterating over it.
+    """
+    deserializer = StatsPerformDeserializer(
+        sample_rate=sample_rate,
+        target_frame_rate=target_frame_rate,
+        limit=limit,
+        coordinate_system=coordinates,
+        only_alive=only_alive,
+        periods=periods,
+        start=start,
+        end=end,
+        objects=objects,
+    )
+    with ExitStack() as stack:
+        stream = deserializer.iter_records(
+            inputs=StatsPerformInputs(
+                meta_data=stack.enter_context(open_as_file(meta_data)),
+                raw_data=stack.enter_context(open_as_file(raw_data)),
+            )
+        )
+        return stream.closing(stack.pop_all())
@@ -1,7 +1,7 @@
-from typing import Optional, Union, Type
+from contextlib import ExitStack
+from typing import List, Optional, Tuple, Union, Type
 
-
-from kloppy.domain import TrackingDataset
+from kloppy.domain import TrackingDataset, TrackingDataStream
 from kloppy.infra.serializers.tracking.tracab.tracab_dat import (
     TRACABDatDeserializer,
 )
@@ -9,9 +9,13 @@ from kloppy.infra.serializers.tracking.tracab.tracab_json import (
     TRACABJSONDeserializer,
     TRACABInputs,
 )
+from kloppy.infra.serializers.tracking.window import Timestamp
+from kloppy.exceptions import KloppyParameterError
+from kloppy.infra.dataset_cache import cached_dataset
 from kloppy.io import FileLike, open_as_file, get_file_extension
 
 
+@cached_dataset
 def load(
     meta_data: FileLike,
     raw_data: FileLike,
@@ -20,7 +24,142 @@ def load(
     coordinates: Optional[str] = None,
     only_alive: Optional[bool] = True,
     file_format: Optional[str] = None,
+    frame_range: Optional[Tuple[int, int]] = None,
+    periods: Optional[List[int]] = None,
+    use_frame_index: Optional[bool] = False,
+    n_workers: Optional[int] = None,
+    incremental: Optional[bool] = False,
+    target_frame_rate: Optional[float] = None,
+    start: Optional[Timestamp] = None,
+    end: Optional[Timestamp] = None,
+    objects: Optional[List[str]] = None,
 ) -> TrackingDataset:
+    """
+    Load TRACAB tracking data.
+
+    Parameters:
+        meta_data: filename of the XML or JSON file containing the match information
+        raw_data: filename of the dat or JSON file containing the tracking data
+        sample_rate:
+        limit:
+        coordinates:
+        only_alive: only include frames in which the ball is alive
+        file_format: 'dat' or 'json'. Determined from the file extensions when not specified
+        frame_range: only load the frames with a frame id within this (inclusive) range
+        periods: only load the frames of these period ids
+        start: only load the frames at or after this time (a timedelta or
+            seconds) from the start of their period
+        end: only load the frames at or before this time from the start of
+            their period. Reading stops once the frames are past `end` of the
+            last loaded period.
+        objects: only load these objects: "ball", and the team ids (or
+            "home" and "away") of the teams whose players are loaded. The
+            data of the other objects is not parsed.
+        use_frame_index: use an index of the byte offsets of the frames (dat
+            only) to seek directly to the requested `frame_range` and `periods`.
+            The index is built on first use and stored next to the raw data file.
+        n_workers: parse the raw data (dat only) in chunks in this number of
+            processes. The raw data must be a local file.
+        incremental: decode the frames of the raw data (JSON only) one at a
+            time instead of decoding the whole document at once. This lowers
+            the memory usage to about the size of the loaded dataset.
+        target_frame_rate: downsample the frames to this frame rate instead
+            of using `sample_rate`. 5 keeps every 5th frame of 25 fps data.
+    """
+    deserializer = _create_deserializer(
+        meta_data,
+        raw_data,
+        sample_rate=sample_rate,
+        target_frame_rate=target_frame_rate,
+        limit=limit,
+        coordinates=coordinates,
+        only_alive=only_alive,
+        file_format=file_format,
+        frame_range=frame_range,
+        periods=periods,
+        use_frame_index=use_frame_index,
+        n_workers=n_workers,
+        incremental=incremental,
+        start=start,
+        end=end,
+        objects=objects,
+    )
+    with open_as_file(meta_data) as meta_data_fp, open_as_file(
+        raw_data
+    ) as raw_data_fp:
+        return deserializer.deserialize(
+            inputs=TRACABInputs(meta_data=meta_data_fp, raw_data=raw_data_fp)
+        )
+
+
+def iter_frames(
+    meta_data: FileLike,
+    raw_data: FileLike,
+    sample_rate: Optional[float] = None,
+    limit: Optional[int] = None,
+    coordinates: Optional[str] = None,
+    only_alive: Optional[bool] = True,
+    file_format: Optional[str] = None,
+    frame_range: Optional[Tuple[int, int]] = None,
+    periods: Optional[List[int]] = None,
+    use_frame_index: Optional[bool] = False,
+    n_workers: Optional[int] = None,
+    incremental: Optional[bool] = False,
+    target_frame_rate: Optional[float] = None,
+    start: Optional[Timestamp] = None,
+    end: Optional[Timestamp] = None,
+    objects: Optional[List[str]] = None,
+) -> TrackingDataStream:
+    """
+    Same as `load`, but returns a [`TrackingDataStream`][kloppy.domain.models.tracking.TrackingDataStream]
+    that parses the frames one at a time while iterating over it.
+    """
+    deserializer = _create_deserializer(
+        meta_data,
+        raw_data,
+        sample_rate=sample_rate,
+        target_frame_rate=target_frame_rate,
+        limit=limit,
+        coordinates=coordinates,
+        only_alive=only_alive,
+        file_format=file_format,
+        frame_range=frame_range,
+        periods=periods,
+        use_frame_index=use_frame_index,
+        n_workers=n_workers,
+        incremental=incremental,
+        start=start,
+        end=end,
+        objects=objects,
+    )
+    with ExitStack() as stack:
+        stream = deserializer.iter_records(
+            inputs=TRACABInputs(
+                meta_data=stack.enter_context(open_as_file(meta_data)),
+                raw_data=stack.enter_context(open_as_file(raw_data)),
+            )
+        )
+        return stream.closing(stack.pop_all())
+
+
+def _create_deserializer(
+    meta_data: FileLike,
+    raw_data: FileLike,
+    sample_rate: Optional[float],
+    limit: Optional[int],
+    coordinates: Optional[str],
+    only_alive: Optional[bool],
+    file_format: Optional[str],
+    frame_range: Optional[Tuple[int, int]],
+    periods: Optional[List[int]],
+    use_frame_index: Optional[bool],
+    n_workers: Optional[int],
+    incremental: Optional[bool],
+    target_frame_rate: Optional[float],
+    start: Optional[Timestamp],
+    end: Optional[Timestamp],
+    objects: Optional[List[str]],
+) -> Union[TRACABDatDeserializer, TRACABJSONDeserializer]:
     if file_format == "dat":
         deserializer_class = TRACABDatDeserializer
     elif file_format == "json":
@@ -28,18 +167,44 @@ def load(
     else:
         deserializer_class = identify_deserializer(meta_data, raw_data)
 
-    deserializer = deserializer_class(
+    if deserializer_class == TRACABDatDeserializer:
+        if incremental:
+            raise KloppyParameterError(
+                "incremental is only supported for TRACAB JSON files, dat "
+                "files are always decoded one line at a time"
+            )
+        return TRACABDatDeserializer(
+            sample_rate=sample_rate,
+            target_frame_rate=target_frame_rate,
+            limit=limit,
+            coordinate_system=coordinates,
+            only_alive=only_alive,
+            frame_range=frame_range,
+            periods=periods,
+            start=start,
+            end=end,
+            objects=objects,
+            use_frame_index=use_frame_index,
+            n_workers=n_workers,
+        )
+
+    if frame_range or use_frame_index or n_workers:
+        raise KloppyParameterError(
+            "frame_range, use_frame_index and n_workers are only supported "
+            "for TRACAB dat files"
+        )
+    return TRACABJSONDeserializer(
         sample_rate=sample_rate,
+        target_frame_rate=target_frame_rate,
         limit=limit,
         coordinate_system=coordinates,
         only_alive=only_alive,
+        incremental=incremental,
+        periods=periods,
+        start=start,
+        end=end,
+        objects=objects,
     )
-    with open_as_file(meta_data) as meta_data_fp, open_as_file(
-        raw_data
-    ) as raw_data_fp:
-        return deserializer.deserialize(
-            inputs=TRACABInputs(meta_data=meta_data_fp, raw_data=raw_data_fp)
-        )
 
 
 def identify_deserializer(
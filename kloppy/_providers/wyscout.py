@@ -1,5 +1,4 @@
-import json
-from typing import Union, Type
+from typing import IO, Dict, Union, Type
 
 from kloppy.config import get_config
 from kloppy.infra.serializers.event.wyscout import (
@@ -8,9 +7,12 @@ from kloppy.infra.serializers.event.wyscout import (
     WyscoutInputs,
 )
 from kloppy.domain import EventDataset, Optional, List, EventFactory
+from kloppy.infra.dataset_cache import cached_dataset
 from kloppy.io import open_as_file, FileLike
+from kloppy.infra.serializers import json_backend
 
 
+@cached_dataset
 def load(
     event_data: FileLike,
     event_types: Optional[List[str]] = None,
@@ -28,20 +30,21 @@ def load(
         event_factory:
         data_version:
     """
-    if data_version == "V2":
-        deserializer_class = WyscoutDeserializerV2
-    elif data_version == "V3":
-        deserializer_class = WyscoutDeserializerV3
-    else:
-        deserializer_class = identify_deserializer(event_data)
+    with open_as_file(event_data) as event_data_fp:
+        if data_version == "V2":
+            deserializer_class = WyscoutDeserializerV2
+        elif data_version == "V3":
+            deserializer_class = WyscoutDeserializerV3
+        else:
+            # Reuse the opened file, so it's only read once
+            deserializer_class = identify_deserializer(event_data_fp)
 
-    deserializer = deserializer_class(
-        event_types=event_types,
-        coordinate_system=coordinates,
-        event_factory=event_factory or get_config("event_factory"),
-    )
+        deserializer = deserializer_class(
+            event_types=event_types,
+            coordinate_system=coordinates,
+            event_factory=event_factory or get_config("event_factory"),
+        )
 
-    with open_as_file(event_data) as event_data_fp:
         return deserializer.deserialize(
             inputs=WyscoutInputs(event_data=event_data_fp),
         )
@@ -64,11 +67,19 @@ def load_open_data(
 def identify_deserializer(
     event_data: FileLike,
 ) -> Union[Type[WyscoutDeserializerV3], Type[WyscoutDeserializerV2]]:
-    with open_as_file(event_data) as event_data_fp:
-        events_with_meta = json.load(event_data_fp)
+    """Determine the data version from the first event.
 
-    events = events_with_meta["events"]
-    first_event = events[0]
+    Only the start of the file is decoded, up to the first event. When
+    `event_data` is an opened file, it's rewound afterwards so it can be
+    passed to the deserializer.
+    """
+    if hasattr(event_data, "read"):
+        start = event_data.tell()
+        first_event = _read_first_event(event_data)
+        event_data.seek(start)
+    else:
+        with open_as_file(event_data) as event_data_fp:
+            first_event = _read_first_event(event_data_fp)
 
     deserializer = None
     if "eventName" in first_event:
@@ -82,3 +93,13 @@ def identify_deserializer(
         )
 
     return deserializer
+
+
+def _read_first_event(event_data_fp: IO) -> Dict:
+    events = json_backend.iter_array_items(event_data_fp, "events")
+    try:
+        return next(events)
+    except StopIteration:
+        return {}
+    finally:
+        events.close()
@@ -0,0 +1,6 @@
+from ._providers.arrow import (
+    load_events,
+    load_tracking,
+    save_events,
+    save_tracking,
+)
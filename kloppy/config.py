@@ -19,10 +19,14 @@ cache_dir = os.environ.get("KLOPPY_CACHE_DIR")
 if not cache_dir:
     cache_dir = os.path.expanduser("~/kloppy_cache")
 
+# Loaded datasets are only cached when a directory is set
+dataset_cache_dir = os.environ.get("KLOPPY_DATASET_CACHE_DIR") or None
+
 Config = TypedDict(
     "Config",
     {
         "cache": Optional[str],
+        "dataset_cache": Optional[str],
         "coordinate_system": Optional[str],
         "event_factory": Optional[EventFactory],
         "adapters.http.basic_authentication": Optional[str],
@@ -30,17 +34,32 @@ Config = TypedDict(
         "dataframe.engine": Optional[
             Union[Literal["pandas"], Literal["polars"]]
         ],
+        "tracking.storage": Optional[
+            Union[Literal["frames"], Literal["columnar"]]
+        ],
+        "json.backend": Optional[
+            Union[
+                Literal["auto"],
+                Literal["json"],
+                Literal["orjson"],
+                Literal["ujson"],
+                Literal["simdjson"],
+            ]
+        ],
     },
 )
 
 # https://github.com/python/mypy/issues/6262
 CONFIG_KEYS = Literal[
     "cache",
+    "dataset_cache",
     "coordinate_system",
     "event_factory",
     "adapters.http.basic_authentication",
     "adapters.s3.s3fs",
     "dataframe.engine",
+    "tracking.storage",
+    "json.backend",
 ]
 
 
@@ -50,11 +69,14 @@ class PartialConfig(Config, total=False):
 
 _default_config: Config = {
     "cache": cache_dir,
+    "dataset_cache": dataset_cache_dir,
     "coordinate_system": "kloppy",
     "event_factory": None,
     "adapters.http.basic_authentication": None,
     "adapters.s3.s3fs": None,
     "dataframe.engine": "pandas",
+    "tracking.storage": "frames",
+    "json.backend": "auto",
 }
 
 config = copy(_default_config)
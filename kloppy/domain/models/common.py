@@ -1,3 +1,4 @@
+import operator
 import sys
 from abc import ABC, abstractmethod
 from collections import defaultdict
@@ -41,6 +42,7 @@ from .pitch import (
     WyscoutPitchDimensions,
 )
 from .formation import FormationType
+from ...utils import add_slots
 from ...exceptions import (
     OrientationError,
     InvalidFilterError,
@@ -860,6 +862,7 @@ class DatasetFlag(Flag):
     BALL_STATE = 2
 
 
+@add_slots
 @dataclass
 class DataRecord(ABC):
     """
@@ -870,35 +873,51 @@ class DataRecord(ABC):
         timestamp: Timestamp of occurrence, relative to the period kick-off
         ball_owning_team: See [`Team`][kloppy.domain.models.common.Team]
         ball_state: See [`Team`][kloppy.domain.models.common.BallState]
+        prev_record: The previous record in the dataset (read-only)
+        next_record: The next record in the dataset (read-only)
     """
 
-    dataset: "Dataset" = field(init=False)
-    prev_record: Optional["DataRecord"] = field(init=False)
-    next_record: Optional["DataRecord"] = field(init=False)
+    dataset: "Dataset" = field(init=False, repr=False, compare=False)
     period: Period
     timestamp: timedelta
     ball_owning_team: Optional[Team]
     ball_state: Optional[BallState]
 
+    _index: Optional[int] = field(
+        init=False, default=None, repr=False, compare=False
+    )
+
     @property
     @abstractmethod
     def record_id(self) -> Union[int, str]:
         pass
 
-    def set_refs(
-        self,
-        dataset: "Dataset",
-        prev: Optional["DataRecord"],
-        next_: Optional["DataRecord"],
-    ):
+    def set_refs(self, dataset: "Dataset", index: int):
         if hasattr(self, "dataset"):
             # TODO: determine if next/prev record should be affected
             # by Dataset.filter
             return
 
         self.dataset = dataset
-        self.prev_record = prev
-        self.next_record = next_
+        self._index = index
+
+    def _get_sibling(self, offset: int) -> Optional["DataRecord"]:
+        if self._index is None:
+            return None
+
+        index = self._index + offset
+        records = self.dataset.records
+        if 0 <= index < len(records):
+            return records[index]
+        return None
+
+    @property
+    def prev_record(self) -> Optional["DataRecord"]:
+        return self._get_sibling(-1)
+
+    @property
+    def next_record(self) -> Optional["DataRecord"]:
+        return self._get_sibling(1)
 
     @property
     def attacking_direction(self):
@@ -986,6 +1005,177 @@ class Metadata:
 T = TypeVar("T", bound="DataRecord")
 
 
+class _RecordList(list):
+    """
+    List of records that links each record to its dataset the first time the
+    record is read, instead of walking all records when the dataset is
+    created. Records find their previous and next record through their index
+    in the dataset.
+
+    Every method that returns records links them first. Methods that move
+    records to another position update the index of the records that are
+    already linked to the dataset.
+    """
+
+    def __init__(self, records: Iterable[T], dataset: "Dataset"):
+        if isinstance(records, _RecordList):
+            # Don't link the records to the dataset they are copied from
+            records = list.__iter__(records)
+        super().__init__(records)
+        self._dataset = dataset
+        self._linked = bytearray(len(self))
+        self._n_unlinked = len(self)
+
+    def __reduce__(self):
+        return self.__class__, (list(list.__iter__(self)), self._dataset)
+
+    def _link(self, index: int) -> T:
+        record = list.__getitem__(self, index)
+        if not self._linked[index]:
+            record.set_refs(dataset=self._dataset, index=index)
+            self._linked[index] = 1
+            self._n_unlinked -= 1
+        return record
+
+    def _link_all(self):
+        if self._n_unlinked:
+            for index in range(len(self)):
+                self._link(index)
+
+    def _normalize_index(self, index) -> int:
+        index = operator.index(index)
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("list index out of range")
+        return index
+
+    def _detach(self, records: Iterable[T]):
+        for record in records:
+            if getattr(record, "dataset", None) is self._dataset:
+                record._index = None
+
+    def _reindex(self):
+        self._linked = bytearray(len(self))
+        self._n_unlinked = len(self)
+        for index, record in enumerate(list.__iter__(self)):
+            if hasattr(record, "dataset"):
+                if record.dataset is self._dataset:
+                    record._index = index
+                self._linked[index] = 1
+                self._n_unlinked -= 1
+
+    def __getitem__(self, item):
+        if not self._n_unlinked:
+            return list.__getitem__(self, item)
+
+        if isinstance(item, slice):
+            return [
+                self._link(index) for index in range(*item.indices(len(self)))
+            ]
+        return self._link(self._normalize_index(item))
+
+    def __iter__(self):
+        if not self._n_unlinked:
+            return list.__iter__(self)
+        return self._iter_and_link()
+
+    def _iter_and_link(self):
+        index = 0
+        while index < len(self):
+            yield self._link(index)
+            index += 1
+
+    def __reversed__(self):
+        if not self._n_unlinked:
+            return list.__reversed__(self)
+        return (self._link(index) for index in range(len(self) - 1, -1, -1))
+
+    def copy(self) -> List[T]:
+        self._link_all()
+        return list.copy(self)
+
+    __copy__ = copy
+
+    def __add__(self, other):
+        self._link_all()
+        return list.__add__(self, other)
+
+    def __radd__(self, other):
+        self._link_all()
+        return list(other) + list.copy(self)
+
+    def __mul__(self, n):
+        self._link_all()
+        return list.__mul__(self, n)
+
+    __rmul__ = __mul__
+
+    def pop(self, index=-1) -> T:
+        index = self._normalize_index(index)
+        record = self._link(index)
+        list.pop(self, index)
+        self._detach([record])
+        if index == len(self):
+            self._linked.pop()
+        else:
+            self._reindex()
+        return record
+
+    def append(self, record: T):
+        list.append(self, record)
+        self._linked.append(0)
+        self._n_unlinked += 1
+
+    def extend(self, records: Iterable[T]):
+        size = len(self)
+        list.extend(self, records)
+        self._linked.extend(bytes(len(self) - size))
+        self._n_unlinked += len(self) - size
+
+    def __iadd__(self, records: Iterable[T]):
+        self.extend(records)
+        return self
+
+    def insert(self, index, record: T):
+        list.insert(self, index, record)
+        self._reindex()
+
+    def __setitem__(self, item, value):
+        removed = list.__getitem__(self, item)
+        list.__setitem__(self, item, value)
+        self._detach(removed if isinstance(item, slice) else [removed])
+        self._reindex()
+
+    def __delitem__(self, item):
+        removed = list.__getitem__(self, item)
+        list.__delitem__(self, item)
+        self._detach(removed if isinstance(item, slice) else [removed])
+        self._reindex()
+
+    def remove(self, record: T):
+        del self[self.index(record)]
+
+    def clear(self):
+        self._detach(list.__iter__(self))
+        list.clear(self)
+        self._reindex()
+
+    def sort(self, *, key=None, reverse=False):
+        self._link_all()
+        list.sort(self, key=key, reverse=reverse)
+        self._reindex()
+
+    def reverse(self):
+        list.reverse(self)
+        self._reindex()
+
+    def __imul__(self, n):
+        list.__imul__(self, n)
+        self._reindex()
+        return self
+
+
 @dataclass
 class Dataset(ABC, Generic[T]):
     """
@@ -1012,14 +1202,8 @@ class Dataset(ABC, Generic[T]):
         return len(self.records)
 
     def __post_init__(self):
-        for i, record in enumerate(self.records):
-            record.set_refs(
-                dataset=self,
-                prev=self.records[i - 1] if i > 0 else None,
-                next_=self.records[i + 1]
-                if i + 1 < len(self.records)
-                else None,
-            )
+        # Records are linked to this dataset lazily, on first access
+        self.records = _RecordList(self.records, dataset=self)
 
     @property
     @abstractmethod
@@ -1148,6 +1332,22 @@ class Dataset(ABC, Generic[T]):
         else:
             return iterator
 
+    def _to_arrow_columns(
+        self, *columns: "Column", **named_columns: "Column"
+    ) -> Optional[Dict[str, Any]]:
+        """Return the columns of `to_dict` as Arrow arrays, or None when the
+        columns can only be built from the records one at a time."""
+        return None
+
+    def _to_arrow_table(self, *columns: "Column", **named_columns: "Column"):
+        arrow_columns = self._to_arrow_columns(*columns, **named_columns)
+        if arrow_columns is None:
+            return None
+
+        import pyarrow as pa
+
+        return pa.table(arrow_columns)
+
     def to_dict(
         self,
         *columns: "Column",
@@ -1155,6 +1355,13 @@ class Dataset(ABC, Generic[T]):
         **named_columns: "Column",
     ) -> Dict[str, List[Any]]:
         if orient == "list":
+            arrow_columns = self._to_arrow_columns(*columns, **named_columns)
+            if arrow_columns is not None:
+                return {
+                    name: array.to_pylist()
+                    for name, array in arrow_columns.items()
+                }
+
             from ..services.transformers.data_record import get_transformer_cls
 
             transformer = get_transformer_cls(self.dataset_type)(
@@ -1215,9 +1422,11 @@ class Dataset(ABC, Generic[T]):
                     " install it using: pip install pyarrow"
                 )
 
-            table = pa.Table.from_pydict(
-                self.to_dict(*columns, **named_columns)
-            )
+            table = self._to_arrow_table(*columns, **named_columns)
+            if table is None:
+                table = pa.Table.from_pydict(
+                    self.to_dict(*columns, **named_columns)
+                )
             return table.to_pandas(types_mapper=types_mapper)
 
         elif engine == "pandas":
@@ -1229,16 +1438,24 @@ class Dataset(ABC, Generic[T]):
                     " install it using: pip install pandas"
                 )
 
+            table = self._to_arrow_table(*columns, **named_columns)
+            if table is not None:
+                return table.to_pandas()
+
             return DataFrame.from_dict(self.to_dict(*columns, **named_columns))
         elif engine == "polars":
             try:
-                from polars import from_dict
+                from polars import from_arrow, from_dict
             except ImportError:
                 raise ImportError(
                     "Seems like you don't have polars installed. Please"
                     " install it using: pip install polars"
                 )
 
+            table = self._to_arrow_table(*columns, **named_columns)
+            if table is not None:
+                return from_arrow(table)
+
             return from_dict(self.to_dict(*columns, **named_columns))
         else:
             raise KloppyParameterError(f"Engine {engine} is not valid")
@@ -1,10 +1,14 @@
 import warnings
-from dataclasses import dataclass
+from dataclasses import dataclass, field, replace
 from enum import Enum
 from math import sqrt
-from typing import Optional
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
 
 from kloppy.exceptions import KloppyError
+from kloppy.utils import add_slots
+
+if TYPE_CHECKING:
+    import numpy as np
 
 DEFAULT_PITCH_LENGTH = 105.0
 DEFAULT_PITCH_WIDTH = 68.0
@@ -50,6 +54,7 @@ class Unit(Enum):
         return value / factor_to_meter * factor_from_meter
 
 
+@add_slots
 @dataclass(frozen=True)
 class Point:
     """
@@ -73,6 +78,7 @@ class Point:
         return sqrt((self.x - other.x) ** 2 + (self.y - other.y) ** 2)
 
 
+@add_slots
 @dataclass(frozen=True)
 class Point3D(Point):
     """
@@ -161,6 +167,10 @@ class PitchDimensions:
     pitch_length: Optional[float] = None
     pitch_width: Optional[float] = None
 
+    _metric_base_transforms: Dict[tuple, "MetricBaseTransform"] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
     def convert(self, to_unit: Unit) -> "PitchDimensions":
         """Convert the pitch dimensions to another unit.
 
@@ -271,6 +281,50 @@ class PitchDimensions:
             ),
         ]
 
+    def _check_boundaries(self):
+        if (
+            self.x_dim.min is None
+            or self.x_dim.max is None
+            or self.y_dim.min is None
+            or self.y_dim.max is None
+        ):
+            raise KloppyError(
+                "The pitch boundaries need to be fully specified to convert coordinates."
+            )
+
+    def metric_base_transform(
+        self,
+        pitch_length: float = DEFAULT_PITCH_LENGTH,
+        pitch_width: float = DEFAULT_PITCH_WIDTH,
+        inverse: bool = False,
+    ) -> "MetricBaseTransform":
+        """
+        Get the transformation from this pitch dimensions to the IFAB pitch
+        dimensions, or the other way around when `inverse` is set.
+
+        The transformation is computed once for each combination of
+        `pitch_length`, `pitch_width` and `inverse` and cached on this
+        pitch dimensions.
+
+        Arguments:
+            pitch_length: The length of the IFAB pitch
+            pitch_width: The width of the IFAB pitch
+            inverse: Convert from the IFAB pitch dimensions to this pitch
+                dimensions instead
+
+        Returns:
+            See [`MetricBaseTransform`][kloppy.domain.models.pitch.MetricBaseTransform]
+        """
+        key = (pitch_length, pitch_width, inverse)
+        transform = self._metric_base_transforms.get(key)
+        if transform is None:
+            self._check_boundaries()
+            transform = MetricBaseTransform(
+                self, pitch_length, pitch_width, inverse
+            )
+            self._metric_base_transforms[key] = transform
+        return transform
+
     def to_metric_base(
         self,
         point: Point,
@@ -286,104 +340,9 @@ class PitchDimensions:
         Returns:
             The point in the IFAB pitch dimensions
         """
-        if (
-            self.x_dim.min is None
-            or self.x_dim.max is None
-            or self.y_dim.min is None
-            or self.y_dim.max is None
-        ):
-            raise KloppyError(
-                "The pitch boundaries need to be fully specified to convert coordinates."
-            )
-
-        ifab_dims = MetricPitchDimensions(
-            x_dim=Dimension(0, pitch_length),
-            y_dim=Dimension(0, pitch_width),
-            pitch_length=pitch_length,
-            pitch_width=pitch_width,
-            standardized=False,
-        )
-        x_ifab_zones = ifab_dims._transformation_zones_x(pitch_length)
-        y_ifab_zones = ifab_dims._transformation_zones_y(pitch_width)
-        x_from_zones = self._transformation_zones_x(
-            self.x_dim.max - self.x_dim.min
-        )
-        y_from_zones = self._transformation_zones_y(
-            self.y_dim.max - self.y_dim.min
-        )
-
-        def transform(v, from_zones, from_length, ifab_zones, ifab_length):
-            mirror = False
-            if v > from_zones[-1][1]:
-                v = from_length - (v - from_zones[0][0]) + from_zones[0][0]
-                mirror = True
-            # find the zone the v coordinate is in
-            try:
-                zone = next(
-                    (
-                        idx
-                        for idx, zone in enumerate(from_zones)
-                        if zone[0] <= v <= zone[1]
-                    )
-                )
-                scale = (
-                    # length of the zone in IFAB dimensions
-                    (ifab_zones[zone][1] - ifab_zones[zone][0])
-                    # length of the zone in the original dimensions
-                    / (from_zones[zone][1] - from_zones[zone][0])
-                )
-                # ifab = smallest IFAB value of the zone + (v - smallest v value of the zone) * scaling factor of the zone
-                ifab = ifab_zones[zone][0] + (v - from_zones[zone][0]) * scale
-            except StopIteration:
-                # value is outside of the pitch dimensions
-                ifab = ifab_zones[0][0] + (v - from_zones[0][0]) * (
-                    ifab_length / from_length
-                )
-            if mirror:
-                ifab = ifab_length - ifab
-            return ifab
-
-        if isinstance(point, Point3D):
-            return Point3D(
-                x=transform(
-                    point.x,
-                    x_from_zones,
-                    self.x_dim.max - self.x_dim.min,
-                    x_ifab_zones,
-                    pitch_length,
-                ),
-                y=transform(
-                    point.y,
-                    y_from_zones,
-                    self.y_dim.max - self.y_dim.min,
-                    y_ifab_zones,
-                    pitch_width,
-                ),
-                z=(
-                    point.z * 2.44 / self.goal_height
-                    if self.goal_height is not None
-                    else point.z
-                )
-                if point.z is not None
-                else None,
-            )
-        else:
-            return Point(
-                x=transform(
-                    point.x,
-                    x_from_zones,
-                    self.x_dim.max - self.x_dim.min,
-                    x_ifab_zones,
-                    pitch_length,
-                ),
-                y=transform(
-                    point.y,
-                    y_from_zones,
-                    self.y_dim.max - self.y_dim.min,
-                    y_ifab_zones,
-                    pitch_width,
-                ),
-            )
+        return self.metric_base_transform(
+            pitch_length, pitch_width
+        ).transform_point(point)
 
     def from_metric_base(
         self,
@@ -400,104 +359,57 @@ class PitchDimensions:
         Returns:
             The point in the regular pitch dimensions
         """
-        if (
-            self.x_dim.min is None
-            or self.x_dim.max is None
-            or self.y_dim.min is None
-            or self.y_dim.max is None
-        ):
-            raise KloppyError(
-                "The pitch boundaries need to be fully specified to convert coordinates."
-            )
+        return self.metric_base_transform(
+            pitch_length, pitch_width, inverse=True
+        ).transform_point(point)
 
-        ifab_dims = MetricPitchDimensions(
-            x_dim=Dimension(0, pitch_length),
-            y_dim=Dimension(0, pitch_width),
-            pitch_length=pitch_length,
-            pitch_width=pitch_width,
-            standardized=False,
-        )
-        x_ifab_zones = ifab_dims._transformation_zones_x(pitch_length)
-        y_ifab_zones = ifab_dims._transformation_zones_y(pitch_width)
-        x_to_zones = self._transformation_zones_x(
-            self.x_dim.max - self.x_dim.min
-        )
-        y_to_zones = self._transformation_zones_y(
-            self.y_dim.max - self.y_dim.min
-        )
+    def to_metric_base_array(
+        self,
+        x: "np.ndarray",
+        y: "np.ndarray",
+        z: Optional["np.ndarray"] = None,
+        pitch_length: float = DEFAULT_PITCH_LENGTH,
+        pitch_width: float = DEFAULT_PITCH_WIDTH,
+    ) -> Tuple["np.ndarray", "np.ndarray", Optional["np.ndarray"]]:
+        """
+        Convert arrays of coordinates from this pitch dimensions to the IFAB
+        pitch dimensions. This is the vectorized version of `to_metric_base`.
 
-        def transform(v, to_zones, to_length, ifab_zones, ifab_length):
-            mirror = False
-            if v > ifab_length / 2:
-                v = ifab_length - v
-                mirror = True
-            # find the zone the v coordinate is in
-            try:
-                zone = next(
-                    (
-                        idx
-                        for idx, zone in enumerate(ifab_zones)
-                        if zone[0] <= v <= zone[1]
-                    )
-                )
-                scale = (
-                    # length of the zone in the original dimensions
-                    (to_zones[zone][1] - to_zones[zone][0])
-                    # length of the zone in IFAB dimensions
-                    / (ifab_zones[zone][1] - ifab_zones[zone][0])
-                )
-                # ifab = smallest IFAB value of the zone + (v - smallest v value of the zone) * scaling factor of the zone
-                v = to_zones[zone][0] + (v - ifab_zones[zone][0]) * scale
-            except StopIteration:
-                # value is outside of the pitch dimensions
-                v = to_zones[0][0] + (v - ifab_zones[0][0]) * (
-                    to_length / ifab_length
-                )
-            if mirror:
-                v = (to_length + to_zones[0][0] - v) + to_zones[0][0]
-            return v
+        Arguments:
+            x: The x coordinates to convert
+            y: The y coordinates to convert
+            z: The z coordinates to convert (optional)
 
-        if isinstance(point, Point3D):
-            return Point3D(
-                x=transform(
-                    point.x,
-                    x_to_zones,
-                    self.x_dim.max - self.x_dim.min,
-                    x_ifab_zones,
-                    pitch_length,
-                ),
-                y=transform(
-                    point.y,
-                    y_to_zones,
-                    self.y_dim.max - self.y_dim.min,
-                    y_ifab_zones,
-                    pitch_width,
-                ),
-                z=(
-                    point.z * self.goal_height / 2.44
-                    if self.goal_height is not None
-                    else point.z
-                )
-                if point.z is not None
-                else None,
-            )
-        else:
-            return Point(
-                x=transform(
-                    point.x,
-                    x_to_zones,
-                    self.x_dim.max - self.x_dim.min,
-                    x_ifab_zones,
-                    pitch_length,
-                ),
-                y=transform(
-                    point.y,
-                    y_to_zones,
-                    self.y_dim.max - self.y_dim.min,
-                    y_ifab_zones,
-                    pitch_width,
-                ),
-            )
+        Returns:
+            The `x`, `y` and `z` coordinates in the IFAB pitch dimensions
+        """
+        return self.metric_base_transform(
+            pitch_length, pitch_width
+        ).transform_array(x, y, z)
+
+    def from_metric_base_array(
+        self,
+        x: "np.ndarray",
+        y: "np.ndarray",
+        z: Optional["np.ndarray"] = None,
+        pitch_length: float = DEFAULT_PITCH_LENGTH,
+        pitch_width: float = DEFAULT_PITCH_WIDTH,
+    ) -> Tuple["np.ndarray", "np.ndarray", Optional["np.ndarray"]]:
+        """
+        Convert arrays of coordinates from the IFAB pitch dimensions to this
+        pitch dimensions. This is the vectorized version of `from_metric_base`.
+
+        Arguments:
+            x: The x coordinates to convert
+            y: The y coordinates to convert
+            z: The z coordinates to convert (optional)
+
+        Returns:
+            The `x`, `y` and `z` coordinates in this pitch dimensions
+        """
+        return self.metric_base_transform(
+            pitch_length, pitch_width, inverse=True
+        ).transform_array(x, y, z)
 
     def distance_between(
         self, point1: Point, point2: Point, unit: Unit = Unit.METERS
@@ -525,12 +437,286 @@ class PitchDimensions:
         else:
             pitch_length = self.pitch_length
             pitch_width = self.pitch_width
-        point1_ifab = self.to_metric_base(point1, pitch_length, pitch_width)
-        point2_ifab = self.to_metric_base(point2, pitch_length, pitch_width)
+        transform = self.metric_base_transform(pitch_length, pitch_width)
+        point1_ifab = transform.transform_point(point1)
+        point2_ifab = transform.transform_point(point2)
         dist = point1_ifab.distance_to(point2_ifab)
         return Unit.METERS.convert(unit, dist)
 
 
+class _ZoneMapping:
+    """Maps values between the zones of two pitches along a single axis.
+
+    Values in the second half of the pitch are mirrored to the first half
+    before they are mapped and mirrored back afterwards. Values outside of
+    the pitch are scaled linearly.
+    """
+
+    __slots__ = (
+        "from_start",
+        "from_length",
+        "to_start",
+        "to_length",
+        "mirror_from",
+        "outside_scale",
+        "zones",
+    )
+
+    def __init__(
+        self,
+        from_zones: List[Tuple[float, float]],
+        from_length: float,
+        to_zones: List[Tuple[float, float]],
+        to_length: float,
+    ):
+        self.from_start = from_zones[0][0]
+        self.from_length = from_length
+        self.to_start = to_zones[0][0]
+        self.to_length = to_length
+        self.mirror_from = from_zones[-1][1]
+        self.outside_scale = to_length / from_length
+        # (start, end, start in the target pitch, scaling factor) per zone
+        self.zones = tuple(
+            (
+                from_min,
+                from_max,
+                to_min,
+                (to_max - to_min) / (from_max - from_min),
+            )
+            for (from_min, from_max), (to_min, to_max) in zip(
+                from_zones, to_zones
+            )
+            if from_max != from_min
+        )
+
+    def transform(self, v: float) -> float:
+        mirror = False
+        if v > self.mirror_from:
+            v = self.from_length - (v - self.from_start) + self.from_start
+            mirror = True
+
+        for from_min, from_max, to_min, scale in self.zones:
+            if from_min <= v <= from_max:
+                v = to_min + (v - from_min) * scale
+                break
+        else:
+            # value is outside of the pitch dimensions
+            v = self.to_start + (v - self.from_start) * self.outside_scale
+
+        if mirror:
+            v = (self.to_length + self.to_start - v) + self.to_start
+        return v
+
+    def transform_array(self, v: "np.ndarray") -> "np.ndarray":
+        import numpy as np
+
+        mirror = v > self.mirror_from
+        v = np.where(
+            mirror,
+            self.from_length - (v - self.from_start) + self.from_start,
+            v,
+        )
+
+        # value is outside of the pitch dimensions
+        result = self.to_start + (v - self.from_start) * self.outside_scale
+        # walk the zones backwards, so a value on the boundary of two zones
+        # ends up in the first one
+        for from_min, from_max, to_min, scale in reversed(self.zones):
+            result = np.where(
+                (from_min <= v) & (v <= from_max),
+                to_min + (v - from_min) * scale,
+                result,
+            )
+
+        return np.where(
+            mirror,
+            (self.to_length + self.to_start - result) + self.to_start,
+            result,
+        )
+
+
+class MetricBaseTransform:
+    """
+    Precomputed conversion of coordinates between a
+    [`PitchDimensions`][kloppy.domain.models.pitch.PitchDimensions] and the
+    IFAB pitch dimensions.
+
+    The zones of both pitches and the scaling factors between them are
+    computed once, so converting a point only has to look up its zone. Use
+    [`PitchDimensions.metric_base_transform`][kloppy.domain.models.pitch.PitchDimensions.metric_base_transform]
+    to get a cached instance.
+
+    Attributes:
+        pitch_dimensions: The pitch dimensions coordinates are converted from
+            (or to, when `inverse` is set)
+        pitch_length: The length of the IFAB pitch
+        pitch_width: The width of the IFAB pitch
+        inverse: Whether coordinates are converted from the IFAB pitch
+            dimensions to `pitch_dimensions`
+    """
+
+    def __init__(
+        self,
+        pitch_dimensions: PitchDimensions,
+        pitch_length: float,
+        pitch_width: float,
+        inverse: bool = False,
+    ):
+        self.pitch_dimensions = pitch_dimensions
+        self.pitch_length = pitch_length
+        self.pitch_width = pitch_width
+        self.inverse = inverse
+
+        ifab_dims = MetricPitchDimensions(
+            x_dim=Dimension(0, pitch_length),
+            y_dim=Dimension(0, pitch_width),
+            pitch_length=pitch_length,
+            pitch_width=pitch_width,
+            standardized=False,
+        )
+        length = pitch_dimensions.x_dim.max - pitch_dimensions.x_dim.min
+        width = pitch_dimensions.y_dim.max - pitch_dimensions.y_dim.min
+        x_zones = (
+            pitch_dimensions._transformation_zones_x(length),
+            length,
+        )
+        y_zones = (
+            pitch_dimensions._transformation_zones_y(width),
+            width,
+        )
+        x_ifab_zones = (
+            ifab_dims._transformation_zones_x(pitch_length),
+            pitch_length,
+        )
+        y_ifab_zones = (
+            ifab_dims._transformation_zones_y(pitch_width),
+            pitch_width,
+        )
+
+        if inverse:
+            self._x = _ZoneMapping(*x_ifab_zones, *x_zones)
+            self._y = _ZoneMapping(*y_ifab_zones, *y_zones)
+            self._z_scale = (pitch_dimensions.goal_height, 2.44)
+        else:
+            self._x = _ZoneMapping(*x_zones, *x_ifab_zones)
+            self._y = _ZoneMapping(*y_zones, *y_ifab_zones)
+            self._z_scale = (2.44, pitch_dimensions.goal_height)
+        if pitch_dimensions.goal_height is None:
+            self._z_scale = None
+
+    def transform_point(self, point: Point) -> Point:
+        """
+        Convert a single point.
+
+        Arguments:
+            point: The point to convert
+
+        Returns:
+            The converted point
+        """
+        x = self._x.transform(point.x)
+        y = self._y.transform(point.y)
+        if isinstance(point, Point3D):
+            z = point.z
+            if z is not None and self._z_scale is not None:
+                z = z * self._z_scale[0] / self._z_scale[1]
+            return Point3D(x=x, y=y, z=z)
+        return Point(x=x, y=y)
+
+    def transform_array(
+        self,
+        x: "np.ndarray",
+        y: "np.ndarray",
+        z: Optional["np.ndarray"] = None,
+    ) -> Tuple["np.ndarray", "np.ndarray", Optional["np.ndarray"]]:
+        """
+        Convert arrays of coordinates. Missing values should be `NaN`.
+
+        Arguments:
+            x: The x coordinates to convert
+            y: The y coordinates to convert
+            z: The z coordinates to convert (optional)
+
+        Returns:
+            The converted `x`, `y` and `z` coordinates
+        """
+        x = self._x.transform_array(x)
+        y = self._y.transform_array(y)
+        if z is not None and self._z_scale is not None:
+            z = z * self._z_scale[0] / self._z_scale[1]
+        return x, y, z
+
+
+class CoordinateTransformPlan:
+    """
+    Precomputed conversion of coordinates from one
+    [`PitchDimensions`][kloppy.domain.models.pitch.PitchDimensions] to another,
+    via the IFAB pitch dimensions.
+
+    Arguments:
+        from_pitch_dimensions: The pitch dimensions to convert from
+        to_pitch_dimensions: The pitch dimensions to convert to
+        pitch_length: The length of the IFAB pitch used in between
+        pitch_width: The width of the IFAB pitch used in between
+        flip_y: Mirror the y coordinates on the IFAB pitch, to switch the
+            vertical orientation
+    """
+
+    def __init__(
+        self,
+        from_pitch_dimensions: PitchDimensions,
+        to_pitch_dimensions: PitchDimensions,
+        pitch_length: float = DEFAULT_PITCH_LENGTH,
+        pitch_width: float = DEFAULT_PITCH_WIDTH,
+        flip_y: bool = False,
+    ):
+        self.pitch_width = pitch_width
+        self.flip_y = flip_y
+        self._to_base = from_pitch_dimensions.metric_base_transform(
+            pitch_length, pitch_width
+        )
+        self._from_base = to_pitch_dimensions.metric_base_transform(
+            pitch_length, pitch_width, inverse=True
+        )
+
+    def transform_point(self, point: Point) -> Point:
+        """
+        Convert a single point.
+
+        Arguments:
+            point: The point to convert
+
+        Returns:
+            The converted point
+        """
+        point = self._to_base.transform_point(point)
+        if self.flip_y:
+            point = replace(point, y=self.pitch_width - point.y)
+        return self._from_base.transform_point(point)
+
+    def transform_array(
+        self,
+        x: "np.ndarray",
+        y: "np.ndarray",
+        z: Optional["np.ndarray"] = None,
+    ) -> Tuple["np.ndarray", "np.ndarray", Optional["np.ndarray"]]:
+        """
+        Convert arrays of coordinates. Missing values should be `NaN`.
+
+        Arguments:
+            x: The x coordinates to convert
+            y: The y coordinates to convert
+            z: The z coordinates to convert (optional)
+
+        Returns:
+            The converted `x`, `y` and `z` coordinates
+        """
+        x, y, z = self._to_base.transform_array(x, y, z)
+        if self.flip_y:
+            y = self.pitch_width - y
+        return self._from_base.transform_array(x, y, z)
+
+
 @dataclass
 class MetricPitchDimensions(PitchDimensions):
     """The standard pitch dimensions in meters by IFAB regulations.
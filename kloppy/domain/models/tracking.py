@@ -1,23 +1,78 @@
-from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Callable, Union, Any
+from copy import copy
+from dataclasses import dataclass, replace
+from datetime import timedelta
+from fnmatch import fnmatch
+from typing import (
+    List,
+    Dict,
+    Optional,
+    Callable,
+    Union,
+    Any,
+    Iterable,
+    Iterator,
+    Mapping,
+    Sequence,
+)
 
 from kloppy.domain.models.common import DatasetType
 
-from .common import Dataset, DataRecord, Player
+from .common import (
+    Dataset,
+    DataRecord,
+    Metadata,
+    Player,
+    Period,
+    Team,
+    BallState,
+)
 from .pitch import Point, Point3D
 from kloppy.utils import (
+    add_slots,
     deprecated,
 )
 
 
+class _EmptyMapping(Mapping):
+    """Immutable empty mapping that pickles and copies as a single shared
+    instance."""
+
+    __slots__ = ()
+
+    def __getitem__(self, key):
+        raise KeyError(key)
+
+    def __iter__(self):
+        return iter(())
+
+    def __len__(self):
+        return 0
+
+    def __hash__(self):
+        return 0
+
+    def __repr__(self):
+        return "{}"
+
+    def __reduce__(self):
+        return "_EMPTY_OTHER_DATA"
+
+
+# Shared by all PlayerData instances without other data, so we don't
+# allocate an empty dict for every player in every frame.
+_EMPTY_OTHER_DATA: Mapping[str, Any] = _EmptyMapping()
+
+
+@add_slots
 @dataclass
 class PlayerData:
     coordinates: Point
     distance: Optional[float] = None
     speed: Optional[float] = None
-    other_data: Dict[str, Any] = field(default_factory=dict)
+    other_data: Mapping[str, Any] = _EMPTY_OTHER_DATA
 
 
+@add_slots
 @dataclass(repr=False)
 class Frame(DataRecord):
     frame_id: int
@@ -38,12 +93,646 @@ class Frame(DataRecord):
         }
 
 
+def _import_numpy():
+    try:
+        import numpy as np
+    except ImportError:
+        raise ImportError(
+            "Seems like you don't have numpy installed. Please"
+            " install it using: pip install numpy"
+        )
+    return np
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow as pa
+    except ImportError:
+        raise ImportError(
+            "Seems like you don't have pyarrow installed. Please"
+            " install it using: pip install pyarrow"
+        )
+    return pa
+
+
+def _to_float(value: Optional[float]) -> float:
+    if value is None:
+        return float("nan")
+    if isinstance(value, (list, tuple)) and len(value) == 1:
+        # Some feeds (e.g. SecondSpectrum) wrap scalar values in a list
+        return value[0]
+    return value
+
+
+def _from_float(value: float) -> Optional[float]:
+    return None if value != value else float(value)
+
+
+class ColumnarFrames(Sequence):
+    """
+    Frames of a [`TrackingDataset`][kloppy.domain.models.tracking.TrackingDataset]
+    stored column-wise in NumPy arrays.
+
+    Instead of keeping a `Frame` object per record, the positions of all
+    players are kept in a single `(n_frames, n_players, 2)` array and the
+    ball, period, ball state and ball owning team in per-frame arrays. A
+    `Frame` is only built when it is accessed, so `dataset.frames[i]` and
+    iterating over a dataset keep working.
+
+    Missing speeds and distances are stored as `NaN` and returned as `None`,
+    missing player coordinates are returned as a `Point` of `NaN` values.
+    Timestamps are stored as microseconds.
+
+    Attributes:
+        frame_id: `(n_frames,)` array of frame ids
+        timestamp: `(n_frames,)` array of timestamps in microseconds
+        period_index: `(n_frames,)` index into `periods` (-1 when not set)
+        ball_state: `(n_frames,)` index into `[ALIVE, DEAD]` (-1 when not set)
+        ball_owning_team: `(n_frames,)` index into `teams` (-1 when not set)
+        ball_coordinates: `(n_frames, 3)` array of ball coordinates
+        ball_mask: `(n_frames,)` array marking the frames with ball coordinates
+        ball_speed: `(n_frames,)` array of ball speeds
+        player_coordinates: `(n_frames, n_players, 2)` array of player coordinates
+        player_speed: `(n_frames, n_players)` array of player speeds
+        player_distance: `(n_frames, n_players)` array of player distances
+        player_mask: `(n_frames, n_players)` array marking the players that
+            are part of a frame
+        periods: The periods referred to by `period_index`
+        teams: The teams referred to by `ball_owning_team`
+        players: The players, in the order of the player axis
+    """
+
+    _ball_states = [BallState.ALIVE, BallState.DEAD]
+
+    def __init__(
+        self,
+        periods: Optional[Union[List[Period], Dict[int, Period]]] = None,
+        teams: Optional[List[Team]] = None,
+        players: Optional[List[Player]] = None,
+        capacity: int = 1024,
+    ):
+        np = _import_numpy()
+
+        if isinstance(periods, dict):
+            # Some deserializers keep the periods by id
+            periods = list(periods.values())
+
+        self.periods = list(periods or [])
+        self.teams = list(teams or [])
+        self.players = list(players or [])
+
+        self._period_idx = {
+            period.id: i for i, period in enumerate(self.periods)
+        }
+        self._team_idx = {team: i for i, team in enumerate(self.teams)}
+        self._player_idx = {player: i for i, player in enumerate(self.players)}
+
+        self._size = 0
+        self._ball_3d = None
+        self._frame_other_data: List[Optional[Dict[str, Any]]] = []
+        self._player_other_data: List[Optional[Dict[int, Dict]]] = []
+        self._dataset = None
+
+        capacity = max(capacity, 1)
+        n_players = max(len(self.players), 1)
+        self._frame_id = np.zeros(capacity, dtype=np.int64)
+        self._timestamp = np.zeros(capacity, dtype=np.int64)
+        self._period_index = np.full(capacity, -1, dtype=np.int16)
+        self._ball_state = np.full(capacity, -1, dtype=np.int8)
+        self._ball_owning_team = np.full(capacity, -1, dtype=np.int8)
+        self._ball_coordinates = np.full((capacity, 3), np.nan)
+        self._ball_mask = np.zeros(capacity, dtype=bool)
+        self._ball_speed = np.full(capacity, np.nan)
+        self._player_coordinates = np.full((capacity, n_players, 2), np.nan)
+        self._player_speed = np.full((capacity, n_players), np.nan)
+        self._player_distance = np.full((capacity, n_players), np.nan)
+        self._player_mask = np.zeros((capacity, n_players), dtype=bool)
+
+    @classmethod
+    def from_frames(
+        cls,
+        frames: Iterable[Frame],
+        periods: Optional[Union[List[Period], Dict[int, Period]]] = None,
+        teams: Optional[List[Team]] = None,
+    ) -> "ColumnarFrames":
+        """Build the columnar storage from an iterable of frames.
+
+        The frames are consumed one at a time, so passing a generator keeps
+        only a single `Frame` object in memory.
+        """
+        capacity = len(frames) if isinstance(frames, Sequence) else 1024
+        container = cls(periods=periods, teams=teams, capacity=capacity)
+        container.extend(frames)
+        return container
+
+    @classmethod
+    def from_arrays(
+        cls,
+        frame_id,
+        timestamp,
+        period_index,
+        ball_state,
+        ball_owning_team,
+        ball_coordinates,
+        ball_mask,
+        ball_speed,
+        player_coordinates,
+        player_speed,
+        player_distance,
+        player_mask,
+        periods: List[Period],
+        teams: List[Team],
+        players: List[Player],
+        ball_3d: Optional[bool] = None,
+        frame_other_data: Optional[List[Optional[Dict[str, Any]]]] = None,
+        player_other_data: Optional[List[Optional[Dict[int, Dict]]]] = None,
+    ) -> "ColumnarFrames":
+        """Build the storage around existing columns, without copying them.
+
+        The columns have the layout of the attributes of this class. They
+        may be read-only (like memory mapped arrays), as the columns are
+        only written to after they are reallocated to append frames.
+        """
+        container = cls(
+            periods=periods, teams=teams, players=players, capacity=1
+        )
+
+        n_frames = len(frame_id)
+        container._size = n_frames
+        container._ball_3d = ball_3d
+        container._frame_other_data = (
+            list(frame_other_data)
+            if frame_other_data is not None
+            else [None] * n_frames
+        )
+        container._player_other_data = (
+            list(player_other_data)
+            if player_other_data is not None
+            else [None] * n_frames
+        )
+
+        container._frame_id = frame_id
+        container._timestamp = timestamp
+        container._period_index = period_index
+        container._ball_state = ball_state
+        container._ball_owning_team = ball_owning_team
+        container._ball_coordinates = ball_coordinates
+        container._ball_mask = ball_mask
+        container._ball_speed = ball_speed
+        container._player_coordinates = player_coordinates
+        container._player_speed = player_speed
+        container._player_distance = player_distance
+        container._player_mask = player_mask
+        return container
+
+    def _grow(self, capacity: int, n_players: int):
+        np = _import_numpy()
+
+        def _resize(array, shape, fill_value):
+            new_array = np.full(shape, fill_value, dtype=array.dtype)
+            new_array[tuple(slice(0, dim) for dim in array.shape)] = array
+            return new_array
+
+        self._frame_id = _resize(self._frame_id, (capacity,), 0)
+        self._timestamp = _resize(self._timestamp, (capacity,), 0)
+        self._period_index = _resize(self._period_index, (capacity,), -1)
+        self._ball_state = _resize(self._ball_state, (capacity,), -1)
+        self._ball_owning_team = _resize(
+            self._ball_owning_team, (capacity,), -1
+        )
+        self._ball_coordinates = _resize(
+            self._ball_coordinates, (capacity, 3), np.nan
+        )
+        self._ball_mask = _resize(self._ball_mask, (capacity,), False)
+        self._ball_speed = _resize(self._ball_speed, (capacity,), np.nan)
+        self._player_coordinates = _resize(
+            self._player_coordinates, (capacity, n_players, 2), np.nan
+        )
+        self._player_speed = _resize(
+            self._player_speed, (capacity, n_players), np.nan
+        )
+        self._player_distance = _resize(
+            self._player_distance, (capacity, n_players), np.nan
+        )
+        self._player_mask = _resize(
+            self._player_mask, (capacity, n_players), False
+        )
+
+    def _get_period_index(self, period: Optional[Period]) -> int:
+        if period is None:
+            return -1
+        if period.id not in self._period_idx:
+            self._period_idx[period.id] = len(self.periods)
+            self.periods.append(period)
+        return self._period_idx[period.id]
+
+    def _get_team_index(self, team: Optional[Team]) -> int:
+        if team is None:
+            return -1
+        if team not in self._team_idx:
+            self._team_idx[team] = len(self.teams)
+            self.teams.append(team)
+        return self._team_idx[team]
+
+    def _get_player_index(self, player: Player) -> int:
+        if player not in self._player_idx:
+            self._player_idx[player] = len(self.players)
+            self.players.append(player)
+        return self._player_idx[player]
+
+    def append(self, frame: Frame):
+        """Copy the values of `frame` into the columns."""
+        player_indices = [
+            self._get_player_index(player) for player in frame.players_data
+        ]
+
+        capacity, n_players = self._player_mask.shape
+        if self._size >= capacity or len(self.players) > n_players:
+            self._grow(
+                max(capacity * 2, 1) if self._size >= capacity else capacity,
+                max(len(self.players), n_players * 2)
+                if len(self.players) > n_players
+                else n_players,
+            )
+
+        i = self._size
+        self._frame_id[i] = frame.frame_id
+        self._timestamp[i] = (
+            frame.timestamp // timedelta(microseconds=1)
+            if isinstance(frame.timestamp, timedelta)
+            else round(frame.timestamp * 1_000_000)
+        )
+        self._period_index[i] = self._get_period_index(frame.period)
+        self._ball_state[i] = (
+            self._ball_states.index(frame.ball_state)
+            if frame.ball_state is not None
+            else -1
+        )
+        self._ball_owning_team[i] = self._get_team_index(
+            frame.ball_owning_team
+        )
+
+        ball_coordinates = frame.ball_coordinates
+        if ball_coordinates is not None:
+            if self._ball_3d is None:
+                self._ball_3d = isinstance(ball_coordinates, Point3D)
+            self._ball_mask[i] = True
+            self._ball_coordinates[i] = (
+                ball_coordinates.x,
+                ball_coordinates.y,
+                _to_float(getattr(ball_coordinates, "z", None)),
+            )
+        self._ball_speed[i] = _to_float(frame.ball_speed)
+
+        player_other_data = None
+        for j, player_data in zip(player_indices, frame.players_data.values()):
+            self._player_mask[i, j] = True
+            if player_data.coordinates is not None:
+                self._player_coordinates[i, j] = (
+                    player_data.coordinates.x,
+                    player_data.coordinates.y,
+                )
+            self._player_speed[i, j] = _to_float(player_data.speed)
+            self._player_distance[i, j] = _to_float(player_data.distance)
+            if player_data.other_data:
+                if player_other_data is None:
+                    player_other_data = {}
+                player_other_data[j] = player_data.other_data
+
+        self._frame_other_data.append(frame.other_data or None)
+        self._player_other_data.append(player_other_data)
+        self._size += 1
+
+    def extend(self, frames: Iterable[Frame]):
+        for frame in frames:
+            self.append(frame)
+
+    def bind(self, dataset: "TrackingDataset"):
+        """Set the dataset the materialized frames refer to."""
+        if self._dataset is None:
+            self._dataset = dataset
+
+    def replace_coordinates(
+        self, ball_coordinates=None, player_coordinates=None
+    ) -> "ColumnarFrames":
+        """Return a copy of the storage with other ball and/or player
+        coordinates.
+
+        All other columns are shared with this storage. The copy is not bound
+        to a dataset yet.
+        """
+        frames = copy(self)
+        frames.periods = list(self.periods)
+        frames.teams = list(self.teams)
+        frames.players = list(self.players)
+        frames._period_idx = dict(self._period_idx)
+        frames._team_idx = dict(self._team_idx)
+        frames._player_idx = dict(self._player_idx)
+        frames._frame_other_data = list(self._frame_other_data)
+        frames._player_other_data = list(self._player_other_data)
+        frames._dataset = None
+
+        # Trim the columns, so appending to the copy reallocates them
+        # instead of writing into the arrays of this storage
+        frames._frame_id = self.frame_id
+        frames._timestamp = self.timestamp
+        frames._period_index = self.period_index
+        frames._ball_state = self.ball_state
+        frames._ball_owning_team = self.ball_owning_team
+        frames._ball_coordinates = (
+            ball_coordinates
+            if ball_coordinates is not None
+            else self.ball_coordinates
+        )
+        frames._ball_mask = self.ball_mask
+        frames._ball_speed = self.ball_speed
+        frames._player_coordinates = (
+            player_coordinates
+            if player_coordinates is not None
+            else self.player_coordinates
+        )
+        frames._player_speed = self.player_speed
+        frames._player_distance = self.player_distance
+        frames._player_mask = self.player_mask
+        return frames
+
+    @property
+    def frame_id(self):
+        return self._frame_id[: self._size]
+
+    @property
+    def timestamp(self):
+        return self._timestamp[: self._size]
+
+    @property
+    def period_index(self):
+        return self._period_index[: self._size]
+
+    @property
+    def ball_state(self):
+        return self._ball_state[: self._size]
+
+    @property
+    def ball_owning_team(self):
+        return self._ball_owning_team[: self._size]
+
+    @property
+    def ball_coordinates(self):
+        return self._ball_coordinates[: self._size]
+
+    @property
+    def ball_mask(self):
+        return self._ball_mask[: self._size]
+
+    @property
+    def ball_speed(self):
+        return self._ball_speed[: self._size]
+
+    @property
+    def player_coordinates(self):
+        return self._player_coordinates[: self._size, : len(self.players)]
+
+    @property
+    def player_speed(self):
+        return self._player_speed[: self._size, : len(self.players)]
+
+    @property
+    def player_distance(self):
+        return self._player_distance[: self._size, : len(self.players)]
+
+    @property
+    def player_mask(self):
+        return self._player_mask[: self._size, : len(self.players)]
+
+    def to_arrow_columns(self) -> Dict[str, Any]:
+        """Return the columns of `TrackingDataset.to_dict` as Arrow arrays.
+
+        The arrays are filled from the columns directly, without building
+        the frames. Timestamps are durations, and the ball state and ball
+        owning team are dictionary encoded. The values that are `None` in
+        the frames (like missing speeds, or the coordinates of players that
+        are not part of a frame) are null.
+
+        Raises `ValueError` when the other data can't be converted to Arrow
+        arrays.
+        """
+        np = _import_numpy()
+        pa = _import_pyarrow()
+
+        n_frames = self._size
+        n_players = len(self.players)
+
+        def _dictionary(indices, values: List[Any]):
+            return pa.DictionaryArray.from_arrays(
+                pa.array(indices, mask=indices < 0),
+                pa.array(values) if values else pa.array([], pa.string()),
+            )
+
+        def _float(values, mask=None):
+            mask = np.isnan(values) if mask is None else mask
+            return pa.array(values, mask=mask)
+
+        def _other_data(values: List[Any]):
+            try:
+                return pa.array(values)
+            except (pa.ArrowException, TypeError) as e:
+                raise ValueError(f"Other data can't be converted: {e}")
+
+        period_ids = np.array(
+            [period.id for period in self.periods] or [0], dtype=np.int64
+        )
+        period_index = self.period_index
+        ball_coordinates = self.ball_coordinates.T
+        no_ball = ~self.ball_mask
+
+        columns = {
+            "period_id": pa.array(
+                period_ids[np.maximum(period_index, 0)],
+                mask=period_index < 0,
+            ),
+            "timestamp": pa.array(self.timestamp).view(pa.duration("us")),
+            "frame_id": pa.array(self.frame_id),
+            "ball_state": _dictionary(
+                self.ball_state,
+                [ball_state.value for ball_state in self._ball_states],
+            ),
+            "ball_owning_team_id": _dictionary(
+                self.ball_owning_team, [team.team_id for team in self.teams]
+            ),
+            "ball_x": _float(ball_coordinates[0], no_ball),
+            "ball_y": _float(ball_coordinates[1], no_ball),
+            "ball_z": _float(ball_coordinates[2])
+            if self._ball_3d
+            else pa.nulls(n_frames, pa.float64()),
+            "ball_speed": _float(self.ball_speed),
+        }
+
+        # Player-major copies, so the values of a player are contiguous
+        player_coordinates = np.ascontiguousarray(
+            self.player_coordinates.transpose(1, 2, 0)
+        )
+        player_speed = np.ascontiguousarray(self.player_speed.T)
+        player_distance = np.ascontiguousarray(self.player_distance.T)
+        player_mask = np.ascontiguousarray(self.player_mask.T)
+
+        player_other_data = self._player_other_data[:n_frames]
+        for j in range(n_players):
+            present = player_mask[j]
+            if not present.any():
+                continue
+
+            absent = ~present
+            player_id = self.players[j].player_id
+            columns[f"{player_id}_x"] = _float(
+                player_coordinates[j, 0], absent
+            )
+            columns[f"{player_id}_y"] = _float(
+                player_coordinates[j, 1], absent
+            )
+            columns[f"{player_id}_d"] = _float(
+                player_distance[j], absent | np.isnan(player_distance[j])
+            )
+            columns[f"{player_id}_s"] = _float(
+                player_speed[j], absent | np.isnan(player_speed[j])
+            )
+
+            other_data = [
+                other_data.get(j) if other_data else None
+                for other_data in player_other_data
+            ]
+            names = dict.fromkeys(
+                name for values in other_data if values for name in values
+            )
+            for name in names:
+                columns[f"{player_id}_{name}"] = _other_data(
+                    [
+                        values.get(name) if values else None
+                        for values in other_data
+                    ]
+                )
+
+        frame_other_data = self._frame_other_data[:n_frames]
+        names = dict.fromkeys(
+            name
+            for other_data in frame_other_data
+            if other_data
+            for name in other_data
+        )
+        for name in names:
+            columns[name] = _other_data(
+                [
+                    other_data.get(name) if other_data else None
+                    for other_data in frame_other_data
+                ]
+            )
+
+        return columns
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return [
+                self._get_frame(i) for i in range(*item.indices(len(self)))
+            ]
+
+        if item < 0:
+            item += self._size
+        if not 0 <= item < self._size:
+            raise IndexError("frame index out of range")
+        return self._get_frame(item)
+
+    def __iter__(self):
+        for i in range(self._size):
+            yield self._get_frame(i)
+
+    def _get_frame(self, i: int) -> Frame:
+        period_index = self._period_index[i]
+        ball_state = self._ball_state[i]
+        ball_owning_team = self._ball_owning_team[i]
+
+        ball_x, ball_y, ball_z = self._ball_coordinates[i].tolist()
+        if not self._ball_mask[i]:
+            ball_coordinates = None
+        elif self._ball_3d:
+            ball_coordinates = Point3D(
+                x=ball_x, y=ball_y, z=_from_float(ball_z)
+            )
+        else:
+            ball_coordinates = Point(x=ball_x, y=ball_y)
+
+        player_other_data = self._player_other_data[i] or {}
+        players_data = {}
+        mask = self._player_mask[i]
+        coordinates = self._player_coordinates[i]
+        speed = self._player_speed[i]
+        distance = self._player_distance[i]
+        for j in mask[: len(self.players)].nonzero()[0].tolist():
+            x, y = coordinates[j].tolist()
+            players_data[self.players[j]] = PlayerData(
+                coordinates=Point(x=x, y=y),
+                speed=_from_float(speed[j]),
+                distance=_from_float(distance[j]),
+                other_data=player_other_data.get(j, _EMPTY_OTHER_DATA),
+            )
+
+        frame = Frame(
+            frame_id=int(self._frame_id[i]),
+            timestamp=timedelta(microseconds=int(self._timestamp[i])),
+            ball_owning_team=self.teams[ball_owning_team]
+            if ball_owning_team >= 0
+            else None,
+            ball_state=self._ball_states[ball_state]
+            if ball_state >= 0
+            else None,
+            period=self.periods[period_index] if period_index >= 0 else None,
+            players_data=players_data,
+            other_data=self._frame_other_data[i] or {},
+            ball_coordinates=ball_coordinates,
+            ball_speed=_from_float(self._ball_speed[i]),
+        )
+        if self._dataset is not None:
+            frame.set_refs(self._dataset, i)
+        return frame
+
+    def __getstate__(self):
+        # Only pickle the used part of the columns
+        state = dict(self.__dict__)
+        for name in (
+            "frame_id",
+            "timestamp",
+            "period_index",
+            "ball_state",
+            "ball_owning_team",
+            "ball_coordinates",
+            "ball_mask",
+            "ball_speed",
+            "player_coordinates",
+            "player_speed",
+            "player_distance",
+            "player_mask",
+        ):
+            state[f"_{name}"] = getattr(self, name)
+        return state
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} frame_count={self._size} player_count={len(self.players)}>"
+
+
 @dataclass
 class TrackingDataset(Dataset[Frame]):
-    records: List[Frame]
+    records: Union[List[Frame], ColumnarFrames]
 
     dataset_type: DatasetType = DatasetType.TRACKING
 
+    def __post_init__(self):
+        if isinstance(self.records, ColumnarFrames):
+            # Frames are built on access and linked to this dataset then
+            self.records.bind(self)
+        else:
+            super().__post_init__()
+
     @property
     def frames(self):
         return self.records
@@ -52,6 +741,67 @@ class TrackingDataset(Dataset[Frame]):
     def frame_rate(self):
         return self.metadata.frame_rate
 
+    @property
+    def is_columnar(self) -> bool:
+        return isinstance(self.records, ColumnarFrames)
+
+    def _to_arrow_columns(
+        self, *columns: Union[str, Callable], **named_columns: Any
+    ) -> Optional[Dict[str, Any]]:
+        # Only the default columns of columnar frames, or a selection of
+        # them by name or pattern, are exported column-wise
+        if (
+            not self.is_columnar
+            or named_columns
+            or any(callable(column) for column in columns)
+        ):
+            return None
+
+        try:
+            default_columns = self.records.to_arrow_columns()
+        except (ImportError, ValueError):
+            return None
+
+        if not columns:
+            return default_columns
+
+        selected_columns = {}
+        for column in columns:
+            if column == "*":
+                selected_columns.update(default_columns)
+            elif "*" in column:
+                selected_columns.update(
+                    {
+                        name: array
+                        for name, array in default_columns.items()
+                        if fnmatch(name, column)
+                    }
+                )
+            elif column in default_columns:
+                selected_columns[column] = default_columns[column]
+            else:
+                # An attribute of the frames
+                return None
+        return selected_columns
+
+    def to_columnar(self) -> "TrackingDataset":
+        """
+        Return a copy of this dataset that keeps its frames in a
+        [`ColumnarFrames`][kloppy.domain.models.tracking.ColumnarFrames]
+        storage.
+        """
+        if self.is_columnar:
+            return self
+
+        return replace(
+            self,
+            records=ColumnarFrames.from_frames(
+                self.records,
+                periods=self.metadata.periods,
+                teams=self.metadata.teams,
+            ),
+        )
+
     @deprecated(
         "to_pandas will be removed in the future. Please use to_df instead."
     )
@@ -94,4 +844,54 @@ class TrackingDataset(Dataset[Frame]):
         )
 
 
-__all__ = ["Frame", "TrackingDataset", "PlayerData"]
+class TrackingDataStream:
+    """
+    Frames of a tracking data feed that are parsed one at a time while
+    iterating over the stream, so a full match never has to be kept in
+    memory. The metadata is available before the first frame is parsed.
+
+    The frames are not part of a dataset, so `prev()` and `next()` are not
+    available. The stream can only be iterated once. The underlying files
+    are closed once all frames are consumed; use the stream as a context
+    manager (or call `close`) when stopping early.
+
+    Attributes:
+        metadata: Metadata of the tracking data
+    """
+
+    def __init__(self, metadata: Metadata, frames: Iterable[Frame]):
+        self.metadata = metadata
+        self._frames = iter(frames)
+        self._resources = []
+
+    def closing(self, resource) -> "TrackingDataStream":
+        """Close `resource` (e.g. an opened file) together with this stream."""
+        self._resources.append(resource)
+        return self
+
+    def __iter__(self) -> Iterator[Frame]:
+        try:
+            yield from self._frames
+        finally:
+            self.close()
+
+    def close(self):
+        if hasattr(self._frames, "close"):
+            self._frames.close()
+        while self._resources:
+            self._resources.pop().close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+__all__ = [
+    "Frame",
+    "TrackingDataset",
+    "PlayerData",
+    "ColumnarFrames",
+    "TrackingDataStream",
+]
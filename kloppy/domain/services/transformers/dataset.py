@@ -1,7 +1,7 @@
 from dataclasses import fields, replace
 
-from kloppy.domain.models.tracking import PlayerData
-from typing import Union, Optional
+from kloppy.domain.models.tracking import ColumnarFrames, PlayerData
+from typing import List, Sequence, Tuple, Union, Optional
 
 from kloppy.domain import (
     AttackingDirection,
@@ -15,6 +15,7 @@ from kloppy.domain import (
     Period,
     Point,
     Point3D,
+    CoordinateTransformPlan,
     Team,
     TrackingDataset,
     CoordinateSystem,
@@ -76,6 +77,7 @@ class DatasetTransformer:
 
         self._from_orientation = from_orientation
         self._to_orientation = to_orientation
+        self._transform_plans = {}
         if (
             from_orientation
             and not to_orientation
@@ -98,29 +100,43 @@ class DatasetTransformer:
     def _needs_orientation_change(self):
         return self._from_orientation != self._to_orientation
 
+    def _get_transform_plan(
+        self, flip_y: bool = False
+    ) -> CoordinateTransformPlan:
+        # The plan is built once and reused for every point
+        plan = self._transform_plans.get(flip_y)
+        if plan is None:
+            plan = CoordinateTransformPlan(
+                self._from_pitch_dimensions,
+                self._to_pitch_dimensions,
+                pitch_length=(
+                    self._from_pitch_dimensions.pitch_length
+                    or DEFAULT_PITCH_LENGTH
+                ),
+                pitch_width=(
+                    self._from_pitch_dimensions.pitch_width
+                    or DEFAULT_PITCH_WIDTH
+                ),
+                flip_y=flip_y,
+            )
+            self._transform_plans[flip_y] = plan
+        return plan
+
+    def _get_coordinate_system_plan(self) -> CoordinateTransformPlan:
+        return self._get_transform_plan(
+            flip_y=(
+                self._from_coordinate_system.vertical_orientation
+                != self._to_coordinate_system.vertical_orientation
+            )
+        )
+
     def change_point_dimensions(
         self, point: Union[Point, Point3D, None]
     ) -> Union[Point, Point3D, None]:
         if point is None:
             return None
 
-        base_pitch_length = (
-            self._from_pitch_dimensions.pitch_length or DEFAULT_PITCH_LENGTH
-        )
-        base_pitch_width = (
-            self._from_pitch_dimensions.pitch_width or DEFAULT_PITCH_WIDTH
-        )
-
-        point_base = self._from_pitch_dimensions.to_metric_base(
-            point, pitch_length=base_pitch_length, pitch_width=base_pitch_width
-        )
-        point_to = self._to_pitch_dimensions.from_metric_base(
-            point_base,
-            pitch_length=base_pitch_length,
-            pitch_width=base_pitch_width,
-        )
-
-        return point_to
+        return self._get_transform_plan().transform_point(point)
 
     def flip_point(
         self, point: Union[Point, Point3D, None]
@@ -234,6 +250,7 @@ class DatasetTransformer:
             ball_coordinates=self.change_point_dimensions(
                 frame.ball_coordinates
             ),
+            ball_speed=frame.ball_speed,
             players_data={
                 key: PlayerData(
                     coordinates=self.change_point_dimensions(
@@ -254,33 +271,7 @@ class DatasetTransformer:
         if not point:
             return None
 
-        base_pitch_length = (
-            self._from_pitch_dimensions.pitch_length or DEFAULT_PITCH_LENGTH
-        )
-        base_pitch_width = (
-            self._from_pitch_dimensions.pitch_width or DEFAULT_PITCH_WIDTH
-        )
-
-        point_base = self._from_pitch_dimensions.to_metric_base(
-            point, pitch_length=base_pitch_length, pitch_width=base_pitch_width
-        )
-
-        if (
-            self._from_coordinate_system.vertical_orientation
-            != self._to_coordinate_system.vertical_orientation
-        ):
-            point_base = replace(
-                point_base,
-                y=base_pitch_width - point_base.y,
-            )
-
-        point_to = self._to_pitch_dimensions.from_metric_base(
-            point_base,
-            pitch_length=base_pitch_length,
-            pitch_width=base_pitch_width,
-        )
-
-        return point_to
+        return self._get_coordinate_system_plan().transform_point(point)
 
     def __flip_frame(self, frame: Frame):
         players_data = {}
@@ -301,10 +292,196 @@ class DatasetTransformer:
             period=frame.period,
             # changes
             ball_coordinates=self.flip_point(frame.ball_coordinates),
+            ball_speed=frame.ball_speed,
             players_data=players_data,
             other_data=frame.other_data,
         )
 
+    def transform_frames(
+        self, frames: Sequence[Frame]
+    ) -> Union[List[Frame], ColumnarFrames]:
+        """
+        Transform all frames at once.
+
+        The coordinates of all frames are collected in NumPy arrays and
+        transformed in a single pass. When NumPy is not installed, the frames
+        are transformed one by one using `transform_frame`.
+        """
+        try:
+            import numpy as np
+        except ImportError:
+            return [self.transform_frame(frame) for frame in frames]
+
+        if isinstance(frames, ColumnarFrames):
+            return self.__transform_columnar_frames(frames)
+
+        changes_coordinates = (
+            self._needs_coordinate_system_change
+            or self._needs_pitch_dimensions_change
+        )
+        flips = self.get_flips(
+            [(frame.ball_owning_team, frame.period) for frame in frames]
+        )
+
+        # Collect the ball and player coordinates of the frames that change
+        points = []
+        point_flips = []
+        for frame, flip in zip(frames, flips):
+            if not changes_coordinates and not flip:
+                continue
+            if frame.ball_coordinates is not None:
+                points.append(frame.ball_coordinates)
+                point_flips.append(flip)
+            for player_data in frame.players_data.values():
+                if player_data.coordinates is not None:
+                    points.append(player_data.coordinates)
+                    point_flips.append(flip)
+
+        if not points:
+            return list(frames)
+
+        x, y, z = self.transform_coordinates(
+            np.array([point.x for point in points], dtype=float),
+            np.array([point.y for point in points], dtype=float),
+            np.array(
+                [getattr(point, "z", None) for point in points], dtype=float
+            ),
+            np.array(point_flips, dtype=bool),
+        )
+        coordinates = iter(zip(points, x.tolist(), y.tolist(), z.tolist()))
+
+        transformed_frames = []
+        for frame, flip in zip(frames, flips):
+            if not changes_coordinates and not flip:
+                transformed_frames.append(frame)
+                continue
+
+            ball_coordinates = frame.ball_coordinates
+            if ball_coordinates is not None:
+                ball_coordinates = self.__build_point(*next(coordinates))
+
+            players_data = {}
+            for player, player_data in frame.players_data.items():
+                player_coordinates = player_data.coordinates
+                if player_coordinates is not None:
+                    player_coordinates = self.__build_point(*next(coordinates))
+                players_data[player] = PlayerData(
+                    coordinates=player_coordinates,
+                    distance=player_data.distance,
+                    speed=player_data.speed,
+                    other_data=player_data.other_data,
+                )
+
+            transformed_frames.append(
+                Frame(
+                    # doesn't change
+                    timestamp=frame.timestamp,
+                    frame_id=frame.frame_id,
+                    ball_owning_team=frame.ball_owning_team,
+                    ball_state=frame.ball_state,
+                    period=frame.period,
+                    ball_speed=frame.ball_speed,
+                    other_data=frame.other_data,
+                    # changes
+                    ball_coordinates=ball_coordinates,
+                    players_data=players_data,
+                )
+            )
+        return transformed_frames
+
+    def __transform_columnar_frames(
+        self, frames: ColumnarFrames
+    ) -> ColumnarFrames:
+        import numpy as np
+
+        period_index = frames.period_index
+        team_index = frames.ball_owning_team
+        flips = np.zeros(len(frames), dtype=bool)
+        if self._needs_orientation_change:
+            for period_idx, team_idx in set(
+                zip(period_index.tolist(), team_index.tolist())
+            ):
+                if self.__needs_flip(
+                    ball_owning_team=frames.teams[team_idx]
+                    if team_idx >= 0
+                    else None,
+                    period=frames.periods[period_idx]
+                    if period_idx >= 0
+                    else None,
+                ):
+                    flips |= (period_index == period_idx) & (
+                        team_index == team_idx
+                    )
+
+        ball_coordinates = frames.ball_coordinates
+        ball_x, ball_y, ball_z = self.transform_coordinates(
+            ball_coordinates[:, 0],
+            ball_coordinates[:, 1],
+            ball_coordinates[:, 2],
+            flips,
+        )
+        player_coordinates = frames.player_coordinates
+        player_x, player_y, _ = self.transform_coordinates(
+            player_coordinates[..., 0],
+            player_coordinates[..., 1],
+            None,
+            flips[:, None],
+        )
+        return frames.replace_coordinates(
+            ball_coordinates=np.stack([ball_x, ball_y, ball_z], axis=-1),
+            player_coordinates=np.stack([player_x, player_y], axis=-1),
+        )
+
+    def get_flips(
+        self, records: List[Tuple[Optional[Team], Optional[Period]]]
+    ) -> List[bool]:
+        """Return for each (ball owning team, period) whether the coordinates
+        must be flipped to change the orientation."""
+        if not self._needs_orientation_change:
+            return [False] * len(records)
+
+        # The outcome only depends on the period and ball owning team
+        flips = {}
+        for ball_owning_team, period in records:
+            key = (id(ball_owning_team), id(period))
+            if key not in flips:
+                flips[key] = self.__needs_flip(
+                    ball_owning_team=ball_owning_team, period=period
+                )
+        return [
+            flips[(id(ball_owning_team), id(period))]
+            for ball_owning_team, period in records
+        ]
+
+    def transform_coordinates(self, x, y, z, flips):
+        """Transform NumPy arrays of coordinates. `z` can be None, and
+        `flips` is a boolean array that marks the coordinates that must be
+        flipped (see `get_flips`)."""
+        import numpy as np
+
+        if self._needs_coordinate_system_change:
+            x, y, z = self._get_coordinate_system_plan().transform_array(
+                x, y, z
+            )
+        elif self._needs_pitch_dimensions_change:
+            x, y, z = self._get_transform_plan().transform_array(x, y, z)
+
+        if self._needs_orientation_change and np.any(flips):
+            x_dim = self._to_pitch_dimensions.x_dim
+            y_dim = self._to_pitch_dimensions.y_dim
+            x = np.where(flips, x_dim.from_base(1 - x_dim.to_base(x)), x)
+            y = np.where(flips, y_dim.from_base(1 - y_dim.to_base(y)), y)
+
+        return x, y, z
+
+    @staticmethod
+    def __build_point(
+        point: Union[Point, Point3D], x: float, y: float, z: float
+    ) -> Union[Point, Point3D]:
+        if isinstance(point, Point3D):
+            return Point3D(x=x, y=y, z=z if point.z is not None else None)
+        return Point(x=x, y=y)
+
     def transform_event(self, event: Event) -> Event:
         # Change coordinate system
         if self._needs_coordinate_system_change:
@@ -445,10 +622,7 @@ class DatasetTransformer:
             )
 
         if isinstance(dataset, TrackingDataset):
-            frames = [
-                transformer.transform_frame(record)
-                for record in dataset.records
-            ]
+            frames = transformer.transform_frames(dataset.records)
 
             return TrackingDataset(
                 metadata=metadata,
@@ -0,0 +1,252 @@
+"""
+Cache the datasets returned by the `load` functions of the providers.
+
+When the `dataset_cache` config is set to a directory, every loaded dataset
+is stored in that directory. The cache key is a hash of the content of the
+inputs, the arguments of the `load` function, the config that affects the
+result and the kloppy version. Loading the same inputs with the same
+arguments again reads the dataset from the cache, instead of parsing the
+inputs.
+
+Tracking datasets are stored in columnar form, as an Arrow IPC file when
+pyarrow is installed and pickled otherwise, and returned with the storage of
+the `tracking.storage` config. Event datasets are pickled.
+
+Reading a pickled dataset can run arbitrary code. Anyone who can write to
+the cache directory can run code in the processes that use it, so only use
+a directory that is writable by trusted users only.
+
+Errors while writing a dataset to the cache are logged and don't fail the
+load.
+"""
+import functools
+import hashlib
+import inspect
+import logging
+import os
+import pickle
+import tempfile
+from dataclasses import replace
+from datetime import timedelta
+from enum import Enum
+from pathlib import PurePath
+from typing import IO, Any, Callable, Optional, TypeVar
+
+from kloppy.config import get_config
+from kloppy.domain import Dataset, TrackingDataset
+from kloppy.infra.serializers.arrow.common import import_pyarrow
+from kloppy.infra.serializers.arrow.tracking import (
+    TrackingDataArrowDeserializer,
+    TrackingDataArrowSerializer,
+)
+from kloppy.io import Source, open_as_file
+
+logger = logging.getLogger(__name__)
+
+# Number of bytes of an input that are hashed at once
+CHUNK_SIZE = 1 << 20
+
+# The config items that change the loaded dataset
+CONFIG_KEYS = ["coordinate_system"]
+
+F = TypeVar("F", bound=Callable[..., Dataset])
+
+
+class _Uncacheable(Exception):
+    """The dataset of a load can't be cached, for example because one of
+    the arguments is an object without a stable representation."""
+
+
+def _is_input(parameter: inspect.Parameter) -> bool:
+    # FileLike and Optional[FileLike] are unions that contain Source
+    return Source in getattr(parameter.annotation, "__args__", ())
+
+
+def _hash_file(h, fp: IO):
+    while True:
+        chunk = fp.read(CHUNK_SIZE)
+        if not chunk:
+            break
+        if isinstance(chunk, str):
+            chunk = chunk.encode("utf8")
+        h.update(chunk)
+
+
+def _hash_input(h, input_: Any):
+    if isinstance(input_, Source):
+        h.update(repr((input_.optional, input_.skip_if_missing)).encode())
+        if not isinstance(input_.data, (str, PurePath, bytes, type(None))):
+            input_ = input_.data
+
+    if input_ is None:
+        h.update(b"\0")
+    elif isinstance(input_, (str, PurePath, bytes, Source)):
+        with open_as_file(input_) as fp:
+            if fp is None:
+                h.update(b"\0")
+            else:
+                _hash_file(h, fp)
+    else:
+        # An opened file, which is rewound for the load
+        if not input_.seekable():
+            raise _Uncacheable("input is not seekable")
+        start = input_.tell()
+        _hash_file(h, input_)
+        input_.seek(start)
+
+
+def _normalize(value: Any) -> Any:
+    """Return a representation of `value` that is stable across runs."""
+    if value is None or isinstance(
+        value, (str, bytes, int, float, bool, timedelta)
+    ):
+        return value
+    elif isinstance(value, Enum):
+        return f"{type(value).__qualname__}.{value.name}"
+    elif isinstance(value, (list, tuple)):
+        return [_normalize(item) for item in value]
+    elif isinstance(value, (set, frozenset)):
+        return sorted(repr(_normalize(item)) for item in value)
+    elif isinstance(value, dict):
+        return sorted(
+            (repr(_normalize(key)), _normalize(item))
+            for key, item in value.items()
+        )
+    raise _Uncacheable(f"argument {value!r} has no stable representation")
+
+
+def _get_cache_key(
+    func: Callable, signature: inspect.Signature, args, kwargs
+) -> str:
+    """Return the key of the dataset `func(*args, **kwargs)` loads.
+
+    Raises `_Uncacheable` when the load can't be cached.
+    """
+    from kloppy import __version__
+
+    if get_config("event_factory") is not None:
+        raise _Uncacheable("an event factory is configured")
+
+    h = hashlib.sha256()
+    h.update(f"{__version__}:{func.__module__}.{func.__qualname__}".encode())
+    h.update(
+        repr(
+            _normalize({key: get_config(key) for key in CONFIG_KEYS})
+        ).encode()
+    )
+
+    bound = signature.bind(*args, **kwargs)
+    bound.apply_defaults()
+    for name, value in bound.arguments.items():
+        h.update(name.encode())
+        if _is_input(signature.parameters[name]):
+            _hash_input(h, value)
+        else:
+            h.update(repr(_normalize(value)).encode())
+    return h.hexdigest()
+
+
+def _has_pyarrow() -> bool:
+    try:
+        import_pyarrow()
+    except ImportError:
+        return False
+    return True
+
+
+def _read_dataset(path: str) -> Optional[Dataset]:
+    """Read the dataset cached at `path`, without its extension."""
+    try:
+        if os.path.exists(f"{path}.arrow"):
+            return TrackingDataArrowDeserializer().deserialize(
+                f"{path}.arrow", format="arrow"
+            )
+        with open(f"{path}.pkl", "rb") as fp:
+            return pickle.load(fp)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"Could not read cached dataset {path}: {e}")
+        return None
+
+
+def _write_file(path: str, write: Callable[[IO[bytes]], None]):
+    cache_dir = os.path.dirname(path)
+    os.makedirs(cache_dir, exist_ok=True)
+    # Write to a temporary file first, so other processes never read a
+    # partially written dataset
+    fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as fp:
+            write(fp)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def _write_dataset(path: str, dataset: Dataset):
+    """Write `dataset` to the cache at `path`, without its extension."""
+    if isinstance(dataset, TrackingDataset):
+        # Pickling a Frame per record makes both writing and reading the
+        # cache slower than parsing the inputs
+        dataset = dataset.to_columnar()
+        if _has_pyarrow():
+            serializer = TrackingDataArrowSerializer()
+            _write_file(
+                f"{path}.arrow",
+                lambda fp: serializer.serialize(dataset, fp, format="arrow"),
+            )
+            return
+
+    _write_file(
+        f"{path}.pkl",
+        lambda fp: pickle.dump(dataset, fp, protocol=pickle.HIGHEST_PROTOCOL),
+    )
+
+
+def _with_configured_storage(dataset: Dataset) -> Dataset:
+    """Return a cached tracking dataset, which is stored in columnar form,
+    with the storage of the `tracking.storage` config."""
+    if (
+        isinstance(dataset, TrackingDataset)
+        and dataset.is_columnar
+        and get_config("tracking.storage") != "columnar"
+    ):
+        return replace(dataset, records=list(dataset.records))
+    return dataset
+
+
+def cached_dataset(func: F) -> F:
+    """Cache the datasets loaded by `func` in the `dataset_cache` directory.
+
+    Does nothing when the `dataset_cache` config is not set.
+    """
+    signature = inspect.signature(func)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        cache_dir = get_config("dataset_cache")
+        if not cache_dir:
+            return func(*args, **kwargs)
+
+        try:
+            key = _get_cache_key(func, signature, args, kwargs)
+        except _Uncacheable as e:
+            logger.info(f"Not using the dataset cache: {e}")
+            return func(*args, **kwargs)
+
+        path = os.path.join(cache_dir, key)
+        dataset = _read_dataset(path)
+        if dataset is not None:
+            logger.info(f"Using cached dataset {path}")
+            return _with_configured_storage(dataset)
+
+        dataset = func(*args, **kwargs)
+        try:
+            _write_dataset(path, dataset)
+        except Exception as e:
+            logger.warning(f"Could not write dataset to the cache: {e}")
+        return dataset
+
+    return wrapper
@@ -0,0 +1,67 @@
+from typing import IO, Union
+
+from kloppy.exceptions import KloppyParameterError
+
+FORMATS = ["parquet", "arrow"]
+
+# Time unit of the timestamp columns
+TIMESTAMP_UNIT = "us"
+
+
+def import_pyarrow():
+    try:
+        import pyarrow as pa
+    except ImportError:
+        raise ImportError(
+            "Seems like you don't have pyarrow installed. Please"
+            " install it using: pip install pyarrow"
+        )
+    return pa
+
+
+def _validate_format(format: str):
+    if format not in FORMATS:
+        raise KloppyParameterError(
+            f"Format {format} is not valid. Use one of: "
+            f"{', '.join(FORMATS)}"
+        )
+
+
+def write_table(table, output: Union[str, IO[bytes]], format: str):
+    """Write `table` to `output`, a path or a binary file."""
+    pa = import_pyarrow()
+    _validate_format(format)
+
+    if format == "parquet":
+        import pyarrow.parquet as pq
+
+        pq.write_table(table, output)
+    else:
+        with pa.ipc.new_file(output, table.schema) as writer:
+            writer.write_table(table)
+
+
+def read_table(input: Union[str, IO[bytes]], format: str):
+    """Read a table from `input`, a path or a binary file. Files at a path
+    are memory mapped."""
+    pa = import_pyarrow()
+    _validate_format(format)
+
+    if format == "parquet":
+        import pyarrow.parquet as pq
+
+        return pq.read_table(input, memory_map=isinstance(input, str))
+    else:
+        source = pa.memory_map(input, "r") if isinstance(input, str) else input
+        return pa.ipc.open_file(source).read_all()
+
+
+def column_to_array(table, name: str):
+    """Return the column `name` of `table` as a single array. Columns of a
+    single chunk are returned without copying them."""
+    pa = import_pyarrow()
+
+    column = table.column(name)
+    if column.num_chunks == 1:
+        return column.chunk(0)
+    return pa.concat_arrays(column.chunks)
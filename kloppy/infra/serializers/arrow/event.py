@@ -0,0 +1,664 @@
+"""
+Write event datasets to Parquet or Arrow IPC files and read them back.
+
+Every event is a row. The event type, result, coordinates and qualifiers are
+stored in typed columns, and the team and players by their ids. Ids are
+stored as strings, integer ids are also stored in integer columns so they
+are read back as integers. The metadata
+is stored in the key-value metadata of the file.
+
+Events are read back with the builders of an
+[`EventFactory`][kloppy.domain.services.event_factory.EventFactory], the
+same way the provider deserializers create them. The `state` of the events
+is not stored.
+"""
+import json
+import logging
+from typing import IO, Any, Dict, List, Optional, Tuple, Type, Union
+
+from kloppy.domain import (
+    BallState,
+    BodyPartQualifier,
+    CardQualifier,
+    CardType,
+    CarryResult,
+    CounterAttackQualifier,
+    DatasetType,
+    DuelQualifier,
+    DuelResult,
+    EnumQualifier,
+    Event,
+    EventDataset,
+    EventFactory,
+    EventType,
+    FormationType,
+    Frame,
+    GoalkeeperQualifier,
+    InterceptionResult,
+    Metadata,
+    PassQualifier,
+    PassResult,
+    Player,
+    PlayerData,
+    Point,
+    Point3D,
+    Qualifier,
+    SetPieceQualifier,
+    ShotResult,
+    TakeOnResult,
+    Team,
+)
+from kloppy.exceptions import SerializationError
+from kloppy.utils import (
+    camelcase_to_snakecase,
+    performance_logging,
+    removes_suffix,
+)
+
+from . import metadata as metadata_serializer
+from .common import (
+    TIMESTAMP_UNIT,
+    column_to_array,
+    import_pyarrow,
+    read_table,
+    write_table,
+)
+
+logger = logging.getLogger(__name__)
+
+# The result types of the events with a result
+RESULT_TYPES = {
+    EventType.PASS: PassResult,
+    EventType.SHOT: ShotResult,
+    EventType.TAKE_ON: TakeOnResult,
+    EventType.CARRY: CarryResult,
+    EventType.DUEL: DuelResult,
+    EventType.INTERCEPTION: InterceptionResult,
+}
+
+# The qualifiers that are stored, each in its own column
+QUALIFIER_TYPES: List[Type[Qualifier]] = [
+    SetPieceQualifier,
+    CardQualifier,
+    PassQualifier,
+    BodyPartQualifier,
+    GoalkeeperQualifier,
+    DuelQualifier,
+    CounterAttackQualifier,
+]
+
+# The methods of the event factory that build the events of a type
+BUILDERS = {
+    EventType.GENERIC: "build_generic",
+    EventType.PASS: "build_pass",
+    EventType.SHOT: "build_shot",
+    EventType.TAKE_ON: "build_take_on",
+    EventType.CARRY: "build_carry",
+    EventType.CLEARANCE: "build_clearance",
+    EventType.INTERCEPTION: "build_interception",
+    EventType.DUEL: "build_duel",
+    EventType.SUBSTITUTION: "build_substitution",
+    EventType.CARD: "build_card",
+    EventType.PLAYER_ON: "build_player_on",
+    EventType.PLAYER_OFF: "build_player_off",
+    EventType.RECOVERY: "build_recovery",
+    EventType.MISCONTROL: "build_miscontrol",
+    EventType.BALL_OUT: "build_ball_out",
+    EventType.FOUL_COMMITTED: "build_foul_committed",
+    EventType.GOALKEEPER: "build_goalkeeper_event",
+    EventType.PRESSURE: "build_pressure_event",
+    EventType.FORMATION_CHANGE: "build_formation_change",
+}
+
+# The attributes of the event classes that are stored in the end_* columns
+END_TIMESTAMP_ATTRIBUTES = ["receive_timestamp", "end_timestamp"]
+END_COORDINATES_ATTRIBUTES = [
+    "receiver_coordinates",
+    "end_coordinates",
+    "result_coordinates",
+]
+
+# The attributes of the event types that are not part of all events
+EVENT_ATTRIBUTES = {
+    EventType.PASS: [
+        "receive_timestamp",
+        "receiver_coordinates",
+        "receiver_player",
+    ],
+    EventType.SHOT: ["result_coordinates"],
+    EventType.CARRY: ["end_timestamp", "end_coordinates"],
+    EventType.PRESSURE: ["end_timestamp"],
+    EventType.SUBSTITUTION: ["replacement_player"],
+    EventType.CARD: ["card_type"],
+    EventType.FORMATION_CHANGE: ["formation_type"],
+}
+
+
+def _qualifier_column(qualifier_type: Type[Qualifier]) -> str:
+    # PassQualifier -> pass_qualifier
+    name = removes_suffix(qualifier_type.__name__, "Qualifier")
+    return f"{camelcase_to_snakecase(name)}_qualifier"
+
+
+def _get_attribute(event: Event, names: List[str]) -> Any:
+    """Return the first attribute of `names` the event has."""
+    for name in names:
+        if hasattr(event, name):
+            return getattr(event, name)
+    return None
+
+
+def _id(value: Any) -> Optional[str]:
+    return None if value is None else str(value)
+
+
+def _int_id(value: Any) -> Optional[int]:
+    """Return the id when it is an integer. Integer ids are also stored in
+    an integer column, so they are restored with their type."""
+    if isinstance(value, int) and not isinstance(value, bool):
+        return value
+    return None
+
+
+def _decode_id(value: Optional[str], int_value: Optional[int]) -> Any:
+    return int_value if int_value is not None else value
+
+
+def _encode_freeze_frame(frame: Optional[Frame]) -> Optional[Dict]:
+    if frame is None:
+        return None
+    ball_coordinates = frame.ball_coordinates
+    return {
+        "frame_id": frame.frame_id,
+        "ball_x": ball_coordinates.x if ball_coordinates else None,
+        "ball_y": ball_coordinates.y if ball_coordinates else None,
+        "ball_z": getattr(ball_coordinates, "z", None),
+        "players": [
+            {
+                "team_id": _id(player.team.team_id) if player.team else None,
+                "player_id": _id(player.player_id),
+                "player_id_int": _int_id(player.player_id),
+                "x": player_data.coordinates.x
+                if player_data.coordinates
+                else None,
+                "y": player_data.coordinates.y
+                if player_data.coordinates
+                else None,
+                "z": getattr(player_data.coordinates, "z", None),
+            }
+            for player, player_data in frame.players_data.items()
+        ],
+        "other_data": json.dumps(
+            metadata_serializer.encode_value(frame.other_data)
+        )
+        if frame.other_data
+        else None,
+    }
+
+
+def _point(x: Optional[float], y: Optional[float], z: Optional[float] = None):
+    if x is None and y is None:
+        return None
+    if z is not None:
+        return Point3D(x=x, y=y, z=z)
+    return Point(x=x, y=y)
+
+
+class _PlayerLookup:
+    """Find the players by id. Players that are not part of the metadata,
+    like the anonymous players of freeze frames, are created once."""
+
+    def __init__(self, metadata: Metadata):
+        self.teams = {str(team.team_id): team for team in metadata.teams}
+        self.players: Dict[Tuple[Optional[str], str], Player] = {}
+        for team_id, team in self.teams.items():
+            for player in team.players:
+                self.players[(team_id, str(player.player_id))] = player
+        self.players_by_id: Dict[str, Player] = {
+            player_id: player
+            for (_, player_id), player in reversed(self.players.items())
+        }
+
+    def get_team(self, team_id: Optional[str]) -> Optional[Team]:
+        return self.teams.get(team_id) if team_id is not None else None
+
+    def get_player(
+        self,
+        team_id: Optional[str],
+        player_id: Optional[str],
+        player_id_int: Optional[int] = None,
+    ) -> Optional[Player]:
+        """Return the player of the team, or of any team when the player
+        is not part of the team. `player_id_int` is the id of players that
+        have an integer id."""
+        if player_id is None:
+            return None
+        player = self.players.get((team_id, player_id))
+        if player is None:
+            player = self.players_by_id.get(player_id)
+        if player is None:
+            player = Player(
+                player_id=_decode_id(player_id, player_id_int),
+                team=self.get_team(team_id),
+                jersey_no=None,
+            )
+            self.players[(team_id, player_id)] = player
+        return player
+
+
+class EventDataArrowSerializer:
+    def to_table(self, dataset: EventDataset):
+        """Convert the dataset to an Arrow table."""
+        pa = import_pyarrow()
+
+        columns: Dict[str, List] = {
+            name: []
+            for name in [
+                "event_id",
+                "event_id_int",
+                "event_type",
+                "event_name",
+                "period_id",
+                "timestamp",
+                "end_timestamp",
+                "ball_state",
+                "ball_owning_team_id",
+                "team_id",
+                "player_id",
+                "coordinates_x",
+                "coordinates_y",
+                "coordinates_z",
+                "end_coordinates_x",
+                "end_coordinates_y",
+                "end_coordinates_z",
+                "receiver_player_id",
+                "replacement_player_id",
+                "result",
+                "card_type",
+                "formation_type",
+                "related_event_ids",
+                "related_event_ids_int",
+                "freeze_frame",
+                "raw_event",
+            ]
+        }
+        qualifier_columns = {
+            qualifier_type: [] for qualifier_type in QUALIFIER_TYPES
+        }
+
+        for event in dataset.events:
+            result = event.result
+            if result is not None and not isinstance(
+                result, RESULT_TYPES.get(event.event_type, ())
+            ):
+                raise SerializationError(
+                    f"Result {result} of {event.event_type} events can't be "
+                    f"serialized"
+                )
+
+            coordinates = event.coordinates
+            end_coordinates = _get_attribute(event, END_COORDINATES_ATTRIBUTES)
+            card_type = getattr(event, "card_type", None)
+            formation_type = getattr(event, "formation_type", None)
+
+            columns["event_id"].append(_id(event.event_id))
+            columns["event_id_int"].append(_int_id(event.event_id))
+            columns["event_type"].append(event.event_type.value)
+            columns["event_name"].append(event.event_name)
+            columns["period_id"].append(event.period.id)
+            columns["timestamp"].append(event.timestamp)
+            columns["end_timestamp"].append(
+                _get_attribute(event, END_TIMESTAMP_ATTRIBUTES)
+            )
+            columns["ball_state"].append(
+                event.ball_state.value if event.ball_state else None
+            )
+            columns["ball_owning_team_id"].append(
+                _id(event.ball_owning_team.team_id)
+                if event.ball_owning_team
+                else None
+            )
+            columns["team_id"].append(
+                _id(event.team.team_id) if event.team else None
+            )
+            columns["player_id"].append(
+                _id(event.player.player_id) if event.player else None
+            )
+            for name, point in [
+                ("coordinates", coordinates),
+                ("end_coordinates", end_coordinates),
+            ]:
+                columns[f"{name}_x"].append(point.x if point else None)
+                columns[f"{name}_y"].append(point.y if point else None)
+                columns[f"{name}_z"].append(getattr(point, "z", None))
+            for name in ["receiver_player", "replacement_player"]:
+                player = getattr(event, name, None)
+                columns[f"{name}_id"].append(
+                    _id(player.player_id) if player else None
+                )
+            columns["result"].append(result.value if result else None)
+            columns["card_type"].append(card_type.value if card_type else None)
+            columns["formation_type"].append(
+                formation_type.value if formation_type else None
+            )
+            columns["related_event_ids"].append(
+                [_id(event_id) for event_id in event.related_event_ids]
+                if event.related_event_ids is not None
+                else None
+            )
+            columns["related_event_ids_int"].append(
+                [_int_id(event_id) for event_id in event.related_event_ids]
+                if event.related_event_ids is not None
+                else None
+            )
+            columns["freeze_frame"].append(
+                _encode_freeze_frame(event.freeze_frame)
+            )
+            columns["raw_event"].append(
+                json.dumps(
+                    metadata_serializer.encode_value(event.raw_event),
+                    default=str,
+                )
+                if isinstance(event.raw_event, dict)
+                else None
+            )
+
+            qualifiers = event.qualifiers
+            for qualifier_type, values in qualifier_columns.items():
+                values.append(
+                    [
+                        qualifier.value.value
+                        if isinstance(qualifier, EnumQualifier)
+                        else qualifier.value
+                        for qualifier in qualifiers
+                        if type(qualifier) is qualifier_type
+                    ]
+                    if qualifiers is not None
+                    else None
+                )
+            if qualifiers and any(
+                type(qualifier) not in qualifier_columns
+                for qualifier in qualifiers
+            ):
+                raise SerializationError(
+                    f"Qualifiers of event {event.event_id} can't be "
+                    f"serialized"
+                )
+
+        def _dictionary(values: List[Optional[str]]):
+            return pa.array(values, type=pa.string()).dictionary_encode()
+
+        def _float(values: List[Optional[float]]):
+            return pa.array(values, type=pa.float64())
+
+        def _duration(values: List):
+            return pa.array(values, type=pa.duration(TIMESTAMP_UNIT))
+
+        arrays = {
+            "event_id": pa.array(columns["event_id"], type=pa.string()),
+            "event_id_int": pa.array(columns["event_id_int"], type=pa.int64()),
+            "event_type": _dictionary(columns["event_type"]),
+            "event_name": _dictionary(columns["event_name"]),
+            "period_id": pa.array(columns["period_id"], type=pa.int16()),
+            "timestamp": _duration(columns["timestamp"]),
+            "end_timestamp": _duration(columns["end_timestamp"]),
+            "ball_state": _dictionary(columns["ball_state"]),
+            "ball_owning_team_id": _dictionary(columns["ball_owning_team_id"]),
+            "team_id": _dictionary(columns["team_id"]),
+            "player_id": _dictionary(columns["player_id"]),
+            **{
+                f"{name}_{axis}": _float(columns[f"{name}_{axis}"])
+                for name in ["coordinates", "end_coordinates"]
+                for axis in "xyz"
+            },
+            "receiver_player_id": _dictionary(columns["receiver_player_id"]),
+            "replacement_player_id": _dictionary(
+                columns["replacement_player_id"]
+            ),
+            "result": _dictionary(columns["result"]),
+            "card_type": _dictionary(columns["card_type"]),
+            "formation_type": _dictionary(columns["formation_type"]),
+            **{
+                _qualifier_column(qualifier_type): pa.array(
+                    values,
+                    type=pa.list_(
+                        pa.bool_()
+                        if issubclass(qualifier_type, CounterAttackQualifier)
+                        else pa.string()
+                    ),
+                )
+                for qualifier_type, values in qualifier_columns.items()
+            },
+            "related_event_ids": pa.array(
+                columns["related_event_ids"], type=pa.list_(pa.string())
+            ),
+            "related_event_ids_int": pa.array(
+                columns["related_event_ids_int"], type=pa.list_(pa.int64())
+            ),
+            "freeze_frame": pa.array(
+                columns["freeze_frame"],
+                type=pa.struct(
+                    [
+                        ("frame_id", pa.int64()),
+                        ("ball_x", pa.float64()),
+                        ("ball_y", pa.float64()),
+                        ("ball_z", pa.float64()),
+                        (
+                            "players",
+                            pa.list_(
+                                pa.struct(
+                                    [
+                                        ("team_id", pa.string()),
+                                        ("player_id", pa.string()),
+                                        ("player_id_int", pa.int64()),
+                                        ("x", pa.float64()),
+                                        ("y", pa.float64()),
+                                        ("z", pa.float64()),
+                                    ]
+                                )
+                            ),
+                        ),
+                        ("other_data", pa.string()),
+                    ]
+                ),
+            ),
+            "raw_event": pa.array(columns["raw_event"], type=pa.string()),
+        }
+
+        table = pa.table(arrays)
+        return table.replace_schema_metadata(
+            {
+                metadata_serializer.METADATA_KEY: metadata_serializer.dumps(
+                    DatasetType.EVENT, dataset.metadata
+                )
+            }
+        )
+
+    def serialize(
+        self,
+        dataset: EventDataset,
+        output: Union[str, IO[bytes]],
+        format: str = "parquet",
+    ):
+        """Write the dataset to `output`, a path or a binary file."""
+        with performance_logging("serialize", logger=logger):
+            write_table(self.to_table(dataset), output, format)
+
+
+class EventDataArrowDeserializer:
+    def __init__(self, event_factory: Optional[EventFactory] = None):
+        self.event_factory = event_factory or EventFactory()
+
+    def _decode_freeze_frame(
+        self, data: Optional[Dict], lookup: _PlayerLookup, **kwargs
+    ) -> Optional[Frame]:
+        """Decode a freeze frame. The period, timestamp and ball state of
+        the freeze frame are those of the event, passed as `kwargs`."""
+        if data is None:
+            return None
+        return Frame(
+            frame_id=data["frame_id"],
+            ball_coordinates=_point(
+                data["ball_x"], data["ball_y"], data["ball_z"]
+            ),
+            players_data={
+                lookup.get_player(
+                    player["team_id"],
+                    player["player_id"],
+                    player.get("player_id_int"),
+                ): PlayerData(
+                    coordinates=_point(player["x"], player["y"], player["z"])
+                )
+                for player in data["players"]
+            },
+            other_data=metadata_serializer.decode_value(
+                json.loads(data["other_data"])
+            )
+            if data["other_data"]
+            else {},
+            **kwargs,
+        )
+
+    def from_table(self, table) -> EventDataset:
+        """Convert an Arrow table written by the serializer to a dataset."""
+        data = metadata_serializer.loads(
+            table.schema.metadata, DatasetType.EVENT
+        )
+        metadata = data["metadata"]
+        periods = {period.id: period for period in metadata.periods}
+        lookup = _PlayerLookup(metadata)
+
+        columns = {
+            name: column_to_array(table, name).to_pylist()
+            for name in table.column_names
+        }
+        # Files written by older versions don't have the integer ids
+        for name in ["event_id_int", "related_event_ids_int"]:
+            columns.setdefault(name, [None] * table.num_rows)
+        qualifier_columns = [
+            (qualifier_type, columns[_qualifier_column(qualifier_type)])
+            for qualifier_type in QUALIFIER_TYPES
+        ]
+        enum_types = {
+            qualifier_type: qualifier_type.__annotations__["value"]
+            for qualifier_type in QUALIFIER_TYPES
+            if issubclass(qualifier_type, EnumQualifier)
+        }
+
+        events = []
+        for i in range(table.num_rows):
+
+            def _value(name: str) -> Any:
+                return columns[name][i]
+
+            event_type = EventType(_value("event_type"))
+            team_id = _value("team_id")
+            team = lookup.get_team(team_id)
+            period = periods[_value("period_id")]
+            ball_state = (
+                BallState(_value("ball_state"))
+                if _value("ball_state")
+                else None
+            )
+            ball_owning_team = lookup.get_team(_value("ball_owning_team_id"))
+
+            qualifiers = None
+            if any(values[i] is not None for _, values in qualifier_columns):
+                qualifiers = [
+                    qualifier_type(
+                        value=enum_types[qualifier_type](value)
+                        if qualifier_type in enum_types
+                        else value
+                    )
+                    for qualifier_type, values in qualifier_columns
+                    for value in values[i] or []
+                ]
+
+            end_coordinates = _point(
+                _value("end_coordinates_x"),
+                _value("end_coordinates_y"),
+                _value("end_coordinates_z"),
+            )
+            end_timestamp = _value("end_timestamp")
+            attributes = {
+                "receive_timestamp": end_timestamp,
+                "end_timestamp": end_timestamp,
+                "receiver_coordinates": end_coordinates,
+                "end_coordinates": end_coordinates,
+                "result_coordinates": end_coordinates,
+                "receiver_player": lookup.get_player(
+                    team_id, _value("receiver_player_id")
+                ),
+                "replacement_player": lookup.get_player(
+                    team_id, _value("replacement_player_id")
+                ),
+                "card_type": CardType(_value("card_type"))
+                if _value("card_type")
+                else None,
+                "formation_type": FormationType(_value("formation_type"))
+                if _value("formation_type")
+                else None,
+            }
+
+            related_event_ids = _value("related_event_ids")
+            builder = getattr(self.event_factory, BUILDERS[event_type])
+            event = builder(
+                event_id=_decode_id(
+                    _value("event_id"), _value("event_id_int")
+                ),
+                event_name=_value("event_name"),
+                period=period,
+                timestamp=_value("timestamp"),
+                ball_state=ball_state,
+                ball_owning_team=ball_owning_team,
+                team=team,
+                player=lookup.get_player(team_id, _value("player_id")),
+                coordinates=_point(
+                    _value("coordinates_x"),
+                    _value("coordinates_y"),
+                    _value("coordinates_z"),
+                ),
+                result=RESULT_TYPES[event_type](_value("result"))
+                if _value("result")
+                else None,
+                qualifiers=qualifiers,
+                related_event_ids=[
+                    _decode_id(event_id, int_event_id)
+                    for event_id, int_event_id in zip(
+                        related_event_ids,
+                        _value("related_event_ids_int")
+                        or [None] * len(related_event_ids),
+                    )
+                ]
+                if related_event_ids is not None
+                else None,
+                raw_event=metadata_serializer.decode_value(
+                    json.loads(_value("raw_event"))
+                )
+                if _value("raw_event")
+                else None,
+                freeze_frame=self._decode_freeze_frame(
+                    _value("freeze_frame"),
+                    lookup,
+                    period=period,
+                    timestamp=_value("timestamp"),
+                    ball_state=ball_state,
+                    ball_owning_team=ball_owning_team,
+                ),
+                **{
+                    name: attributes[name]
+                    for name in EVENT_ATTRIBUTES.get(event_type, [])
+                },
+            )
+            events.append(event)
+
+        return EventDataset(records=events, metadata=metadata)
+
+    def deserialize(
+        self,
+        input: Union[str, IO[bytes]],
+        format: str = "parquet",
+    ) -> EventDataset:
+        """Read a dataset from `input`, a path or a binary file."""
+        with performance_logging("deserialize", logger=logger):
+            return self.from_table(read_table(input, format))
@@ -0,0 +1,293 @@
+"""
+Encode the metadata of a dataset as JSON, to store it in the key-value
+metadata of Parquet and Arrow files.
+"""
+import json
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from kloppy.domain import (
+    DatasetFlag,
+    DatasetType,
+    FormationType,
+    Ground,
+    Metadata,
+    Orientation,
+    Period,
+    Player,
+    Point,
+    Position,
+    Provider,
+    Score,
+    Team,
+    build_coordinate_system,
+)
+from kloppy.exceptions import DeserializationError, SerializationError
+
+# The key of the kloppy metadata in the key-value metadata of a file
+METADATA_KEY = b"kloppy"
+
+# Version of the layout of the files, increased on incompatible changes
+FORMAT_VERSION = 1
+
+
+def encode_value(value: Any) -> Any:
+    """Encode `value` as JSON compatible value. Timedeltas and datetimes
+    are tagged, so they are decoded to the same type."""
+    if isinstance(value, timedelta):
+        return {"__timedelta__": value // timedelta(microseconds=1)}
+    elif isinstance(value, datetime):
+        return {"__datetime__": value.isoformat()}
+    elif isinstance(value, dict):
+        return {str(key): encode_value(item) for key, item in value.items()}
+    elif isinstance(value, (list, tuple)):
+        return [encode_value(item) for item in value]
+    elif value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    else:
+        return str(value)
+
+
+def decode_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        if "__timedelta__" in value:
+            return timedelta(microseconds=value["__timedelta__"])
+        elif "__datetime__" in value:
+            return datetime.fromisoformat(value["__datetime__"])
+        return {key: decode_value(item) for key, item in value.items()}
+    elif isinstance(value, list):
+        return [decode_value(item) for item in value]
+    return value
+
+
+def _encode_position(position: Optional[Position]) -> Any:
+    if not isinstance(position, Position):
+        # Some providers store the position as it is in the data
+        return encode_value(position)
+    return {
+        "position_id": position.position_id,
+        "name": position.name,
+        "coordinates": [position.coordinates.x, position.coordinates.y]
+        if position.coordinates
+        else None,
+    }
+
+
+def _decode_position(data: Any) -> Optional[Position]:
+    if not isinstance(data, dict):
+        return data
+    return Position(
+        position_id=data["position_id"],
+        name=data["name"],
+        coordinates=Point(*data["coordinates"])
+        if data["coordinates"]
+        else None,
+    )
+
+
+def encode_player(player: Player) -> Dict:
+    return {
+        "player_id": player.player_id,
+        "team_id": player.team.team_id if player.team else None,
+        "jersey_no": player.jersey_no,
+        "name": player.name,
+        "first_name": player.first_name,
+        "last_name": player.last_name,
+        "starting": player.starting,
+        "position": _encode_position(player.position),
+        "attributes": encode_value(player.attributes),
+    }
+
+
+def decode_player(data: Dict, team: Optional[Team]) -> Player:
+    return Player(
+        player_id=data["player_id"],
+        team=team,
+        jersey_no=data["jersey_no"],
+        name=data["name"],
+        first_name=data["first_name"],
+        last_name=data["last_name"],
+        starting=data["starting"],
+        position=_decode_position(data["position"]),
+        attributes=decode_value(data["attributes"]) or {},
+    )
+
+
+def encode_period(period: Period) -> Dict:
+    return {
+        "id": period.id,
+        "start_timestamp": encode_value(period.start_timestamp),
+        "end_timestamp": encode_value(period.end_timestamp),
+    }
+
+
+def decode_period(data: Dict) -> Period:
+    return Period(
+        id=data["id"],
+        start_timestamp=decode_value(data["start_timestamp"]),
+        end_timestamp=decode_value(data["end_timestamp"]),
+    )
+
+
+def _encode_team(team: Team) -> Dict:
+    return {
+        "team_id": team.team_id,
+        "name": team.name,
+        "ground": team.ground.value,
+        "starting_formation": team.starting_formation.name
+        if team.starting_formation
+        else None,
+        "players": [encode_player(player) for player in team.players],
+    }
+
+
+def _decode_team(data: Dict) -> Team:
+    team = Team(
+        team_id=data["team_id"],
+        name=data["name"],
+        ground=Ground(data["ground"]),
+        starting_formation=FormationType[data["starting_formation"]]
+        if data["starting_formation"]
+        else None,
+    )
+    team.players = [decode_player(player, team) for player in data["players"]]
+    return team
+
+
+def encode_metadata(metadata: Metadata, dataset_type: DatasetType) -> Dict:
+    coordinate_system = metadata.coordinate_system
+    if coordinate_system is not None:
+        # Only the coordinate systems of the providers can be rebuilt
+        try:
+            rebuilt_coordinate_system = build_coordinate_system(
+                coordinate_system.provider,
+                dataset_type,
+                pitch_length=coordinate_system.pitch_length,
+                pitch_width=coordinate_system.pitch_width,
+            )
+        except (ValueError, AssertionError):
+            rebuilt_coordinate_system = None
+        if type(rebuilt_coordinate_system) is not type(coordinate_system):
+            raise SerializationError(
+                f"Coordinate system {type(coordinate_system).__name__} can't "
+                f"be serialized"
+            )
+
+    periods = metadata.periods
+    periods_by_id = isinstance(periods, dict)
+    if periods_by_id:
+        # Some deserializers keep the periods by id
+        periods = list(periods.values())
+
+    return {
+        "teams": [_encode_team(team) for team in metadata.teams],
+        "periods": [encode_period(period) for period in periods],
+        "periods_by_id": periods_by_id,
+        "orientation": metadata.orientation.name
+        if metadata.orientation
+        else None,
+        "flags": metadata.flags.value if metadata.flags else 0,
+        "provider": metadata.provider.value if metadata.provider else None,
+        "coordinate_system": {
+            "provider": coordinate_system.provider.value,
+            "pitch_length": coordinate_system.pitch_length,
+            "pitch_width": coordinate_system.pitch_width,
+        }
+        if coordinate_system
+        else None,
+        "score": {"home": metadata.score.home, "away": metadata.score.away}
+        if metadata.score
+        else None,
+        "frame_rate": metadata.frame_rate,
+        "attributes": encode_value(metadata.attributes),
+    }
+
+
+def decode_metadata(data: Dict, dataset_type: DatasetType) -> Metadata:
+    coordinate_system = None
+    if data["coordinate_system"]:
+        coordinate_system = build_coordinate_system(
+            Provider(data["coordinate_system"]["provider"]),
+            dataset_type,
+            pitch_length=data["coordinate_system"]["pitch_length"],
+            pitch_width=data["coordinate_system"]["pitch_width"],
+        )
+
+    periods = [decode_period(period) for period in data["periods"]]
+    if data.get("periods_by_id"):
+        periods = {period.id: period for period in periods}
+
+    return Metadata(
+        teams=[_decode_team(team) for team in data["teams"]],
+        periods=periods,
+        pitch_dimensions=coordinate_system.pitch_dimensions
+        if coordinate_system
+        else None,
+        orientation=Orientation[data["orientation"]]
+        if data["orientation"]
+        else None,
+        flags=DatasetFlag(data["flags"]),
+        provider=Provider(data["provider"]) if data["provider"] else None,
+        coordinate_system=coordinate_system,
+        score=Score(**data["score"]) if data["score"] else None,
+        frame_rate=data["frame_rate"],
+        attributes=decode_value(data["attributes"]) or {},
+    )
+
+
+def dumps(dataset_type: DatasetType, metadata: Metadata, **extra) -> bytes:
+    """Encode the metadata, and the `extra` values needed to read the
+    records, for the key-value metadata of a file."""
+    from kloppy import __version__
+
+    return json.dumps(
+        {
+            "format_version": FORMAT_VERSION,
+            "kloppy_version": __version__,
+            "dataset_type": dataset_type.value,
+            "metadata": encode_metadata(metadata, dataset_type),
+            **extra,
+        },
+        # Values like the lxml elements of some providers are stored as
+        # strings
+        default=str,
+    ).encode("utf8")
+
+
+def loads(
+    key_value_metadata: Optional[Dict[bytes, bytes]],
+    dataset_type: DatasetType,
+) -> Dict:
+    """Decode the kloppy metadata of a file. The decoded `Metadata` is
+    stored under "metadata"."""
+    if not key_value_metadata or METADATA_KEY not in key_value_metadata:
+        raise DeserializationError("The file was not written by kloppy")
+
+    data = json.loads(key_value_metadata[METADATA_KEY])
+    if data["format_version"] > FORMAT_VERSION:
+        raise DeserializationError(
+            f"The file was written by a newer version of kloppy "
+            f"({data['kloppy_version']})"
+        )
+    if data["dataset_type"] != dataset_type.value:
+        raise DeserializationError(
+            f"The file contains a {data['dataset_type'].lower()} dataset, "
+            f"not a {dataset_type.value.lower()} dataset"
+        )
+
+    data["metadata"] = decode_metadata(data["metadata"], dataset_type)
+    return data
+
+
+def find_players(metadata: Metadata, players: List[Dict]) -> List[Player]:
+    """Return the players of the metadata for the encoded `players`. Players
+    that are not part of a team of the metadata are decoded."""
+    teams = {team.team_id: team for team in metadata.teams}
+    result = []
+    for data in players:
+        team = teams.get(data["team_id"])
+        player = team.get_player_by_id(data["player_id"]) if team else None
+        if player is None:
+            player = decode_player(data, team)
+        result.append(player)
+    return result
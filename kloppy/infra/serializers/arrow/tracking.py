@@ -0,0 +1,267 @@
+"""
+Write tracking datasets to Parquet or Arrow IPC files and read them back.
+
+The columns mirror the arrays of
+[`ColumnarFrames`][kloppy.domain.models.tracking.ColumnarFrames]: one row
+per frame, with the values of all players in fixed size list columns. The
+metadata, and the players of the player axis, are stored in the key-value
+metadata of the file.
+
+Arrow IPC files are memory mapped when reading, and the columns are used as
+the arrays of the loaded `ColumnarFrames` without copying them.
+"""
+import json
+import logging
+from typing import IO, Any, Dict, List, Optional, Union
+
+from kloppy.domain import (
+    ColumnarFrames,
+    DatasetType,
+    TrackingDataset,
+)
+from kloppy.utils import performance_logging
+
+from . import metadata as metadata_serializer
+from .common import (
+    TIMESTAMP_UNIT,
+    column_to_array,
+    import_pyarrow,
+    read_table,
+    write_table,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _dumps_other_data(other_data: Optional[Dict]) -> Optional[str]:
+    if not other_data:
+        return None
+    return json.dumps(metadata_serializer.encode_value(dict(other_data)))
+
+
+def _loads_other_data(value: Optional[str]) -> Optional[Dict]:
+    if value is None:
+        return None
+    return metadata_serializer.decode_value(json.loads(value))
+
+
+class TrackingDataArrowSerializer:
+    def to_table(self, dataset: TrackingDataset):
+        """Convert the dataset to an Arrow table."""
+        pa = import_pyarrow()
+        import numpy as np
+
+        frames = dataset.to_columnar().records
+        n_players = len(frames.players)
+
+        def _fixed_size_list(values, list_size: int):
+            return pa.FixedSizeListArray.from_arrays(
+                pa.array(np.ascontiguousarray(values).reshape(-1)), list_size
+            )
+
+        def _dictionary(indices, dictionary: List[str]):
+            return pa.DictionaryArray.from_arrays(
+                pa.array(indices, mask=indices < 0),
+                pa.array(dictionary, type=pa.string()),
+            )
+
+        period_ids = np.array(
+            [period.id for period in frames.periods] or [0], dtype=np.int16
+        )
+        period_index = frames.period_index
+
+        columns = {
+            "frame_id": pa.array(frames.frame_id),
+            "timestamp": pa.array(
+                frames.timestamp.astype(f"timedelta64[{TIMESTAMP_UNIT}]")
+            ),
+            "period_id": pa.array(
+                period_ids[np.maximum(period_index, 0)],
+                mask=period_index < 0,
+            ),
+            "ball_state": _dictionary(
+                frames.ball_state,
+                [ball_state.value for ball_state in frames._ball_states],
+            ),
+            "ball_owning_team": _dictionary(
+                frames.ball_owning_team,
+                [str(team.team_id) for team in frames.teams],
+            ),
+            "ball_coordinates": _fixed_size_list(frames.ball_coordinates, 3),
+            "ball_mask": pa.array(frames.ball_mask),
+            "ball_speed": pa.array(frames.ball_speed),
+            "player_coordinates": _fixed_size_list(
+                frames.player_coordinates, 2 * n_players
+            ),
+            "player_speed": _fixed_size_list(frames.player_speed, n_players),
+            "player_distance": _fixed_size_list(
+                frames.player_distance, n_players
+            ),
+            "player_mask": _fixed_size_list(frames.player_mask, n_players),
+            "other_data": pa.array(
+                [
+                    _dumps_other_data(other_data)
+                    for other_data in frames._frame_other_data
+                ],
+                type=pa.string(),
+            ),
+            "player_other_data": pa.array(
+                [
+                    _dumps_other_data(other_data)
+                    for other_data in frames._player_other_data
+                ],
+                type=pa.string(),
+            ),
+        }
+
+        table = pa.table(columns)
+        return table.replace_schema_metadata(
+            {
+                metadata_serializer.METADATA_KEY: metadata_serializer.dumps(
+                    DatasetType.TRACKING,
+                    dataset.metadata,
+                    periods=[
+                        metadata_serializer.encode_period(period)
+                        for period in frames.periods
+                    ],
+                    players=[
+                        metadata_serializer.encode_player(player)
+                        for player in frames.players
+                    ],
+                    ball_3d=frames._ball_3d,
+                )
+            }
+        )
+
+    def serialize(
+        self,
+        dataset: TrackingDataset,
+        output: Union[str, IO[bytes]],
+        format: str = "parquet",
+    ):
+        """Write the dataset to `output`, a path or a binary file."""
+        with performance_logging("serialize", logger=logger):
+            write_table(self.to_table(dataset), output, format)
+
+
+class TrackingDataArrowDeserializer:
+    def from_table(self, table) -> TrackingDataset:
+        """Convert an Arrow table written by the serializer to a dataset.
+
+        The numeric columns are used without copying them, when they consist
+        of a single chunk.
+        """
+        pa = import_pyarrow()
+        import numpy as np
+
+        data = metadata_serializer.loads(
+            table.schema.metadata, DatasetType.TRACKING
+        )
+        metadata = data["metadata"]
+        players = metadata_serializer.find_players(metadata, data["players"])
+        n_players = len(players)
+        n_frames = table.num_rows
+
+        # The periods of the metadata, for the periods that are part of it
+        metadata_periods = metadata.periods
+        if isinstance(metadata_periods, dict):
+            metadata_periods = list(metadata_periods.values())
+        periods_by_id = {period.id: period for period in metadata_periods}
+        periods = [
+            periods_by_id.get(period.id, period)
+            for period in map(
+                metadata_serializer.decode_period, data["periods"]
+            )
+        ]
+
+        def _array(name: str):
+            return column_to_array(table, name)
+
+        def _numpy(name: str, shape=None):
+            array = _array(name)
+            if isinstance(array, pa.FixedSizeListArray):
+                array = array.flatten()
+            values = array.to_numpy(zero_copy_only=False)
+            return values.reshape(shape) if shape else values
+
+        def _indices(name: str, dictionary: List[Any]):
+            """Indices into `dictionary` of the values of a dictionary
+            column, -1 for null."""
+            array = _array(name)
+            lookup = np.array(
+                [
+                    dictionary.index(value) if value in dictionary else -1
+                    for value in array.dictionary.to_pylist()
+                ]
+                or [-1],
+                dtype=np.int8,
+            )
+            indices = array.indices.fill_null(-1).to_numpy()
+            return np.where(indices >= 0, lookup[indices], -1).astype(np.int8)
+
+        # Map the period ids to indices into `periods`
+        period_ids = _array("period_id").fill_null(-1).to_numpy()
+        period_lookup = np.full(
+            max([period.id for period in periods] + [0]) + 1, -1, np.int16
+        )
+        for i, period in enumerate(periods):
+            period_lookup[period.id] = i
+        period_index = np.where(
+            (period_ids >= 0) & (period_ids < len(period_lookup)),
+            period_lookup[np.clip(period_ids, 0, len(period_lookup) - 1)],
+            -1,
+        ).astype(np.int16)
+
+        teams = list(metadata.teams)
+        frames = ColumnarFrames.from_arrays(
+            frame_id=_numpy("frame_id"),
+            timestamp=_numpy("timestamp").view(np.int64),
+            period_index=period_index,
+            ball_state=_indices(
+                "ball_state",
+                [
+                    ball_state.value
+                    for ball_state in ColumnarFrames._ball_states
+                ],
+            ),
+            ball_owning_team=_indices(
+                "ball_owning_team", [str(team.team_id) for team in teams]
+            ),
+            ball_coordinates=_numpy("ball_coordinates", (n_frames, 3)),
+            ball_mask=_numpy("ball_mask"),
+            ball_speed=_numpy("ball_speed"),
+            player_coordinates=_numpy(
+                "player_coordinates", (n_frames, n_players, 2)
+            ),
+            player_speed=_numpy("player_speed", (n_frames, n_players)),
+            player_distance=_numpy("player_distance", (n_frames, n_players)),
+            player_mask=_numpy("player_mask", (n_frames, n_players)),
+            periods=periods,
+            teams=teams,
+            players=players,
+            ball_3d=data["ball_3d"],
+            frame_other_data=[
+                _loads_other_data(value)
+                for value in _array("other_data").to_pylist()
+            ],
+            player_other_data=[
+                {int(j): value for j, value in other_data.items()}
+                if other_data
+                else None
+                for other_data in map(
+                    _loads_other_data,
+                    _array("player_other_data").to_pylist(),
+                )
+            ],
+        )
+        return TrackingDataset(records=frames, metadata=metadata)
+
+    def deserialize(
+        self,
+        input: Union[str, IO[bytes]],
+        format: str = "parquet",
+    ) -> TrackingDataset:
+        """Read a dataset from `input`, a path or a binary file. Arrow IPC
+        files at a path are memory mapped."""
+        with performance_logging("deserialize", logger=logger):
+            return self.from_table(read_table(input, format))
@@ -1,4 +1,3 @@
-import json
 import logging
 from datetime import timedelta, datetime, timezone
 from dataclasses import replace
@@ -39,6 +38,7 @@ from kloppy.domain import (
 from kloppy.exceptions import DeserializationError
 from kloppy.infra.serializers.event.deserializer import EventDataDeserializer
 from kloppy.utils import Readable, performance_logging
+from kloppy.infra.serializers import json_backend
 
 
 logger = logging.getLogger(__name__)
@@ -360,7 +360,7 @@ class DatafactoryDeserializer(EventDataDeserializer[DatafactoryInputs]):
         transformer = self.get_transformer()
 
         with performance_logging("load data", logger=logger):
-            data = json.load(inputs.event_data)
+            data = json_backend.load(inputs.event_data)
             match = data["match"]
             score_data = data["scoreStatus"]
             incidences = data["incidences"]
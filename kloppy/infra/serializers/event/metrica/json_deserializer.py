@@ -1,5 +1,4 @@
 import logging
-import json
 from dataclasses import replace
 from datetime import timedelta
 from typing import Dict, List, NamedTuple, IO, Optional
@@ -28,6 +27,7 @@ from kloppy.infra.serializers.tracking.metrica_epts.metadata import (
     DeserializationError,
 )
 from kloppy.utils import performance_logging
+from kloppy.infra.serializers import json_backend
 
 logger = logging.getLogger(__name__)
 
@@ -258,7 +258,7 @@ class MetricaJsonEventDataDeserializer(
 
     def deserialize(self, inputs: MetricaJsonEventDataInputs) -> EventDataset:
         with performance_logging("load data", logger=logger):
-            raw_events = json.load(inputs.event_data)
+            raw_events = json_backend.load(inputs.event_data)
             metadata = load_metadata(
                 inputs.meta_data, provider=Provider.METRICA
             )
@@ -1,9 +1,9 @@
 import math
-from typing import Tuple, Dict, List, NamedTuple, IO, Optional
+from typing import Tuple, Dict, Iterator, List, NamedTuple, IO, Optional
 import logging
 from datetime import datetime
 import pytz
-from lxml import objectify
+from lxml import etree, objectify
 from lxml.objectify import ObjectifiedElement
 
 from kloppy.domain import (
@@ -688,6 +688,40 @@ class OptaInputs(NamedTuple):
     f24_data: IO[bytes]
 
 
+def _iter_event_elms(
+    f24_data: IO[bytes],
+) -> Iterator[Tuple[ObjectifiedElement, Optional[ObjectifiedElement]]]:
+    """Yield the Event elements of the F24 feed (except the deleted ones)
+    together with the Event element that follows it.
+
+    The feed is read with iterparse and an element is removed from the tree
+    as soon as the next one is yielded. Only the elements that are kept as
+    `raw_event` stay in memory, instead of the whole document.
+    """
+    elms = etree.iterparse(f24_data, tag="Event")
+    elms.set_element_class_lookup(objectify.ObjectifyElementClassLookup())
+
+    event_elm = None
+    for _, next_event_elm in elms:
+        if int(next_event_elm.attrib["type_id"]) == EVENT_TYPE_DELETED_EVENT:
+            _remove_elm(next_event_elm)
+            continue
+
+        if event_elm is not None:
+            yield event_elm, next_event_elm
+            _remove_elm(event_elm)
+        event_elm = next_event_elm
+
+    if event_elm is not None:
+        yield event_elm, None
+
+
+def _remove_elm(elm: ObjectifiedElement):
+    parent = elm.getparent()
+    if parent is not None:
+        parent.remove(elm)
+
+
 class OptaDeserializer(EventDataDeserializer[OptaInputs]):
     @property
     def provider(self) -> Provider:
@@ -698,7 +732,6 @@ class OptaDeserializer(EventDataDeserializer[OptaInputs]):
 
         with performance_logging("load data", logger=logger):
             f7_root = objectify.fromstring(inputs.f7_data.read())
-            f24_root = objectify.fromstring(inputs.f24_data.read())
 
         with performance_logging("parse data", logger=logger):
             matchdata_path = objectify.ObjectPath(
@@ -734,21 +767,9 @@ class OptaDeserializer(EventDataDeserializer[OptaInputs]):
             if len(home_team.players) == 0 or len(away_team.players) == 0:
                 raise DeserializationError("LineUp incomplete")
 
-            game_elm = f24_root.find("Game")
-
             possession_team = None
             events = []
-            events_list = [
-                event
-                for event in list(game_elm.iterchildren("Event"))
-                if int(event.attrib["type_id"]) != EVENT_TYPE_DELETED_EVENT
-            ]
-            for idx, event_elm in enumerate(events_list):
-                next_event_elm = (
-                    events_list[idx + 1]
-                    if (idx + 1) < len(events_list)
-                    else None
-                )
+            for event_elm, next_event_elm in _iter_event_elms(inputs.f24_data):
                 event_id = event_elm.attrib["id"]
                 type_id = int(event_elm.attrib["type_id"])
                 timestamp = _parse_f24_datetime(event_elm.attrib["timestamp"])
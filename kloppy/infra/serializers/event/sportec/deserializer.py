@@ -1,9 +1,9 @@
 from collections import OrderedDict
-from typing import Dict, List, NamedTuple, IO
+from typing import Dict, Iterator, List, NamedTuple, IO
 from datetime import timedelta, datetime, timezone
 import logging
 from dateutil.parser import parse
-from lxml import objectify
+from lxml import etree, objectify
 
 from kloppy.domain import (
     EventDataset,
@@ -248,6 +248,27 @@ SPORTEC_EVENT_BODY_PART_LEFT_FOOT = "leftLeg"
 SPORTEC_EVENT_BODY_PART_RIGHT_FOOT = "rightLeg"
 
 
+def _iter_event_chains(event_data: IO[bytes]) -> Iterator[OrderedDict]:
+    """Read the Event elements one at a time with iterparse and yield their
+    event chain. Elements are cleared once they are read, so the document
+    is never fully kept in memory."""
+    event_elms = etree.iterparse(event_data, tag="Event")
+    event_elms.set_element_class_lookup(
+        objectify.ObjectifyElementClassLookup()
+    )
+    for _, event_elm in event_elms:
+        parent = event_elm.getparent()
+        if parent is None or parent.getparent() is not None:
+            # Only the Events of the root element
+            continue
+
+        chain = _event_chain_from_xml_elm(event_elm)
+        event_elm.clear(keep_tail=True)
+        while event_elm.getprevious() is not None:
+            parent.remove(event_elm.getprevious())
+        yield chain
+
+
 def _parse_datetime(dt_str: str) -> datetime:
     return parse(dt_str).astimezone(timezone.utc)
 
@@ -401,7 +422,6 @@ class SportecEventDataDeserializer(
     def deserialize(self, inputs: SportecEventDataInputs) -> EventDataset:
         with performance_logging("load data", logger=logger):
             match_root = objectify.fromstring(inputs.meta_data.read())
-            event_root = objectify.fromstring(inputs.event_data.read())
 
         with performance_logging("parse data", logger=logger):
             sportec_metadata = sportec_metadata_from_xml_elm(match_root)
@@ -415,8 +435,7 @@ class SportecEventDataDeserializer(
             period_id = 0
             events = []
 
-            for event_elm in event_root.iterchildren("Event"):
-                event_chain = _event_chain_from_xml_elm(event_elm)
+            for event_chain in _iter_event_chains(inputs.event_data):
                 timestamp = _parse_datetime(event_chain["Event"]["EventTime"])
 
                 if (
@@ -1,6 +1,5 @@
 from typing import NamedTuple, IO, Optional
 import logging
-import json
 from itertools import zip_longest
 
 from kloppy.domain import (
@@ -19,6 +18,7 @@ from kloppy.domain import (
 from kloppy.exceptions import DeserializationError
 from kloppy.infra.serializers.event.deserializer import EventDataDeserializer
 from kloppy.utils import performance_logging
+from kloppy.infra.serializers import json_backend
 from . import specification as SB
 from .helpers import parse_freeze_frame, parse_str_ts
 
@@ -124,7 +124,7 @@ class StatsBombDeserializer(EventDataDeserializer[StatsBombInputs]):
     def load_data(self, inputs: StatsBombInputs):
         raw_events = {}
         shot_fidelity_version, xy_fidelity_version = 1, 1
-        for event in json.load(inputs.event_data):
+        for event in json_backend.load(inputs.event_data):
             # load the event
             raw_events[event["id"]] = SB.event_decoder(event)
             # determine the fidelity version
@@ -147,12 +147,12 @@ class StatsBombDeserializer(EventDataDeserializer[StatsBombInputs]):
             xy_fidelity_version=xy_fidelity_version,
         )
 
-        lineups = json.load(inputs.lineup_data)
+        lineups = json_backend.load(inputs.lineup_data)
 
         three_sixty_data = (
             {
                 item["event_uuid"]: item
-                for item in json.load(inputs.three_sixty_data)
+                for item in json_backend.load(inputs.three_sixty_data)
             }
             if inputs.three_sixty_data
             else {}
@@ -1,4 +1,3 @@
-import json
 import logging
 from dataclasses import replace
 from datetime import timedelta
@@ -35,6 +34,7 @@ from kloppy.domain import (
     Team,
 )
 from kloppy.utils import performance_logging
+from kloppy.infra.serializers import json_backend
 
 from . import wyscout_events, wyscout_tags
 from ..deserializer import EventDataDeserializer
@@ -479,7 +479,7 @@ class WyscoutDeserializerV2(EventDataDeserializer[WyscoutInputs]):
         transformer = self.get_transformer()
 
         with performance_logging("load data", logger=logger):
-            raw_events = json.load(inputs.event_data)
+            raw_events = json_backend.load(inputs.event_data)
             for event in raw_events["events"]:
                 if "eventId" not in event:
                     event["eventId"] = event["eventName"]
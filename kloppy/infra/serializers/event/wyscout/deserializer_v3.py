@@ -1,4 +1,3 @@
-import json
 import logging
 from dataclasses import replace
 from datetime import timedelta
@@ -46,6 +45,7 @@ from kloppy.domain import (
 )
 from kloppy.exceptions import DeserializationError
 from kloppy.utils import performance_logging
+from kloppy.infra.serializers import json_backend
 
 from ..deserializer import EventDataDeserializer
 from .deserializer_v2 import WyscoutInputs
@@ -469,7 +469,7 @@ class WyscoutDeserializerV3(EventDataDeserializer[WyscoutInputs]):
         transformer = self.get_transformer()
 
         with performance_logging("load data", logger=logger):
-            raw_events = json.load(inputs.event_data)
+            raw_events = json_backend.load(inputs.event_data)
             for event in raw_events["events"]:
                 if "id" not in event:
                     event["id"] = event["type"]["primary"]
@@ -0,0 +1,237 @@
+"""
+Decode JSON with the backend selected by the `json.backend` config.
+
+orjson, ujson and simdjson are a lot faster than the json module of the
+standard library. With the default `auto` backend the first one of them that
+is installed is used, falling back to the standard library otherwise.
+"""
+import codecs
+import json
+import re
+from typing import IO, Any, Callable, Dict, Iterator, Union
+
+from kloppy.config import get_config
+from kloppy.exceptions import KloppyParameterError
+
+# The order in which the `auto` backend tries the backends
+AUTO_BACKENDS = ["orjson", "ujson", "simdjson"]
+
+_loads_functions: Dict[str, Callable[[Union[str, bytes]], Any]] = {}
+
+
+def _import_loads(backend: str) -> Callable[[Union[str, bytes]], Any]:
+    if backend == "json":
+        return json.loads
+    elif backend == "orjson":
+        import orjson
+
+        return orjson.loads
+    elif backend == "ujson":
+        import ujson
+
+        return ujson.loads
+    elif backend == "simdjson":
+        import simdjson
+
+        return simdjson.loads
+    else:
+        raise KloppyParameterError(f"JSON backend {backend} is not valid")
+
+
+def get_loads() -> Callable[[Union[str, bytes]], Any]:
+    """Return the `loads` function of the configured JSON backend."""
+    backend = get_config("json.backend") or "auto"
+    if backend not in _loads_functions:
+        if backend == "auto":
+            for auto_backend in AUTO_BACKENDS:
+                try:
+                    _loads_functions[backend] = _import_loads(auto_backend)
+                    break
+                except ImportError:
+                    pass
+            else:
+                _loads_functions[backend] = json.loads
+        else:
+            try:
+                _loads_functions[backend] = _import_loads(backend)
+            except ImportError:
+                raise ImportError(
+                    f"Seems like you don't have {backend} installed. Please"
+                    f" install it using: pip install {backend}"
+                )
+    return _loads_functions[backend]
+
+
+def loads(s: Union[str, bytes]) -> Any:
+    """Decode the JSON document `s`.
+
+    The fast backends are stricter than the standard library (they don't
+    accept `NaN` for example), so documents they reject are decoded again with
+    the standard library. This way the result, or the error, is the same for
+    every backend.
+    """
+    loads_ = get_loads()
+    if loads_ is json.loads:
+        return json.loads(s)
+
+    try:
+        return loads_(s)
+    except ValueError:
+        return json.loads(s)
+
+
+def load(fp: IO) -> Any:
+    """Decode the JSON document in the (binary or text) file `fp`."""
+    return loads(fp.read())
+
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+# Characters that can continue a number
+_NUMBER_CONTINUATION = re.compile(r"[0-9.eE+\-]*")
+
+# Number of characters read at once by `iter_array_items`
+CHUNK_SIZE = 1 << 16
+
+
+class _IncrementalReader:
+    """Decode the values of a JSON document one at a time while reading
+    the (binary or text) file in chunks."""
+
+    def __init__(self, fp: IO, chunk_size: int):
+        self.fp = fp
+        self.chunk_size = chunk_size
+        self.decoder = json.JSONDecoder()
+        self.text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self.buffer = ""
+        self.position = 0
+        self.eof = False
+
+    def _read(self):
+        while True:
+            chunk = self.fp.read(self.chunk_size)
+            if not chunk:
+                self.eof = True
+            if isinstance(chunk, bytes):
+                # Empty when the chunk ends within a multi-byte character
+                chunk = self.text_decoder.decode(chunk, final=self.eof)
+            if chunk or self.eof:
+                break
+
+        # Drop the part of the buffer that has been decoded already
+        self.buffer = self.buffer[self.position :] + chunk
+        self.position = 0
+
+    def _skip_whitespace(self):
+        while True:
+            self.position = _WHITESPACE.match(self.buffer, self.position).end()
+            if self.position < len(self.buffer) or self.eof:
+                return
+            self._read()
+
+    def next_char(self) -> str:
+        """Return and consume the next structural character."""
+        self._skip_whitespace()
+        if self.position >= len(self.buffer):
+            raise json.JSONDecodeError(
+                "Unexpected end of document", self.buffer, self.position
+            )
+        char = self.buffer[self.position]
+        self.position += 1
+        return char
+
+    def expect(self, expected: str):
+        char = self.next_char()
+        if char != expected:
+            raise json.JSONDecodeError(
+                f"Expecting '{expected}'", self.buffer, self.position - 1
+            )
+
+    def peek(self) -> str:
+        self._skip_whitespace()
+        return self.buffer[self.position : self.position + 1]
+
+    def decode(self) -> Any:
+        """Decode the next value."""
+        self._skip_whitespace()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(
+                    self.buffer, self.position
+                )
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            else:
+                # A number is only complete when it is followed by a
+                # delimiter, otherwise it might continue in the next chunk
+                if (
+                    self.eof
+                    or not isinstance(value, (int, float))
+                    or isinstance(value, bool)
+                    or not _NUMBER_CONTINUATION.fullmatch(self.buffer, end)
+                ):
+                    self.position = end
+                    return value
+            self._read()
+
+
+def _iter_array(reader: _IncrementalReader) -> Iterator[Any]:
+    reader.expect("[")
+    if reader.peek() == "]":
+        reader.next_char()
+        return
+
+    while True:
+        yield reader.decode()
+        char = reader.next_char()
+        if char == "]":
+            return
+        elif char != ",":
+            raise json.JSONDecodeError(
+                "Expecting ',' delimiter",
+                reader.buffer,
+                reader.position - 1,
+            )
+
+
+def iter_items(fp: IO, chunk_size: int = CHUNK_SIZE) -> Iterator[Any]:
+    """Decode the items of the top level array in `fp` one at a time.
+
+    Only one item at a time is kept in memory, instead of the decoded
+    document.
+    """
+    reader = _IncrementalReader(fp, chunk_size)
+    yield from _iter_array(reader)
+
+
+def iter_array_items(
+    fp: IO, key: str, chunk_size: int = CHUNK_SIZE
+) -> Iterator[Any]:
+    """Decode the items of the array `key` of the top level object in `fp`
+    one at a time.
+
+    Only one item at a time is kept in memory, instead of the decoded
+    document. The other values of the top level object are skipped.
+    """
+    reader = _IncrementalReader(fp, chunk_size)
+    reader.expect("{")
+    if reader.peek() == "}":
+        raise KeyError(key)
+
+    while True:
+        name = reader.decode()
+        reader.expect(":")
+        if name == key:
+            yield from _iter_array(reader)
+            return
+        else:
+            reader.decode()
+
+        char = reader.next_char()
+        if char == "}":
+            raise KeyError(key)
+        elif char != ",":
+            raise json.JSONDecodeError(
+                "Expecting ',' delimiter", reader.buffer, reader.position - 1
+            )
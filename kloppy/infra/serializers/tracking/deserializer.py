@@ -1,31 +1,79 @@
+import warnings
 from abc import ABC, abstractmethod
-from typing import Generic, TypeVar, Optional, Union
+from typing import (
+    IO,
+    Callable,
+    Generic,
+    TypeVar,
+    Optional,
+    Union,
+    List,
+    Iterable,
+    Iterator,
+    Tuple,
+)
 
 from kloppy.domain import (
+    AttackingDirection,
     Provider,
     TrackingDataset,
+    TrackingDataStream,
     DatasetTransformer,
     DatasetTransformerBuilder,
     DatasetType,
+    ColumnarFrames,
+    Frame,
+    Orientation,
+    Period,
+    Team,
+    attacking_direction_from_frame,
 )
+from kloppy.exceptions import KloppyParameterError
+
+from .projection import ObjectProjection
+from .sampling import Sampler
+from .window import FrameWindow, Timestamp
 
 T = TypeVar("T")
 
 
+def _prepend(
+    consumed_frames: List[Frame], frames: Iterator[Frame]
+) -> Iterator[Frame]:
+    # A generator (instead of `itertools.chain`) so closing it also closes
+    # the underlying frames generator.
+    yield from consumed_frames
+    yield from frames
+
+
 class TrackingDataDeserializer(ABC, Generic[T]):
     def __init__(
         self,
         limit: Optional[int] = None,
         sample_rate: Optional[float] = None,
         coordinate_system: Optional[Union[str, Provider]] = None,
+        target_frame_rate: Optional[float] = None,
+        periods: Optional[List[int]] = None,
+        start: Optional[Timestamp] = None,
+        end: Optional[Timestamp] = None,
+        objects: Optional[List[str]] = None,
     ):
         if not limit:
             limit = 0
         self.limit = limit
 
+        if sample_rate and target_frame_rate:
+            raise KloppyParameterError(
+                "Specify either sample_rate or target_frame_rate, not both"
+            )
         if not sample_rate:
             sample_rate = 1.0
         self.sample_rate = sample_rate
+        self.target_frame_rate = target_frame_rate
+
+        self.periods = periods
+        self.window = FrameWindow(periods, start, end)
+        self.projection = ObjectProjection(objects)
 
         self.transformer_builder = DatasetTransformerBuilder(coordinate_system)
 
@@ -42,11 +90,137 @@ class TrackingDataDeserializer(ABC, Generic[T]):
             pitch_width=pitch_width,
         )
 
+    def get_sampler(self, frame_rate: Optional[float] = None) -> Sampler:
+        """Create the sampler that decides which frames to keep, based on
+        the `sample_rate` or the `target_frame_rate` (which requires the
+        `frame_rate` of the data)."""
+        if self.target_frame_rate:
+            if not frame_rate:
+                raise KloppyParameterError(
+                    "target_frame_rate is not supported when the frame rate "
+                    "of the data is unknown"
+                )
+            return Sampler.for_frame_rate(frame_rate, self.target_frame_rate)
+        return Sampler(self.sample_rate)
+
+    def create_frame_storage(
+        self,
+        periods: Optional[List[Period]] = None,
+        teams: Optional[List[Team]] = None,
+    ) -> Union[List[Frame], ColumnarFrames]:
+        """Create the container the deserialized frames are appended to.
+
+        Depends on the `tracking.storage` config: a plain list of frames,
+        or a `ColumnarFrames` storage that copies each appended frame
+        into NumPy arrays.
+        """
+        from kloppy.config import get_config
+
+        storage = get_config("tracking.storage")
+        if not storage or storage == "frames":
+            return []
+        elif storage == "columnar":
+            return ColumnarFrames(periods=periods, teams=teams)
+        else:
+            raise KloppyParameterError(
+                f"Tracking storage {storage} is not valid"
+            )
+
+    @staticmethod
+    def detect_orientation(
+        frames: Iterable[Frame],
+    ) -> Tuple[Orientation, Iterator[Frame]]:
+        """Determine the orientation from the first frame of the first period.
+
+        Frames are only consumed up to that frame. Returns the orientation
+        and an iterator over all frames, including the consumed ones.
+        """
+        frames = iter(frames)
+        consumed_frames = []
+        for frame in frames:
+            consumed_frames.append(frame)
+            if frame.period.id == 1:
+                orientation = (
+                    Orientation.HOME_AWAY
+                    if attacking_direction_from_frame(frame)
+                    == AttackingDirection.LTR
+                    else Orientation.AWAY_HOME
+                )
+                return orientation, _prepend(consumed_frames, frames)
+
+        warnings.warn(
+            "Could not determine orientation of dataset, defaulting to NOT_SET"
+        )
+        return Orientation.NOT_SET, iter(consumed_frames)
+
+    def detect_window_orientation(
+        self,
+        iter_frames: Callable[
+            [FrameWindow, ObjectProjection], Iterator[Frame]
+        ],
+        *raw_data: IO[bytes],
+    ) -> Tuple[Orientation, Iterator[Frame]]:
+        """Determine the orientation of the frames within the window.
+
+        `iter_frames` parses the frames within the window, with the objects
+        of the projection, it is passed. The orientation is defined by the
+        players of both teams in the first frame of the first period. When
+        the window excludes the first period, or the projection excludes
+        players, that frame is read separately, after which `raw_data` is
+        rewound to read the window.
+        """
+        if self.window.includes_period(1) and not self.projection:
+            return self.detect_orientation(
+                iter_frames(self.window, self.projection)
+            )
+
+        if not all(fp.seekable() for fp in raw_data):
+            if self.projection:
+                warnings.warn(
+                    "Could not determine orientation of dataset of which "
+                    "not all objects are loaded, defaulting to NOT_SET"
+                )
+                return Orientation.NOT_SET, iter_frames(
+                    self.window, self.projection
+                )
+            return self.detect_orientation(
+                iter_frames(self.window, self.projection)
+            )
+
+        raw_data_starts = [fp.tell() for fp in raw_data]
+        orientation, first_period_frames = self.detect_orientation(
+            iter_frames(FrameWindow([1]), ObjectProjection())
+        )
+        first_period_frames.close()
+        for fp, raw_data_start in zip(raw_data, raw_data_starts):
+            fp.seek(raw_data_start)
+
+        return orientation, iter_frames(self.window, self.projection)
+
     @property
     @abstractmethod
     def provider(self) -> Provider:
         raise NotImplementedError
 
-    @abstractmethod
-    def deserialize(self, inputs: T) -> TrackingDataset:
+    def iter_records(self, inputs: T) -> TrackingDataStream:
+        """Parse the metadata and return a stream that parses the frames
+        while it is iterated over."""
         raise NotImplementedError
+
+    def deserialize(self, inputs: T) -> TrackingDataset:
+        return self.create_dataset(self.iter_records(inputs))
+
+    def create_dataset(self, stream: TrackingDataStream) -> TrackingDataset:
+        """Consume all frames of `stream` into a dataset."""
+        periods = stream.metadata.periods
+        if isinstance(periods, dict):
+            # Some deserializers keep the periods by id
+            periods = list(periods.values())
+
+        frames = self.create_frame_storage(periods, stream.metadata.teams)
+        frames.extend(stream)
+
+        return TrackingDataset(
+            records=frames,
+            metadata=stream.metadata,
+        )
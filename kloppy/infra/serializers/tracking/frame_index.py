@@ -0,0 +1,174 @@
+import logging
+import os
+import struct
+from array import array
+from typing import Callable, IO, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+INDEX_SUFFIX = ".kloppy-idx"
+
+_MAGIC = b"KLPYIDX1"
+_HEADER = struct.Struct("<8sqqq")
+
+# Returns the (frame_id, period_id) of a line of raw data, or None when the
+# line does not contain a frame. Use period_id 0 when the raw data does not
+# contain the period.
+KeyFunction = Callable[[bytes], Optional[Tuple[int, int]]]
+
+
+class FrameIndex:
+    """
+    Byte offsets of the frames in a line based raw tracking data file.
+
+    The index makes it possible to seek directly to a frame range or period
+    instead of reading and splitting every line of the file. It's built once
+    and stored next to the raw data file (or the cached copy of a remote
+    file) with an `.kloppy-idx` suffix. The index is rebuilt when the size or
+    modification time of the raw data file changes.
+    """
+
+    def __init__(
+        self,
+        frame_ids: array,
+        period_ids: array,
+        offsets: array,
+        file_size: int,
+    ):
+        self.frame_ids = frame_ids
+        self.period_ids = period_ids
+        self.offsets = offsets
+        self.file_size = file_size
+
+    def __len__(self):
+        return len(self.frame_ids)
+
+    @classmethod
+    def build(cls, fp: IO[bytes], key: KeyFunction) -> "FrameIndex":
+        frame_ids = array("q")
+        period_ids = array("q")
+        offsets = array("q")
+
+        offset = 0
+        for line in fp:
+            result = key(line)
+            if result is not None:
+                frame_id, period_id = result
+                frame_ids.append(frame_id)
+                period_ids.append(period_id)
+                offsets.append(offset)
+            offset += len(line)
+
+        return cls(frame_ids, period_ids, offsets, offset)
+
+    @classmethod
+    def for_file(
+        cls, fp: IO[bytes], key: KeyFunction
+    ) -> Optional["FrameIndex"]:
+        """Load the index of the file `fp` was opened from, and build it
+        when it doesn't exist (or is outdated).
+
+        Returns None when `fp` is not a file on the local filesystem.
+        """
+        path = getattr(fp, "name", None)
+        if not isinstance(path, str) or not os.path.isfile(path):
+            return None
+
+        stat = os.stat(path)
+        index_path = path + INDEX_SUFFIX
+        try:
+            with open(index_path, "rb") as index_fp:
+                index = cls._read(index_fp, stat)
+            if index is not None:
+                return index
+        except (OSError, EOFError, struct.error):
+            pass
+
+        logger.info(f"Building frame index for {path}")
+        with open(path, "rb") as raw_fp:
+            index = cls.build(raw_fp, key)
+
+        try:
+            tmp_path = f"{index_path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as index_fp:
+                index._write(index_fp, stat)
+            os.replace(tmp_path, index_path)
+        except OSError:
+            logger.warning(f"Could not write frame index to {index_path}")
+
+        return index
+
+    @classmethod
+    def _read(
+        cls, fp: IO[bytes], stat: os.stat_result
+    ) -> Optional["FrameIndex"]:
+        magic, file_size, mtime_ns, count = _HEADER.unpack(
+            fp.read(_HEADER.size)
+        )
+        if (
+            magic != _MAGIC
+            or file_size != stat.st_size
+            or mtime_ns != stat.st_mtime_ns
+        ):
+            return None
+
+        frame_ids, period_ids, offsets = array("q"), array("q"), array("q")
+        for values in (frame_ids, period_ids, offsets):
+            values.fromfile(fp, count)
+        return cls(frame_ids, period_ids, offsets, file_size)
+
+    def _write(self, fp: IO[bytes], stat: os.stat_result):
+        fp.write(
+            _HEADER.pack(_MAGIC, stat.st_size, stat.st_mtime_ns, len(self))
+        )
+        for values in (self.frame_ids, self.period_ids, self.offsets):
+            values.tofile(fp)
+
+    def byte_ranges(
+        self,
+        frame_ranges: Optional[List[Tuple[int, int]]] = None,
+        period_ids: Optional[List[int]] = None,
+    ) -> List[Tuple[int, int]]:
+        """Return the (start, end) byte ranges that contain the frames within
+        one of the (inclusive) `frame_ranges` and one of the `period_ids`."""
+        byte_ranges = []
+        ends = self.offsets[1:]
+        ends.append(self.file_size)
+        for frame_id, period_id, start, end in zip(
+            self.frame_ids, self.period_ids, self.offsets, ends
+        ):
+            if period_ids is not None and period_id not in period_ids:
+                continue
+            if frame_ranges is not None and not any(
+                start_frame_id <= frame_id <= end_frame_id
+                for start_frame_id, end_frame_id in frame_ranges
+            ):
+                continue
+
+            if byte_ranges and byte_ranges[-1][1] == start:
+                byte_ranges[-1] = (byte_ranges[-1][0], end)
+            else:
+                byte_ranges.append((start, end))
+        return byte_ranges
+
+
+def iter_lines(
+    fp: IO[bytes], byte_ranges: Optional[List[Tuple[int, int]]] = None
+) -> Iterator[bytes]:
+    """Iterate over the lines of `fp`, or only the lines within
+    `byte_ranges` when given."""
+    if byte_ranges is None:
+        # Not `yield from fp`: closing this generator would close `fp` too
+        for line in fp:
+            yield line
+        return
+
+    for start, end in byte_ranges:
+        fp.seek(start)
+        position = start
+        while position < end:
+            line = fp.readline()
+            if not line:
+                break
+            position += len(line)
+            yield line
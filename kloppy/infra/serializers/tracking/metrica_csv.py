@@ -1,17 +1,25 @@
 import logging
+import math
 import warnings
-from collections import namedtuple
 from datetime import timedelta
-from typing import Tuple, Dict, Iterator, IO, NamedTuple
+from itertools import islice
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 from kloppy.domain import (
-    attacking_direction_from_frame,
-    TrackingDataset,
-    AttackingDirection,
+    TrackingDataStream,
     Frame,
     Point,
     Period,
-    Orientation,
     Provider,
     DatasetFlag,
     Metadata,
@@ -23,212 +31,385 @@ from kloppy.domain import (
 from kloppy.infra.serializers.tracking.deserializer import (
     TrackingDataDeserializer,
 )
-from kloppy.utils import Readable, performance_logging
+from kloppy.infra.serializers.tracking.projection import ObjectProjection
+from kloppy.infra.serializers.tracking.window import FrameWindow
+from kloppy.utils import performance_logging
 
+if TYPE_CHECKING:
+    import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# Number of lines of both team files that are decoded at once
+BATCH_SIZE = 1000
+
+
+def _create_frame(
+    row: List[float],
+    period: Period,
+    frame_id: int,
+    frame_rate: int,
+    player_columns: List[Tuple[Player, int]],
+    ball_column: Optional[int],
+) -> Frame:
+    """Create a frame from a joined row. `player_columns` are the players
+    with the column of their x coordinate, `ball_column` is the column of
+    the x coordinate of the ball, or None when the ball is not loaded."""
+    ball_coordinates = None
+    if ball_column is not None and not math.isnan(row[ball_column]):
+        ball_coordinates = Point(x=row[ball_column], y=row[ball_column + 1])
+
+    return Frame(
+        frame_id=frame_id,
+        timestamp=timedelta(seconds=frame_id / frame_rate)
+        - period.start_timestamp,
+        ball_coordinates=ball_coordinates,
+        players_data={
+            player: PlayerData(
+                coordinates=Point(x=row[column], y=row[column + 1])
+            )
+            for player, column in player_columns
+            # NaN when the player is not on the pitch
+            if not math.isnan(row[column])
+        },
+        period=period,
+        ball_state=None,
+        ball_owning_team=None,
+        other_data={},
+    )
+
 
 class MetricaCSVTrackingDataInputs(NamedTuple):
     home_data: IO[bytes]
     away_data: IO[bytes]
 
 
+def _read_team(data: IO[bytes], ground: Ground) -> Team:
+    """Read the team and its players from the three header lines."""
+    header_lines = [
+        line.strip().decode("ascii").split(",") for line in islice(data, 3)
+    ]
+    team = Team(team_id=str(ground), name=header_lines[0][3], ground=ground)
+    team.players = [
+        Player(
+            player_id=f"{team.ground}_{jersey_number}",
+            jersey_no=int(jersey_number),
+            team=team,
+        )
+        for jersey_number in header_lines[1][3:-2:2]
+    ]
+    return team
+
+
+def _parse_lines_numpy(lines: Sequence[str], n_columns: int):
+    import numpy as np
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", DeprecationWarning)
+        values = np.fromstring(",".join(lines), dtype=float, sep=",")
+    if values.size != len(lines) * n_columns:
+        raise ValueError("Lines have an unexpected number of columns")
+    values = values.reshape(len(lines), n_columns)
+
+    # Metrica use (y, -y) instead of (-y, y)
+    values[:, 4::2] = 1 - values[:, 4::2]
+    return values
+
+
+def _join_lines_numpy(
+    home_lines: Sequence[str],
+    away_lines: Sequence[str],
+    n_home_players: int,
+    n_away_players: int,
+) -> "np.ndarray":
+    import numpy as np
+
+    home_values = _parse_lines_numpy(home_lines, 5 + 2 * n_home_players)
+    away_values = _parse_lines_numpy(away_lines, 5 + 2 * n_away_players)
+
+    mismatches = np.flatnonzero(home_values[:, 1] != away_values[:, 1])
+    if mismatches.size:
+        i = mismatches[0]
+        raise ValueError(
+            f"frame_id mismatch: home {int(home_values[i, 1])}, "
+            f"away: {int(away_values[i, 1])}"
+        )
+
+    home_ball = home_values[:, -2:]
+    away_ball = away_values[:, -2:]
+    mismatches = np.flatnonzero(
+        (
+            (home_ball != away_ball)
+            & ~(np.isnan(home_ball) & np.isnan(away_ball))
+        ).any(axis=1)
+    )
+    if mismatches.size:
+        i = mismatches[0]
+        raise ValueError(
+            f"ball position mismatch: home {home_ball[i].tolist()}, "
+            f"away: {away_ball[i].tolist()}. Do the files belong to the"
+            f" same game? frame_id: {int(home_values[i, 1])}"
+        )
+
+    return np.hstack(
+        (home_values[:, 1:2], home_values[:, 3:], away_values[:, 3:-2])
+    )
+
+
+def _join_lines(
+    home_lines: Sequence[str],
+    away_lines: Sequence[str],
+    n_home_players: int,
+    n_away_players: int,
+) -> Union["np.ndarray", List[List[float]]]:
+    """
+    Decode the lines of both team files and join them by frame id. Every
+    row contains the frame id, the home player coordinates, the ball
+    coordinates and the away player coordinates, with the y-axis flipped.
+    Coordinates are NaN when the object is not on the pitch.
+
+    Returns a NumPy array, or lists of floats when NumPy is not installed.
+    """
+    try:
+        return _join_lines_numpy(
+            home_lines, away_lines, n_home_players, n_away_players
+        )
+    except ImportError:
+        pass
+
+    rows = []
+    for home_line, away_line in zip(home_lines, away_lines):
+        home_values = [float(value) for value in home_line.split(",")]
+        away_values = [float(value) for value in away_line.split(",")]
+        for values in (home_values, away_values):
+            values[4::2] = [1 - y for y in values[4::2]]
+
+        if home_values[1] != away_values[1]:
+            raise ValueError(
+                f"frame_id mismatch: home {int(home_values[1])}, "
+                f"away: {int(away_values[1])}"
+            )
+        home_ball = home_values[-2:]
+        away_ball = away_values[-2:]
+        if home_ball != away_ball and not (
+            math.isnan(home_ball[0]) and math.isnan(away_ball[0])
+        ):
+            raise ValueError(
+                f"ball position mismatch: home {home_ball}, "
+                f"away: {away_ball}. Do the files belong to the"
+                f" same game? frame_id: {int(home_values[1])}"
+            )
+        rows.append(home_values[1:2] + home_values[3:] + away_values[3:-2])
+    return rows
+
+
 class MetricaCSVTrackingDataDeserializer(
     TrackingDataDeserializer[MetricaCSVTrackingDataInputs]
 ):
-    __PartialFrame = namedtuple(
-        "PartialFrame",
-        "team period frame_id players_data ball_coordinates",
-    )
-
     @property
     def provider(self) -> Provider:
         return Provider.METRICA
 
-    def __create_iterator(
-        self,
-        data: IO[bytes],
-        sample_rate: float,
+    @staticmethod
+    def __iter_batches(data: IO[bytes]) -> Iterator[List[str]]:
+        lines = (line.strip().decode("ascii") for line in data)
+        lines = (line for line in lines if line)
+        while True:
+            batch = list(islice(lines, BATCH_SIZE))
+            if not batch:
+                break
+            yield batch
+
+    @staticmethod
+    def __create_frames(
+        rows: Union["np.ndarray", List[List[float]]],
+        indices: List[int],
+        frame_periods: List[Period],
+        frame_ids: List[int],
         frame_rate: int,
-        ground: Ground,
-    ) -> Iterator:
-        """
-        Notes:
-            1. the y-axis is flipped because Metrica use (y, -y) instead of (-y, y)
-        """
-
-        team = None
-        frame_idx = 0
-        frame_sample = 1 / sample_rate
-        player_jersey_numbers = []
-        period = None
-
-        for i, line in enumerate(data):
-            line = line.strip().decode("ascii")
-            columns = line.split(",")
-            if i == 0:
-                team_name = columns[3]
-                team = Team(team_id=str(ground), name=team_name, ground=ground)
-            elif i == 1:
-                player_jersey_numbers = columns[3:-2:2]
-                players = [
-                    Player(
-                        player_id=f"{team.ground}_{jersey_number}",
-                        jersey_no=int(jersey_number),
-                        team=team,
-                    )
-                    for jersey_number in player_jersey_numbers
-                ]
-                team.players = players
-            elif i == 2:
-                # consider doing some validation on the columns
-                pass
-            else:
-                period_id = int(columns[0])
-                frame_id = int(columns[1])
-
-                if period is None or period.id != period_id:
-                    period = Period(
-                        id=period_id,
-                        start_timestamp=timedelta(
-                            seconds=(frame_id - 1) / frame_rate
-                        ),
-                        end_timestamp=timedelta(seconds=frame_id / frame_rate),
-                    )
-                else:
-                    # consider not update this every frame for performance reasons
-                    period.end_timestamp = timedelta(
-                        seconds=frame_id / frame_rate
+        player_columns: List[Tuple[Player, int]],
+        ball_column: Optional[int],
+        transformer,
+    ) -> List[Frame]:
+        """Create the (transformed) frames of the joined `rows` at
+        `indices`. The coordinates are transformed at once."""
+        try:
+            import numpy as np
+        except ImportError:
+            return [
+                transformer.transform_frame(
+                    _create_frame(
+                        rows[i],
+                        period,
+                        frame_id,
+                        frame_rate,
+                        player_columns,
+                        ball_column,
                     )
+                )
+                for i, period, frame_id in zip(
+                    indices, frame_periods, frame_ids
+                )
+            ]
 
-                if frame_idx % frame_sample == 0:
-                    yield self.__PartialFrame(
-                        team=team,
-                        period=period,
-                        frame_id=frame_id,
-                        players_data={
-                            player: PlayerData(
-                                coordinates=Point(
-                                    x=float(columns[3 + i * 2]),
-                                    y=1 - float(columns[3 + i * 2 + 1]),
-                                )
-                            )
-                            for i, player in enumerate(players)
-                            if columns[3 + i * 2] != "NaN"
-                        },
-                        ball_coordinates=Point(
-                            x=float(columns[-2]), y=1 - float(columns[-1])
-                        )
-                        if columns[-2] != "NaN"
-                        else None,
-                    )
-                frame_idx += 1
+        values = np.asarray(rows)[indices]
+        flips = np.array(
+            transformer.get_flips(
+                [(None, period) for period in frame_periods]
+            ),
+            dtype=bool,
+        )
+        x, y, _ = transformer.transform_coordinates(
+            values[:, 1::2], values[:, 2::2], None, flips[:, None]
+        )
+        values[:, 1::2] = x
+        values[:, 2::2] = y
 
-    @staticmethod
-    def __validate_partials(
-        home_partial_frame: __PartialFrame, away_partial_frame: __PartialFrame
-    ):
-        if home_partial_frame.frame_id != away_partial_frame.frame_id:
-            raise ValueError(
-                f"frame_id mismatch: home {home_partial_frame.frame_id}, "
-                f"away: {away_partial_frame.frame_id}"
+        return [
+            _create_frame(
+                row, period, frame_id, frame_rate, player_columns, ball_column
             )
-        if (
-            home_partial_frame.ball_coordinates
-            != away_partial_frame.ball_coordinates
-        ):
-            raise ValueError(
-                f"ball position mismatch: home {home_partial_frame.ball_coordinates}, "
-                f"away: {away_partial_frame.ball_coordinates}. Do the files belong to the"
-                f" same game? frame_id: {home_partial_frame.frame_id}"
+            for row, period, frame_id in zip(
+                values.tolist(), frame_periods, frame_ids
             )
-        if home_partial_frame.team.ground != Ground.HOME:
-            raise ValueError("raw_data_home contains away team data")
-        if away_partial_frame.team.ground != Ground.AWAY:
-            raise ValueError("raw_data_away contains home team data")
+        ]
 
-    def deserialize(
+    def iter_records(
         self, inputs: MetricaCSVTrackingDataInputs
-    ) -> TrackingDataset:
+    ) -> TrackingDataStream:
         # consider reading this from data
         frame_rate = 25
 
         transformer = self.get_transformer()
 
-        with performance_logging("prepare", logger=logger):
-            home_iterator = self.__create_iterator(
-                inputs.home_data, self.sample_rate, frame_rate, Ground.HOME
-            )
-            away_iterator = self.__create_iterator(
-                inputs.away_data, self.sample_rate, frame_rate, Ground.AWAY
-            )
-
-            partial_frames = zip(home_iterator, away_iterator)
+        # The teams and periods are only known while reading the frames.
+        # They are added to the metadata as soon as they are encountered.
+        periods = []
+        teams = []
 
-        with performance_logging("loading", logger=logger):
-            frames = []
-            periods = []
+        def _iter_frames(window: FrameWindow, projection: ObjectProjection):
+            # Only keep the teams and periods of the last read
+            del periods[:]
+            del teams[:]
 
-            partial_frame_type = self.__PartialFrame
-            home_partial_frame: partial_frame_type
-            away_partial_frame: partial_frame_type
-            for n, (home_partial_frame, away_partial_frame) in enumerate(
-                partial_frames
-            ):
-                self.__validate_partials(
-                    home_partial_frame, away_partial_frame
+            with performance_logging("prepare", logger=logger):
+                teams.extend(
+                    [
+                        _read_team(inputs.home_data, Ground.HOME),
+                        _read_team(inputs.away_data, Ground.AWAY),
+                    ]
                 )
+                self.projection.validate(teams)
+                home_team, away_team = teams
+                n_home_players = len(home_team.players)
 
-                period: Period = home_partial_frame.period
-                frame_id: int = home_partial_frame.frame_id
-
-                players_data = {
-                    **home_partial_frame.players_data,
-                    **away_partial_frame.players_data,
-                }
-
-                frame = Frame(
-                    frame_id=frame_id,
-                    timestamp=timedelta(seconds=frame_id / frame_rate)
-                    - period.start_timestamp,
-                    ball_coordinates=home_partial_frame.ball_coordinates,
-                    players_data=players_data,
-                    period=period,
-                    ball_state=None,
-                    ball_owning_team=None,
-                    other_data={},
+                # The players with the column of their x coordinate in the
+                # joined rows
+                player_columns = []
+                if projection.includes_team(home_team):
+                    player_columns.extend(
+                        (player, 1 + 2 * i)
+                        for i, player in enumerate(home_team.players)
+                    )
+                if projection.includes_team(away_team):
+                    player_columns.extend(
+                        (player, 3 + 2 * n_home_players + 2 * i)
+                        for i, player in enumerate(away_team.players)
+                    )
+                ball_column = (
+                    1 + 2 * n_home_players
+                    if projection.includes_ball
+                    else None
                 )
 
-                frame = transformer.transform_frame(frame)
+            sampler = self.get_sampler(frame_rate)
+            period = None
+            n = 0
 
-                frames.append(frame)
+            with performance_logging("loading", logger=logger):
+                for home_lines, away_lines in zip(
+                    self.__iter_batches(inputs.home_data),
+                    self.__iter_batches(inputs.away_data),
+                ):
+                    # Frames without data of both teams are skipped
+                    n_lines = min(len(home_lines), len(away_lines))
+                    rows = _join_lines(
+                        home_lines[:n_lines],
+                        away_lines[:n_lines],
+                        n_home_players,
+                        len(away_team.players),
+                    )
 
-                if not periods or period.id != periods[-1].id:
-                    periods.append(period)
+                    indices = []
+                    frame_periods = []
+                    frame_ids = []
+                    is_past = False
+                    for i, line in enumerate(home_lines[:n_lines]):
+                        period_id, frame_id = line.split(",", 2)[:2]
+                        period_id = int(period_id)
+                        frame_id = int(frame_id)
 
-                if n == 0:
-                    teams = [home_partial_frame.team, away_partial_frame.team]
+                        if period is None or period.id != period_id:
+                            period = Period(
+                                id=period_id,
+                                start_timestamp=timedelta(
+                                    seconds=(frame_id - 1) / frame_rate
+                                ),
+                                end_timestamp=timedelta(
+                                    seconds=frame_id / frame_rate
+                                ),
+                            )
+                        else:
+                            period.end_timestamp = timedelta(
+                                seconds=frame_id / frame_rate
+                            )
 
-                n += 1
-                if self.limit and n >= self.limit:
-                    break
+                        if window:
+                            timestamp = (
+                                timedelta(seconds=frame_id / frame_rate)
+                                - period.start_timestamp
+                            )
+                            if window.is_past(period_id, timestamp):
+                                is_past = True
+                                break
+                            if not window.includes(period_id, timestamp):
+                                continue
 
-        try:
-            first_frame = next(
-                frame for frame in frames if frame.period.id == 1
-            )
-            orientation = (
-                Orientation.HOME_AWAY
-                if attacking_direction_from_frame(first_frame)
-                == AttackingDirection.LTR
-                else Orientation.AWAY_HOME
-            )
-        except StopIteration:
-            warnings.warn(
-                "Could not determine orientation of dataset, defaulting to NOT_SET"
-            )
-            orientation = Orientation.NOT_SET
+                        if sampler.keep():
+                            indices.append(i)
+                            frame_periods.append(period)
+                            frame_ids.append(frame_id)
+
+                    if self.limit:
+                        del indices[self.limit - n :]
+                        del frame_periods[self.limit - n :]
+                        del frame_ids[self.limit - n :]
+
+                    for frame in self.__create_frames(
+                        rows,
+                        indices,
+                        frame_periods,
+                        frame_ids,
+                        frame_rate,
+                        player_columns,
+                        ball_column,
+                        transformer,
+                    ):
+                        if not periods or frame.period.id != periods[-1].id:
+                            periods.append(frame.period)
+                        yield frame
+                        n += 1
+
+                    if (
+                        is_past
+                        or n_lines < BATCH_SIZE
+                        or (self.limit and n >= self.limit)
+                    ):
+                        break
+
+        orientation, frames = self.detect_window_orientation(
+            _iter_frames, inputs.home_data, inputs.away_data
+        )
 
         metadata = Metadata(
             teams=teams,
@@ -242,4 +423,4 @@ class MetricaCSVTrackingDataDeserializer(
             coordinate_system=transformer.get_to_coordinate_system(),
         )
 
-        return TrackingDataset(records=frames, metadata=metadata)
+        return TrackingDataStream(metadata=metadata, frames=frames)
@@ -1,9 +1,9 @@
 import logging
-from typing import NamedTuple, IO
+from typing import NamedTuple, IO, Optional
 from dataclasses import replace
 
 from kloppy.domain import (
-    TrackingDataset,
+    TrackingDataStream,
     Frame,
     Point,
     Point3D,
@@ -16,6 +16,7 @@ from kloppy.utils import performance_logging
 from .metadata import load_metadata, EPTSMetadata
 from .reader import read_raw_data
 from ..deserializer import TrackingDataDeserializer
+from ..projection import ObjectProjection
 
 logger = logging.getLogger(__name__)
 
@@ -34,7 +35,10 @@ class MetricaEPTSTrackingDataDeserializer(
 
     @staticmethod
     def _frame_from_row(
-        row: dict, metadata: EPTSMetadata, transformer: DatasetTransformer
+        row: dict,
+        metadata: EPTSMetadata,
+        transformer: DatasetTransformer,
+        projection: Optional[ObjectProjection] = None,
     ) -> Frame:
         timestamp = row["timestamp"]
         if metadata.periods and row["period_id"]:
@@ -50,6 +54,8 @@ class MetricaEPTSTrackingDataDeserializer(
 
         players_data = {}
         for team in metadata.teams:
+            if projection is not None and not projection.includes_team(team):
+                continue
             for player in team.players:
                 other_data = {}
                 for sensor in other_sensors:
@@ -83,7 +89,9 @@ class MetricaEPTSTrackingDataDeserializer(
             other_data={},
             ball_coordinates=Point3D(
                 x=row["ball_x"], y=row["ball_y"], z=row.get("ball_z")
-            ),
+            )
+            if "ball_x" in row
+            else None,
         )
 
         if transformer:
@@ -91,11 +99,12 @@ class MetricaEPTSTrackingDataDeserializer(
 
         return frame
 
-    def deserialize(
+    def iter_records(
         self, inputs: MetricaEPTSTrackingDataInputs
-    ) -> TrackingDataset:
+    ) -> TrackingDataStream:
         with performance_logging("Loading metadata", logger=logger):
             metadata = load_metadata(inputs.meta_data)
+            self.projection.validate(metadata.teams)
 
             if metadata.provider and metadata.pitch_dimensions:
                 transformer = self.get_transformer(
@@ -105,20 +114,27 @@ class MetricaEPTSTrackingDataDeserializer(
             else:
                 transformer = None
 
-        with performance_logging("Loading data", logger=logger):
-            # assume they are sorted
-            frames = [
-                self._frame_from_row(row, metadata, transformer)
+        def _iter_frames(raw_metadata: EPTSMetadata):
+            with performance_logging("Loading data", logger=logger):
+                # assume they are sorted
                 for row in read_raw_data(
                     raw_data=inputs.raw_data,
-                    metadata=metadata,
+                    metadata=raw_metadata,
                     sensor_ids=[
-                        sensor.sensor_id for sensor in metadata.sensors
+                        sensor.sensor_id for sensor in raw_metadata.sensors
                     ],
-                    sample_rate=self.sample_rate,
+                    sample_rate=self.get_sampler(
+                        raw_metadata.frame_rate
+                    ).sample_rate,
                     limit=self.limit,
-                )
-            ]
+                    window=self.window,
+                    projection=self.projection,
+                ):
+                    yield self._frame_from_row(
+                        row, raw_metadata, transformer, self.projection
+                    )
+
+        frames = _iter_frames(metadata)
 
         if transformer:
             metadata = replace(
@@ -127,4 +143,4 @@ class MetricaEPTSTrackingDataDeserializer(
                 coordinate_system=transformer.get_to_coordinate_system(),
             )
 
-        return TrackingDataset(records=frames, metadata=metadata)
+        return TrackingDataStream(metadata=metadata, frames=frames)
@@ -1,5 +1,6 @@
+from collections import Counter
 from dataclasses import dataclass, field
-from typing import List, Dict, Union
+from typing import List, Dict, Optional, Union
 
 from kloppy.domain import Team, Player, Metadata
 
@@ -65,6 +66,12 @@ class StringRegister:
     def to_regex(self, **kwargs) -> str:
         return f"(?P<{self.name}>{NON_SPLIT_CHAR_REGEX})"
 
+    def to_fields(self, **kwargs) -> List[Optional[str]]:
+        return [self.name]
+
+    def separator_counts(self) -> Counter:
+        return Counter()
+
     @classmethod
     def from_xml_element(cls, elm) -> "StringRegister":
         return cls(name=elm.attrib["name"])
@@ -77,11 +84,25 @@ class PlayerChannelRef:
     def to_regex(
         self, player_channel_map: Dict[str, PlayerChannel], **kwargs
     ) -> str:
+        (name,) = self.to_fields(player_channel_map)
+        if name:
+            return f"(?P<{name}>{NON_SPLIT_CHAR_REGEX})"
+        else:
+            return NON_SPLIT_CHAR_REGEX
+
+    def to_fields(
+        self, player_channel_map: Dict[str, PlayerChannel], **kwargs
+    ) -> List[Optional[str]]:
         if self.player_channel_id in player_channel_map:
             player_channel = player_channel_map[self.player_channel_id]
-            return f"(?P<player_{player_channel.player.player_id}_{player_channel.channel.channel_id}>{NON_SPLIT_CHAR_REGEX})"
+            return [
+                f"player_{player_channel.player.player_id}_{player_channel.channel.channel_id}"
+            ]
         else:
-            return NON_SPLIT_CHAR_REGEX
+            return [None]
+
+    def separator_counts(self) -> Counter:
+        return Counter()
 
     @classmethod
     def from_xml_element(cls, elm) -> "PlayerChannelRef":
@@ -98,6 +119,17 @@ class BallChannelRef:
         else:
             return NON_SPLIT_CHAR_REGEX
 
+    def to_fields(
+        self, ball_channel_map: Dict[str, Channel], **kwargs
+    ) -> List[Optional[str]]:
+        if self.channel_id in ball_channel_map:
+            return [f"ball_{self.channel_id}"]
+        else:
+            return [None]
+
+    def separator_counts(self) -> Counter:
+        return Counter()
+
     @classmethod
     def from_xml_element(cls, elm) -> "BallChannelRef":
         return cls(channel_id=elm.attrib["channelId"])
@@ -120,6 +152,22 @@ class SplitRegister:
             + f"{self.separator}?"
         )
 
+    def to_fields(self, **kwargs) -> List[Optional[str]]:
+        """The names of the fields in order. The fields that are not read
+        have no name."""
+        return [
+            name
+            for child in self.children
+            for name in child.to_fields(**kwargs)
+        ]
+
+    def separator_counts(self) -> Counter:
+        """The number of separators of each kind between the fields."""
+        counts = Counter({self.separator: len(self.children) - 1})
+        for child in self.children:
+            counts.update(child.separator_counts())
+        return counts
+
     @classmethod
     def from_xml_element(cls, elm) -> "SplitRegister":
         children = []
@@ -157,6 +205,12 @@ class DataFormatSpecification:
     def to_regex(self, **kwargs) -> str:
         return "^" + self.split_register.to_regex(**kwargs) + "$"
 
+    def to_fields(self, **kwargs) -> List[Optional[str]]:
+        return self.split_register.to_fields(**kwargs)
+
+    def separator_counts(self) -> Counter:
+        return self.split_register.separator_counts()
+
 
 @dataclass
 class EPTSMetadata(Metadata):
@@ -1,7 +1,12 @@
 import re
-from typing import List, Tuple, Set, Iterator, IO
+import warnings
 from datetime import timedelta
+from itertools import islice
+from typing import Dict, List, Optional, Iterator, IO
 
+from kloppy.infra.serializers.tracking.projection import ObjectProjection
+from kloppy.infra.serializers.tracking.sampling import Sampler
+from kloppy.infra.serializers.tracking.window import FrameWindow
 from kloppy.utils import Readable
 
 from .models import (
@@ -12,12 +17,15 @@ from .models import (
     Sensor,
 )
 
+# Number of lines that are decoded at once
+BATCH_SIZE = 1000
 
-def build_regex(
-    data_format_specification: DataFormatSpecification,
+
+def _channel_maps(
     player_channels: List[PlayerChannel],
     sensors: List[Sensor],
-) -> str:
+    include_ball: bool = True,
+) -> Dict[str, dict]:
     player_channel_map = {
         player_channel.player_channel_id: player_channel
         for player_channel in player_channels
@@ -29,22 +37,144 @@ def build_regex(
         if sensor.sensor_id == "position":
             position_sensor = sensor
 
-    return data_format_specification.to_regex(
+    return dict(
         player_channel_map=player_channel_map,
         ball_channel_map={
             channel.channel_id: channel for channel in position_sensor.channels
         }
-        if position_sensor
+        if position_sensor and include_ball
         else {},
     )
 
 
+def build_regex(
+    data_format_specification: DataFormatSpecification,
+    player_channels: List[PlayerChannel],
+    sensors: List[Sensor],
+    include_ball: bool = True,
+) -> str:
+    return data_format_specification.to_regex(
+        **_channel_maps(player_channels, sensors, include_ball)
+    )
+
+
+def _to_float(v: str) -> float:
+    return float(v) if v else float("nan")
+
+
+class _LineDecoder:
+    """
+    Decode the lines of a data format specification into rows.
+
+    The lines are split on the separators of the specification, which is
+    done for a batch of lines at once with NumPy when it's installed. Lines
+    of which the separators don't match the specification, e.g. because of
+    trailing separators, are matched with the regex of the specification.
+    """
+
+    def __init__(
+        self,
+        data_format_specification: DataFormatSpecification,
+        player_channels: List[PlayerChannel],
+        sensors: List[Sensor],
+        include_ball: bool = True,
+    ):
+        channel_maps = _channel_maps(player_channels, sensors, include_ball)
+        self.regex = re.compile(
+            data_format_specification.to_regex(**channel_maps)
+        )
+
+        fields = data_format_specification.to_fields(**channel_maps)
+        self.n_fields = len(fields)
+        self.names = [name for name in fields if name]
+        self.columns = [i for i, name in enumerate(fields) if name]
+        self.separator_counts = [
+            (separator, count)
+            for separator, count in data_format_specification.separator_counts().items()
+            if count
+        ]
+
+    def _replace_separators(self, text: str) -> str:
+        for separator, _ in self.separator_counts:
+            if separator != ",":
+                text = text.replace(separator, ",")
+        return text
+
+    def _decode_regex(self, line: str) -> dict:
+        return {
+            k: _to_float(v)
+            for k, v in self.regex.search(line).groupdict().items()
+        }
+
+    def _decode_numpy(self, lines: List[str]) -> Optional[List[dict]]:
+        import numpy as np
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", DeprecationWarning)
+            try:
+                values = np.fromstring(
+                    self._replace_separators(",".join(lines)),
+                    dtype=float,
+                    sep=",",
+                )
+            except ValueError:
+                return None
+        # Empty fields can't be decoded by NumPy
+        if values.size != len(lines) * self.n_fields:
+            return None
+
+        values = values.reshape(len(lines), self.n_fields)
+        return [
+            dict(zip(self.names, row))
+            for row in values[:, self.columns].tolist()
+        ]
+
+    def _decode_split(self, lines: List[str]) -> List[dict]:
+        try:
+            rows = self._decode_numpy(lines)
+        except ImportError:
+            rows = None
+        if rows is not None:
+            return rows
+
+        rows = []
+        for line in lines:
+            fields = self._replace_separators(line).split(",")
+            rows.append(
+                {
+                    name: _to_float(fields[column])
+                    for name, column in zip(self.names, self.columns)
+                }
+            )
+        return rows
+
+    def decode(self, lines: List[str]) -> List[dict]:
+        is_regular = [
+            all(
+                line.count(separator) == count
+                for separator, count in self.separator_counts
+            )
+            for line in lines
+        ]
+        if all(is_regular):
+            return self._decode_split(lines)
+
+        return [
+            self._decode_split([line])[0]
+            if regular
+            else self._decode_regex(line)
+            for line, regular in zip(lines, is_regular)
+        ]
+
+
 def read_raw_data(
     raw_data: IO[bytes],
     metadata: EPTSMetadata,
     sensor_ids: List[str] = None,
     sample_rate: float = 1.0,
     limit: int = 0,
+    window: Optional[FrameWindow] = None,
+    projection: Optional[ObjectProjection] = None,
 ) -> Iterator[dict]:
     sensors = [
         sensor
@@ -52,24 +182,34 @@ def read_raw_data(
         if sensor_ids is None or sensor.sensor_id in sensor_ids
     ]
 
+    if projection is None:
+        projection = ObjectProjection()
+    # The values of the channels of objects that are not loaded are matched,
+    # but not captured
+    player_channels = [
+        player_channel
+        for player_channel in metadata.player_channels
+        if projection.includes_team(player_channel.player.team)
+    ]
+
     data_specs = metadata.data_format_specifications
 
     current_data_spec_idx = 0
     end_frame_id = 0
-    regex = None
+    decoder = None
     frame_name = "frameCount"
 
     def _set_current_data_spec(idx):
-        nonlocal current_data_spec_idx, end_frame_id, regex, frame_name
+        nonlocal current_data_spec_idx, end_frame_id, decoder, frame_name
         current_data_spec_idx = idx
-        regex_str = build_regex(
+        decoder = _LineDecoder(
             data_specs[current_data_spec_idx],
-            metadata.player_channels,
+            player_channels,
             sensors,
+            projection.includes_ball,
         )
 
         end_frame_id = data_specs[current_data_spec_idx].end_frame
-        regex = re.compile(regex_str)
         frame_name = (
             data_specs[current_data_spec_idx].split_register.children[0].name
         )
@@ -77,45 +217,66 @@ def read_raw_data(
     _set_current_data_spec(0)
 
     periods = metadata.periods
+    last_period_id = periods[-1].id if periods else None
     n = 0
-    sample = 1.0 / sample_rate
+    sampler = Sampler(sample_rate)
 
-    for i, line in enumerate(raw_data):
-        if i % sample != 0:
-            continue
+    lines = (line.strip().decode("ascii") for line in sampler.sample(raw_data))
+    while True:
+        batch = list(islice(lines, BATCH_SIZE))
+        if not batch:
+            break
 
-        def to_float(v):
-            return float(v) if v else float("nan")
+        while batch:
+            batch_lines, batch = batch, []
+            rows = decoder.decode(batch_lines)
+            for i, row in enumerate(rows):
+                frame_id = int(row[frame_name])
+                if frame_id <= end_frame_id:
+                    timestamp = timedelta(
+                        seconds=frame_id / metadata.frame_rate
+                    )
 
-        line = line.strip().decode("ascii")
-        row = {
-            k: to_float(v) for k, v in regex.search(line).groupdict().items()
-        }
-        frame_id = int(row[frame_name])
-        if frame_id <= end_frame_id:
-            timestamp = timedelta(seconds=frame_id / metadata.frame_rate)
-
-            del row[frame_name]
-            row["frame_id"] = frame_id
-            row["timestamp"] = timestamp
-
-            row["period_id"] = None
-            for period in periods:
-                if period.start_timestamp <= timestamp <= period.end_timestamp:
-                    row["period_id"] = period.id
-                    row["timestamp"] -= period.start_timestamp
-                    break
-
-            yield row
-
-            n += 1
-            if limit and n >= limit:
-                break
-
-        if frame_id >= end_frame_id:
-            if current_data_spec_idx == len(data_specs) - 1:
-                # don't know how to parse the rest of the file...
-                break
-            else:
-                current_data_spec_idx += 1
-                _set_current_data_spec(current_data_spec_idx)
+                    del row[frame_name]
+                    row["frame_id"] = frame_id
+                    row["timestamp"] = timestamp
+
+                    row["period_id"] = None
+                    for period in periods:
+                        if (
+                            period.start_timestamp
+                            <= timestamp
+                            <= period.end_timestamp
+                        ):
+                            row["period_id"] = period.id
+                            row["timestamp"] -= period.start_timestamp
+                            break
+
+                    if window and row["period_id"] is not None:
+                        if window.is_past(
+                            row["period_id"], row["timestamp"], last_period_id
+                        ):
+                            return
+                        in_window = window.includes(
+                            row["period_id"], row["timestamp"]
+                        )
+                    else:
+                        in_window = not window
+
+                    if in_window:
+                        yield row
+
+                        n += 1
+                        if limit and n >= limit:
+                            return
+
+                if frame_id >= end_frame_id:
+                    if current_data_spec_idx == len(data_specs) - 1:
+                        # don't know how to parse the rest of the file...
+                        return
+                    else:
+                        current_data_spec_idx += 1
+                        _set_current_data_spec(current_data_spec_idx)
+                        # Decode the next lines with the new data spec
+                        batch = batch_lines[i + 1 :]
+                        break
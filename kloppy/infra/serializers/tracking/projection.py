@@ -0,0 +1,65 @@
+from typing import List, Optional, Tuple
+
+from kloppy.domain import Team
+from kloppy.exceptions import KloppyParameterError
+
+BALL = "ball"
+
+
+class ObjectProjection:
+    """
+    Selects the objects to load: the ball and the players of a team.
+
+    Deserializers skip parsing the data of the objects that are not
+    selected. Frames have no ball coordinates when the ball is not
+    selected, and only contain the players of the selected teams.
+
+    Arguments:
+        objects: "ball", and the team ids (or "home" and "away") of the
+            teams whose players are loaded. All objects are loaded when
+            not given.
+    """
+
+    def __init__(self, objects: Optional[List[str]] = None):
+        self.objects = set(objects) if objects is not None else None
+
+    def __bool__(self):
+        return self.objects is not None
+
+    @property
+    def includes_ball(self) -> bool:
+        return self.objects is None or BALL in self.objects
+
+    def includes_team(self, team: Team) -> bool:
+        return (
+            self.objects is None
+            or team.team_id in self.objects
+            or str(team.ground) in self.objects
+        )
+
+    def team_indices(self, teams: List[Team]) -> Tuple[int, ...]:
+        """Return the indices of the selected teams in `teams`."""
+        return tuple(
+            team_index
+            for team_index, team in enumerate(teams)
+            if self.includes_team(team)
+        )
+
+    def includes_all_teams(self, teams: List[Team]) -> bool:
+        return len(self.team_indices(teams)) == len(teams)
+
+    def validate(self, teams: List[Team]):
+        """Raise an error for the objects that are not the ball or one of
+        `teams`."""
+        if self.objects is None:
+            return
+
+        known_objects = {BALL}
+        for team in teams:
+            known_objects.update((team.team_id, str(team.ground)))
+        unknown_objects = self.objects - known_objects
+        if unknown_objects:
+            raise KloppyParameterError(
+                f"Unknown objects: {', '.join(sorted(unknown_objects))}. "
+                f"Use 'ball', 'home', 'away' or one of the team ids"
+            )
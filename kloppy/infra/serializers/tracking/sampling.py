@@ -0,0 +1,69 @@
+from fractions import Fraction
+from typing import Iterable, Iterator, TypeVar, Union
+
+from kloppy.exceptions import KloppyParameterError
+
+T = TypeVar("T")
+
+# Sample rates are rounded to the closest fraction with at most this
+# denominator, so a float like 1 / 3 keeps exactly every third frame
+MAX_DENOMINATOR = 1000
+
+
+class Sampler:
+    """
+    Decides which frames to keep when downsampling tracking data.
+
+    The sample rate is used as an exact fraction: the n-th frame is kept when
+    `n * sample_rate` reaches a new integer. A sample rate of 1/3 keeps the
+    frames 0, 3, 6, ... and 2/3 keeps two out of every three frames.
+
+    Deserializers ask the sampler whether to keep a frame before they parse
+    it, so the time it takes to load downsampled data depends on the number
+    of frames that are kept.
+
+    Arguments:
+        sample_rate: the fraction of the frames to keep
+    """
+
+    def __init__(self, sample_rate: Union[float, Fraction] = 1):
+        if sample_rate <= 0:
+            raise KloppyParameterError(
+                f"Sample rate must be positive, got {sample_rate}"
+            )
+        self.sample_rate = min(
+            Fraction(sample_rate).limit_denominator(MAX_DENOMINATOR), 1
+        )
+        self.n = 0
+
+    @classmethod
+    def for_frame_rate(
+        cls, frame_rate: float, target_frame_rate: float
+    ) -> "Sampler":
+        """Create a sampler that keeps `target_frame_rate` frames per second
+        of data recorded at `frame_rate`."""
+        return cls(
+            Fraction(target_frame_rate).limit_denominator(MAX_DENOMINATOR)
+            / Fraction(frame_rate).limit_denominator(MAX_DENOMINATOR)
+        )
+
+    def is_sampled(self, n: int) -> bool:
+        """Whether the n-th frame (0 based) is kept."""
+        return (
+            n * self.sample_rate.numerator
+        ) % self.sample_rate.denominator < self.sample_rate.numerator
+
+    def keep(self) -> bool:
+        """Whether the next frame is kept."""
+        keep = self.is_sampled(self.n)
+        self.n += 1
+        return keep
+
+    def reset(self):
+        self.n = 0
+
+    def sample(self, records: Iterable[T]) -> Iterator[T]:
+        """Only yield the records that are kept."""
+        for record in records:
+            if self.keep():
+                yield record
@@ -1,36 +1,51 @@
-import json
 import logging
-from datetime import timedelta
+import re
 import warnings
-from typing import Tuple, Dict, Optional, Union, NamedTuple, IO
+from datetime import timedelta
+from typing import Tuple, Dict, List, Optional, Union, NamedTuple, IO
 
 from lxml import objectify
 
 from kloppy.domain import (
-    TrackingDataset,
+    TrackingDataStream,
     DatasetFlag,
-    AttackingDirection,
     Frame,
     Point,
     Point3D,
     Team,
     BallState,
     Period,
-    Orientation,
-    attacking_direction_from_frame,
     Metadata,
     Ground,
     Player,
     Provider,
     PlayerData,
+    Orientation,
 )
 
 from kloppy.utils import Readable, performance_logging
+from kloppy.infra.serializers import json_backend
 
 from .deserializer import TrackingDataDeserializer
+from .frame_index import FrameIndex, iter_lines
+from .projection import ObjectProjection
+from .window import FrameWindow, Timestamp, frame_range_includes_start
 
 logger = logging.getLogger(__name__)
 
+_frame_idx_re = re.compile(rb'"frameIdx":\s*(\d+)')
+_period_re = re.compile(rb'"period":\s*(\d+)')
+_live_re = re.compile(rb'"live":\s*(true|false)')
+_game_clock_re = re.compile(rb'"gameClock":\s*([0-9.eE+-]+)')
+
+
+def _frame_index_key(line: bytes) -> Optional[Tuple[int, int]]:
+    frame_idx = _frame_idx_re.search(line)
+    period = _period_re.search(line)
+    if not frame_idx or not period:
+        return None
+    return int(frame_idx.group(1)), int(period.group(1))
+
 
 class SecondSpectrumInputs(NamedTuple):
     meta_data: IO[bytes]
@@ -47,20 +62,47 @@ class SecondSpectrumDeserializer(
         sample_rate: Optional[float] = None,
         coordinate_system: Optional[Union[str, Provider]] = None,
         only_alive: Optional[bool] = True,
+        frame_range: Optional[Tuple[int, int]] = None,
+        periods: Optional[List[int]] = None,
+        use_frame_index: Optional[bool] = False,
+        target_frame_rate: Optional[float] = None,
+        start: Optional[Timestamp] = None,
+        end: Optional[Timestamp] = None,
+        objects: Optional[List[str]] = None,
     ):
-        super().__init__(limit, sample_rate, coordinate_system)
+        super().__init__(
+            limit,
+            sample_rate,
+            coordinate_system,
+            target_frame_rate,
+            periods,
+            start,
+            end,
+            objects,
+        )
         self.only_alive = only_alive
+        self.frame_range = frame_range
+        self.use_frame_index = use_frame_index
 
     @property
     def provider(self) -> Provider:
         return Provider.SECONDSPECTRUM
 
     @classmethod
-    def _frame_from_framedata(cls, teams, period, frame_data):
+    def _frame_from_framedata(
+        cls,
+        teams,
+        period,
+        frame_data,
+        projection: Optional[ObjectProjection] = None,
+    ):
         frame_id = frame_data["frameIdx"]
         frame_timestamp = timedelta(seconds=frame_data["gameClock"])
 
-        if frame_data["ball"]["xyz"]:
+        if projection is None:
+            projection = ObjectProjection()
+
+        if projection.includes_ball and frame_data["ball"]["xyz"]:
             ball_x, ball_y, ball_z = frame_data["ball"]["xyz"]
             ball_coordinates = Point3D(
                 float(ball_x), float(ball_y), float(ball_z)
@@ -77,6 +119,8 @@ class SecondSpectrumDeserializer(
 
         players_data = {}
         for team, team_str in zip(teams, ["homePlayers", "awayPlayers"]):
+            if not projection.includes_team(team):
+                continue
             for player_data in frame_data[team_str]:
                 jersey_no = player_data["number"]
                 x, y, _ = player_data["xyz"]
@@ -114,7 +158,7 @@ class SecondSpectrumDeserializer(
         if "raw_data" not in inputs:
             raise ValueError("Please specify a value for 'raw_data'")
 
-    def deserialize(self, inputs: SecondSpectrumInputs) -> TrackingDataset:
+    def iter_records(self, inputs: SecondSpectrumInputs) -> TrackingDataStream:
         metadata = None
 
         # Handles the XML metadata that contains the pitch dimensions and frame info
@@ -124,7 +168,9 @@ class SecondSpectrumDeserializer(
             # First do a 'peek' to determine the char
             first_byte = inputs.meta_data.read(1)
             if first_byte == b"{":
-                metadata = json.loads(first_byte + inputs.meta_data.read())
+                metadata = json_backend.loads(
+                    first_byte + inputs.meta_data.read()
+                )
 
                 frame_rate = int(metadata["fps"])
                 pitch_size_height = float(metadata["pitchLength"])
@@ -182,7 +228,7 @@ class SecondSpectrumDeserializer(
             with performance_logging("Loading JSON metadata", logger=logger):
                 try:
                     if inputs.additional_meta_data:
-                        metadata = json.loads(
+                        metadata = json_backend.loads(
                             inputs.additional_meta_data.read()
                         )
 
@@ -237,58 +283,126 @@ class SecondSpectrumDeserializer(
                         "Optional JSON Metadata is malformed. Continuing without"
                     )
 
-        # Handles the tracking frame data
-        with performance_logging("Loading data", logger=logger):
-            transformer = self.get_transformer(
-                pitch_length=pitch_size_width, pitch_width=pitch_size_height
-            )
+        self.projection.validate(teams)
 
-            def _iter():
-                n = 0
-                sample = 1 / self.sample_rate
-
-                for line_ in inputs.raw_data.readlines():
-                    line_ = line_.strip().decode("ascii")
-                    if not line_:
-                        continue
-
-                    # Each line is just json so we just parse it
-                    frame_data = json.loads(line_)
+        # Handles the tracking frame data
+        transformer = self.get_transformer(
+            pitch_length=pitch_size_width, pitch_width=pitch_size_height
+        )
 
-                    if self.only_alive and not frame_data["live"]:
-                        continue
+        frame_index = (
+            FrameIndex.for_file(inputs.raw_data, _frame_index_key)
+            if self.use_frame_index
+            else None
+        )
 
-                    if n % sample == 0:
-                        yield frame_data
+        last_period_id = periods[-1].id if periods else None
 
-                    n += 1
+        def _iter(window: FrameWindow, frame_range):
+            sampler = self.get_sampler(frame_rate)
 
-            frames = []
-            for n, frame_data in enumerate(_iter()):
-                period = periods[frame_data["period"] - 1]
+            byte_ranges = None
+            if frame_index:
+                byte_ranges = frame_index.byte_ranges(
+                    [frame_range] if frame_range else None, window.periods
+                )
 
-                frame = self._frame_from_framedata(teams, period, frame_data)
-                frame = transformer.transform_frame(frame)
-                frames.append(frame)
+            for line_ in iter_lines(inputs.raw_data, byte_ranges):
+                line_ = line_.strip()
+                if not line_:
+                    continue
+
+                if window or frame_range:
+                    # Skip the frames that are not requested before parsing
+                    frame_id, period_id = _frame_index_key(line_)
+                    if window:
+                        # The game clock is the time within the period
+                        game_clock = _game_clock_re.search(line_)
+                        timestamp = timedelta(
+                            seconds=float(game_clock.group(1))
+                            if game_clock
+                            else json_backend.loads(line_)["gameClock"]
+                        )
+                        if window.is_past(
+                            period_id, timestamp, last_period_id
+                        ):
+                            break
+                        if not window.includes(period_id, timestamp):
+                            continue
+                    if frame_range and not (
+                        frame_range[0] <= frame_id <= frame_range[1]
+                    ):
+                        continue
 
-                if self.limit and n + 1 >= self.limit:
-                    break
+                if self.only_alive:
+                    live = _live_re.search(line_)
+                    if live is None:
+                        frame_data = json_backend.loads(line_)
+                        if not frame_data["live"]:
+                            continue
+                    elif live.group(1) == b"false":
+                        continue
 
-        try:
-            first_frame = next(
-                frame for frame in frames if frame.period.id == 1
+                # Only parse the frames that are kept
+                if sampler.keep():
+                    # Each line is just json so we just parse it
+                    yield json_backend.loads(line_)
+
+        def _iter_frames(
+            window: FrameWindow,
+            projection: ObjectProjection,
+            frame_range=None,
+        ):
+            with performance_logging("Loading data", logger=logger):
+                for n, frame_data in enumerate(_iter(window, frame_range)):
+                    period = periods[frame_data["period"] - 1]
+
+                    frame = self._frame_from_framedata(
+                        teams, period, frame_data, projection
+                    )
+                    yield transformer.transform_frame(frame)
+
+                    if self.limit and n + 1 >= self.limit:
+                        break
+
+        first_periods = [period for period in periods if period.id == 1]
+        if (
+            first_periods
+            and (
+                not self.window.includes_period(1)
+                or not frame_range_includes_start(
+                    self.frame_range, first_periods[0], frame_rate
+                )
+                or self.projection
             )
-            orientation = (
-                Orientation.HOME_AWAY
-                if attacking_direction_from_frame(first_frame)
-                == AttackingDirection.LTR
-                else Orientation.AWAY_HOME
+            and inputs.raw_data.seekable()
+        ):
+            # The orientation is defined by the players in the first frame of
+            # the first period, which is not loaded (completely). Only read
+            # up to that frame to determine it.
+            raw_data_start = inputs.raw_data.tell()
+            orientation, first_period_frames = self.detect_orientation(
+                _iter_frames(FrameWindow([1]), ObjectProjection())
+            )
+            first_period_frames.close()
+            inputs.raw_data.seek(raw_data_start)
+
+            frames = _iter_frames(
+                self.window, self.projection, self.frame_range
             )
-        except StopIteration:
+        elif self.projection:
             warnings.warn(
-                "Could not determine orientation of dataset, defaulting to NOT_SET"
+                "Could not determine orientation of dataset of which not all "
+                "objects are loaded, defaulting to NOT_SET"
             )
             orientation = Orientation.NOT_SET
+            frames = _iter_frames(
+                self.window, self.projection, self.frame_range
+            )
+        else:
+            orientation, frames = self.detect_orientation(
+                _iter_frames(self.window, self.projection, self.frame_range)
+            )
 
         metadata = Metadata(
             teams=teams,
@@ -302,7 +416,4 @@ class SecondSpectrumDeserializer(
             coordinate_system=transformer.get_to_coordinate_system(),
         )
 
-        return TrackingDataset(
-            records=frames,
-            metadata=metadata,
-        )
+        return TrackingDataStream(metadata=metadata, frames=frames)
@@ -1,11 +1,18 @@
 import logging
 from datetime import timedelta
 import warnings
-from typing import List, Dict, Tuple, NamedTuple, IO, Optional, Union
-from enum import Enum, Flag
+from typing import (
+    List,
+    Dict,
+    Tuple,
+    NamedTuple,
+    IO,
+    Iterable,
+    Iterator,
+    Optional,
+    Union,
+)
 from collections import Counter
-import numpy as np
-import json
 from pathlib import Path
 
 from kloppy.domain import (
@@ -25,18 +32,33 @@ from kloppy.domain import (
     Score,
     Team,
     TrackingDataset,
+    TrackingDataStream,
     PlayerData,
 )
 from kloppy.infra.serializers.tracking.deserializer import (
     TrackingDataDeserializer,
+    _prepend,
 )
+from kloppy.infra.serializers.tracking.projection import ObjectProjection
+from kloppy.infra.serializers.tracking.window import FrameWindow, Timestamp
 from kloppy.utils import performance_logging
+from kloppy.infra.serializers import json_backend
 
 logger = logging.getLogger(__name__)
 
 
 frame_rate = 10
 
+# The time at which the periods start
+# TODO: check if the offsets of extra time are correct; just guessing here
+PERIOD_OFFSETS = {
+    1: timedelta(seconds=0),
+    2: timedelta(seconds=45 * 60),
+    3: timedelta(seconds=90 * 60),
+    4: timedelta(seconds=105 * 60),
+    5: timedelta(seconds=120 * 60),
+}
+
 
 class SkillCornerInputs(NamedTuple):
     meta_data: IO[bytes]
@@ -50,9 +72,25 @@ class SkillCornerDeserializer(TrackingDataDeserializer[SkillCornerInputs]):
         sample_rate: Optional[float] = None,
         coordinate_system: Optional[Union[str, Provider]] = None,
         include_empty_frames: Optional[bool] = False,
+        incremental: Optional[bool] = False,
+        target_frame_rate: Optional[float] = None,
+        periods: Optional[List[int]] = None,
+        start: Optional[Timestamp] = None,
+        end: Optional[Timestamp] = None,
+        objects: Optional[List[str]] = None,
     ):
-        super().__init__(limit, sample_rate, coordinate_system)
+        super().__init__(
+            limit,
+            sample_rate,
+            coordinate_system,
+            target_frame_rate,
+            periods,
+            start,
+            end,
+            objects,
+        )
         self.include_empty_frames = include_empty_frames
+        self.incremental = incremental
 
     @property
     def provider(self) -> Provider:
@@ -62,34 +100,25 @@ class SkillCornerDeserializer(TrackingDataDeserializer[SkillCornerInputs]):
     def _get_frame_data(
         cls,
         teams,
-        teamdict,
-        players,
-        player_id_to_team_dict,
+        player_lookup,
         periods,
-        player_dict,
         anon_players,
         ball_id,
-        referee_dict,
+        referee_ids,
         frame,
+        projection: Optional[ObjectProjection] = None,
     ):
-        frame_period = frame["period"]
+        """Create a frame from a raw frame.
+
+        `player_lookup` maps the trackable objects to the players.
+        Anonymous players are created once per group and track id, and
+        stored in `anon_players` for the next frames.
+        """
+        if projection is None:
+            projection = ObjectProjection()
 
         frame_id = frame["frame"]
-        frame_time = cls._timestamp_from_timestring(frame["time"])
-
-        if frame_period == 1:
-            frame_time -= timedelta(seconds=0)
-        elif frame_period == 2:
-            frame_time -= timedelta(seconds=45 * 60)
-        # TODO: check if the below is correct; just guessing here
-        elif frame_period == 3:
-            frame_time -= timedelta(seconds=90 * 60)
-        elif frame_period == 4:
-            frame_time -= timedelta(seconds=105 * 60)
-        elif frame_period == 5:
-            frame_time -= timedelta(seconds=120 * 60)
-        else:
-            raise ValueError(f"Unknown period id {frame_period}")
+        frame_time = cls._period_timestamp(frame)
 
         ball_coordinates = None
         players_data = {}
@@ -106,65 +135,65 @@ class SkillCornerDeserializer(TrackingDataDeserializer[SkillCornerInputs]):
 
         for frame_record in frame["data"]:
             # containing x, y, trackable_object, track_id, group_name
-            x = frame_record.get("x")
-            y = frame_record.get("y")
-
-            trackable_object = frame_record.get("trackable_object", None)
-
-            track_id = frame_record.get("track_id", None)
-            group_name = frame_record.get("group_name", None)
+            trackable_object = frame_record.get("trackable_object")
 
             if trackable_object == ball_id:
-                group_name = "ball"
+                if not projection.includes_ball:
+                    continue
                 z = frame_record.get("z")
                 if z is not None:
                     z = float(z)
-                ball_coordinates = Point3D(x=float(x), y=float(y), z=z)
+                ball_coordinates = Point3D(
+                    x=float(frame_record["x"]), y=float(frame_record["y"]), z=z
+                )
                 continue
 
-            elif trackable_object in referee_dict.keys():
-                group_name = "referee"
+            elif trackable_object in referee_ids:
                 continue  # Skip Referee Coords
 
-            if group_name is None:
-                group_name = teamdict.get(
-                    player_id_to_team_dict.get(trackable_object)
+            if trackable_object is None:
+                key = (
+                    frame_record.get("group_name"),
+                    frame_record.get("track_id"),
                 )
+                player = anon_players.get(key)
+                if player is None:
+                    player = cls.__create_anon_player(teams, frame_record)
+                    anon_players[key] = player
+            else:
+                player = player_lookup.get(trackable_object)
+                if player is None:
+                    continue
 
-                if group_name == "home_team":
-                    player = players["HOME"][trackable_object]
-                elif group_name == "away_team":
-                    player = players["AWAY"][trackable_object]
-
-            if trackable_object is None:
-                player_id = str(track_id)
-                if group_name == "home team":
-                    if f"anon_{player_id}" not in anon_players["HOME"].keys():
-                        player = cls.__create_anon_player(teams, frame_record)
-                        anon_players["HOME"][f"anon_home_{player_id}"] = player
-                    else:
-                        player = anon_players["HOME"][f"anon_home_{player_id}"]
-
-                elif group_name == "away team":
-                    if f"anon_{player_id}" not in anon_players["AWAY"].keys():
-                        player = cls.__create_anon_player(teams, frame_record)
-                        anon_players["AWAY"][f"anon_away_{player_id}"] = player
-                    else:
-                        player = anon_players["AWAY"][f"anon_away_{player_id}"]
-
-            players_data[player] = PlayerData(coordinates=Point(x, y))
+            if not projection.includes_team(player.team):
+                continue
+            players_data[player] = PlayerData(
+                coordinates=Point(frame_record.get("x"), frame_record.get("y"))
+            )
 
         return Frame(
             frame_id=frame_id,
             timestamp=frame_time,
             ball_coordinates=ball_coordinates,
             players_data=players_data,
-            period=periods[frame_period],
+            period=periods[frame["period"]],
             ball_state=None,
             ball_owning_team=ball_owning_team,
             other_data={},
         )
 
+    @classmethod
+    def _period_timestamp(cls, frame) -> timedelta:
+        """The time of the frame from the start of its period."""
+        frame_period = frame["period"]
+        if frame_period not in PERIOD_OFFSETS:
+            raise ValueError(f"Unknown period id {frame_period}")
+
+        return (
+            cls._timestamp_from_timestring(frame["time"])
+            - PERIOD_OFFSETS[frame_period]
+        )
+
     @classmethod
     def _timestamp_from_timestring(cls, timestring):
         parts = timestring.split(":")
@@ -181,75 +210,42 @@ class SkillCornerDeserializer(TrackingDataDeserializer[SkillCornerInputs]):
             raise ValueError("Invalid timestring format")
 
     @classmethod
-    def _get_skillcorner_attacking_directions(cls, frames, periods):
+    def _get_skillcorner_attacking_directions(
+        cls, frames: Iterable[Frame], periods
+    ):
         """
         with only partial tracking data we cannot rely on a single frame to
         infer the attacking directions as a simple average of only some players
         x-coords might not reflect the attacking direction.
         """
-        attacking_directions = {}
-        frame_period_ids = np.array([_frame.period.id for _frame in frames])
-        frame_attacking_directions = np.array(
-            [
+        counts = {period_id: Counter() for period_id in periods}
+        for frame in frames:
+            counts.setdefault(frame.period.id, Counter())[
                 attacking_direction_from_frame(frame)
                 if len(frame.players_data) > 0
                 else AttackingDirection.NOT_SET
-                for frame in frames
-            ]
-        )
+            ] += 1
 
-        for period_id in periods.keys():
-            if period_id in frame_period_ids:
-                count = Counter(
-                    frame_attacking_directions[frame_period_ids == period_id]
-                )
-                attacking_directions[period_id] = count.most_common()[0][0]
-            else:
-                attacking_directions[period_id] = AttackingDirection.NOT_SET
+        return {
+            period_id: count.most_common()[0][0]
+            if count
+            else AttackingDirection.NOT_SET
+            for period_id, count in counts.items()
+        }
 
-        return attacking_directions
-
-    def __load_json(self, file):
+    def __iter_raw_frames(self, file) -> Iterator[dict]:
+        """Decode the raw frames one at a time."""
         if Path(file.name).suffix == ".jsonl":
-            data = []
             for line in file:
-                obj = json.loads(line)
+                if not line.strip():
+                    continue
+                obj = json_backend.loads(line)
                 # for each line rename timestamp to time to make it compatible with existing loader
                 if "timestamp" in obj:
                     obj["time"] = obj.pop("timestamp")
-                data.append(obj)
-            return data
+                yield obj
         else:
-            return json.load(file)
-
-    @classmethod
-    def __get_periods(cls, tracking):
-        """gets the Periods contained in the tracking data"""
-        periods = {}
-
-        _periods = np.array([f["period"] for f in tracking])
-        unique_periods = set(_periods)
-        unique_periods = [
-            period for period in unique_periods if period is not None
-        ]
-
-        for period in unique_periods:
-            _frames = [
-                frame
-                for frame in tracking
-                if frame["period"] == period and frame["time"] is not None
-            ]
-
-            periods[period] = Period(
-                id=period,
-                start_timestamp=timedelta(
-                    seconds=_frames[0]["frame"] / frame_rate
-                ),
-                end_timestamp=timedelta(
-                    seconds=_frames[-1]["frame"] / frame_rate
-                ),
-            )
-        return periods
+            yield from json_backend.iter_items(file)
 
     @classmethod
     def __create_anon_player(cls, teams, frame_record):
@@ -288,30 +284,37 @@ class SkillCornerDeserializer(TrackingDataDeserializer[SkillCornerInputs]):
         )
 
     def deserialize(self, inputs: SkillCornerInputs) -> TrackingDataset:
-        metadata = self.__load_json(inputs.meta_data)
-        raw_data = self.__load_json(inputs.raw_data)
-
-        with performance_logging("Loading metadata", logger=logger):
-            periods = self.__get_periods(raw_data)
+        # Unlike a stream, a dataset has the full bounds of all periods, also
+        # when the load stops early
+        return self.create_dataset(
+            self.iter_records(inputs, complete_periods=True)
+        )
 
-            teamdict = {
-                metadata["home_team"].get("id"): "home_team",
-                metadata["away_team"].get("id"): "away_team",
-            }
+    def iter_records(
+        self, inputs: SkillCornerInputs, complete_periods: bool = False
+    ) -> TrackingDataStream:
+        """Parse the metadata and return a stream of the frames.
 
-            player_to_team_dict = {
-                player["trackable_object"]: player["team_id"]
-                for player in metadata["players"]
-            }
+        The periods of the metadata are found while reading the frames. With
+        `complete_periods`, the remaining frames are scanned for the periods
+        when the stream stops early because of the `limit` or the window.
+        """
+        metadata = json_backend.load(inputs.meta_data)
+        raw_frames = None
+        if (
+            Path(inputs.raw_data.name).suffix != ".jsonl"
+            and not self.incremental
+        ):
+            raw_frames = json_backend.load(inputs.raw_data)
 
+        with performance_logging("Loading metadata", logger=logger):
             player_dict = {
                 player["trackable_object"]: player
                 for player in metadata["players"]
             }
 
-            referee_dict = {
-                ref["trackable_object"]: "referee"
-                for ref in metadata["referees"]
+            referee_ids = {
+                ref["trackable_object"] for ref in metadata["referees"]
             }
             ball_id = metadata["ball"]["trackable_object"]
 
@@ -368,57 +371,133 @@ class SkillCornerDeserializer(TrackingDataDeserializer[SkillCornerInputs]):
 
             home_team.players = list(players["HOME"].values())
             away_team.players = list(players["AWAY"].values())
+            self.projection.validate(teams)
 
-        anon_players = {"HOME": {}, "AWAY": {}}
-
-        with performance_logging("Loading data", logger=logger):
-
-            def _iter():
-                n = 0
-                sample = 1.0 / self.sample_rate
-
-                for frame in raw_data:
-                    frame_period = frame["period"]
-
-                    if frame_period is not None:
-                        if n % sample == 0:
-                            yield frame
-                        n += 1
-
-        frames = []
-
-        n_frames = 0
-        for _frame in _iter():
-            # include frame if there is any tracking data, players or ball.
-            # or if include_empty_frames == True
-            if self.include_empty_frames or len(_frame["data"]) > 0:
-                frame = self._get_frame_data(
-                    teams,
-                    teamdict,
-                    players,
-                    player_to_team_dict,
-                    periods,
-                    player_dict,
-                    anon_players,
-                    ball_id,
-                    referee_dict,
-                    _frame,
-                )
-
-                frame = transformer.transform_frame(frame)
+            player_lookup = {**players["HOME"], **players["AWAY"]}
 
-                frames.append(frame)
-                n_frames += 1
+        anon_players = {}
 
-                if self.limit and n_frames >= self.limit:
+        # The periods are found while reading the frames, by id and ordered
+        # by id for the metadata
+        periods = {}
+        metadata_periods = []
+
+        def _update_periods(frame):
+            if frame["time"] is None:
+                return
+
+            period_id = frame["period"]
+            timestamp = timedelta(seconds=frame["frame"] / frame_rate)
+            period = periods.get(period_id)
+            if period is None:
+                period = Period(
+                    id=period_id,
+                    start_timestamp=timestamp,
+                    end_timestamp=timestamp,
+                )
+                periods[period_id] = period
+                metadata_periods.append(period)
+                metadata_periods.sort(key=lambda p: p.id)
+            else:
+                period.start_timestamp = min(period.start_timestamp, timestamp)
+                period.end_timestamp = max(period.end_timestamp, timestamp)
+
+        def _iter(window: FrameWindow, frames: Iterator[dict]):
+            sampler = self.get_sampler(frame_rate)
+
+            for frame in frames:
+                frame_period = frame["period"]
+
+                if frame_period is not None:
+                    _update_periods(frame)
+
+                    if window:
+                        timestamp = self._period_timestamp(frame)
+                        if window.is_past(frame_period, timestamp):
+                            break
+                        if not window.includes(frame_period, timestamp):
+                            continue
+
+                    if sampler.keep():
+                        yield frame
+
+        def _iter_frames(
+            window: FrameWindow,
+            projection: ObjectProjection,
+            complete_periods: bool = False,
+        ):
+            if raw_frames is not None:
+                frames = iter(raw_frames)
+            else:
+                # Decode the frames one at a time while iterating
+                frames = self.__iter_raw_frames(inputs.raw_data)
+
+            n_frames = 0
+            with performance_logging("Loading data", logger=logger):
+                for _frame in _iter(window, frames):
+                    # include frame if there is any tracking data, players or ball.
+                    # or if include_empty_frames == True
+                    if self.include_empty_frames or len(_frame["data"]) > 0:
+                        frame = self._get_frame_data(
+                            teams,
+                            player_lookup,
+                            periods,
+                            anon_players,
+                            ball_id,
+                            referee_ids,
+                            _frame,
+                            projection,
+                        )
+
+                        yield transformer.transform_frame(frame)
+                        n_frames += 1
+
+                        if self.limit and n_frames >= self.limit:
+                            break
+
+            if complete_periods:
+                for frame in frames:
+                    if frame["period"] is not None:
+                        _update_periods(frame)
+
+        # The attacking direction is a majority vote over all frames of the
+        # first period, so buffer those before handing out the stream.
+        first_period_frames = []
+        if self.window.includes_period(1) and not self.projection:
+            frames = _iter_frames(
+                self.window, self.projection, complete_periods
+            )
+            for frame in frames:
+                first_period_frames.append(frame)
+                if frame.period.id != 1:
                     break
+            attacking_directions = self._get_skillcorner_attacking_directions(
+                first_period_frames, periods
+            )
+        elif raw_frames is not None or inputs.raw_data.seekable():
+            # The first period is not loaded (with all objects), so read it
+            # separately while counting the attacking directions
+            raw_data_start = inputs.raw_data.tell()
+            attacking_directions = self._get_skillcorner_attacking_directions(
+                _iter_frames(FrameWindow([1]), ObjectProjection()), periods
+            )
+            if raw_frames is None:
+                inputs.raw_data.seek(raw_data_start)
+            frames = _iter_frames(
+                self.window, self.projection, complete_periods
+            )
+        else:
+            attacking_directions = {}
+            frames = _iter_frames(
+                self.window, self.projection, complete_periods
+            )
 
-        attacking_directions = self._get_skillcorner_attacking_directions(
-            frames, periods
+        attacking_direction = attacking_directions.get(
+            1, AttackingDirection.NOT_SET
         )
-        if attacking_directions[1] == AttackingDirection.LTR:
+        if attacking_direction == AttackingDirection.LTR:
             orientation = Orientation.HOME_AWAY
-        elif attacking_directions[1] == AttackingDirection.RTL:
+        elif attacking_direction == AttackingDirection.RTL:
             orientation = Orientation.AWAY_HOME
         else:
             warnings.warn(
@@ -428,7 +507,7 @@ class SkillCornerDeserializer(TrackingDataDeserializer[SkillCornerInputs]):
 
         metadata = Metadata(
             teams=teams,
-            periods=sorted(periods.values(), key=lambda p: p.id),
+            periods=metadata_periods,
             pitch_dimensions=transformer.get_to_coordinate_system().pitch_dimensions,
             score=Score(
                 home=metadata["home_team_score"],
@@ -441,7 +520,6 @@ class SkillCornerDeserializer(TrackingDataDeserializer[SkillCornerInputs]):
             coordinate_system=transformer.get_to_coordinate_system(),
         )
 
-        return TrackingDataset(
-            records=frames,
-            metadata=metadata,
+        return TrackingDataStream(
+            metadata=metadata, frames=_prepend(first_period_frames, frames)
         )
@@ -1,30 +1,44 @@
+import heapq
 import logging
-import warnings
-from collections import defaultdict
-from typing import NamedTuple, Optional, Union, IO
+import math
+import sys
+from array import array
+from itertools import groupby
+from operator import itemgetter
+from typing import (
+    Dict,
+    IO,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 from datetime import timedelta
 
-from lxml import objectify
+from lxml import etree, objectify
 
 from kloppy.domain import (
-    TrackingDataset,
+    TrackingDataStream,
     DatasetFlag,
-    AttackingDirection,
     Frame,
     Point,
     Point3D,
     BallState,
     Period,
-    Orientation,
-    attacking_direction_from_frame,
     Metadata,
     Provider,
     PlayerData,
 )
 
+from kloppy.exceptions import DeserializationError
 from kloppy.utils import performance_logging
 
 from ..deserializer import TrackingDataDeserializer
+from ..projection import ObjectProjection
+from ..window import FrameWindow, Timestamp
 from kloppy.infra.serializers.event.sportec.deserializer import (
     sportec_metadata_from_xml_elm,
 )
@@ -39,56 +53,153 @@ PERIOD_ID_TO_GAME_SECTION = {
 }
 
 
-def _read_section_data(data_root, period: Period) -> dict:
+class _ObjectFrames(NamedTuple):
+    """The frames of a single FrameSet (the ball or a player) in compact
+    arrays."""
+
+    frame_ids: array
+    x: array
+    y: array
+    speed: array
+    # Only used for the ball
+    z: array
+    ball_possession: array
+    ball_status: array
+
+
+def _iter_sections(
+    raw_data: IO[bytes],
+    section_frame_ranges: Optional[Dict[str, Tuple[int, int]]] = None,
+    team_ids: Optional[Set[str]] = None,
+) -> Iterator[Tuple[str, Dict[str, _ObjectFrames]]]:
     """
-    Read all data for a single period from data_root.
-
-    Output format:
-    {
-        10_000: {
-            'ball': {
-                'N': "10000",
-                'X': 20.92,
-                'Y': 2.84,
-                'Z': 0.08,
-                'S': 4.91,
-                'BallPossession': "2",
-                'BallStatus': "1"
-                [...]
-            },
-            'DFL-OBJ-002G3I': {
-                'N': "10000",
-                'X': "0.35",
-                'Y': "-25.26",
-                'S': "0.00",
-                [...]
-            },
-            [....]
-        },
-        10_001: {
-          ...
-        }
-    }
+    Read the FrameSets one at a time and yield the (game section, frames
+    by object) of each game section, where the object is "ball" or the
+    person id.
+
+    Elements are cleared once they are read, so only the arrays of the
+    current game section are kept in memory. The FrameSets of a game
+    section must be contiguous (which they are in DFL position files).
+
+    When `section_frame_ranges` is given, only the frames within the
+    (inclusive) frame id range of their game section are kept, and reading
+    stops once all of these game sections are read.
+
+    When `team_ids` is given, the FrameSets of the players of other teams
+    are skipped. The ball FrameSets are always read.
     """
+    game_section = None
+    section_frames = {}
+    read_sections = set()
+    object_frames = None
+    frame_range = None
+    for event, elm in etree.iterparse(
+        raw_data, events=("start", "end"), tag=("FrameSet", "Frame")
+    ):
+        if elm.tag == "Frame":
+            if event == "end":
+                attr = elm.attrib
+                frame_id = int(attr["N"])
+                if object_frames is None or (
+                    frame_range is not None
+                    and not (frame_range[0] <= frame_id <= frame_range[1])
+                ):
+                    elm.clear(keep_tail=True)
+                    while elm.getprevious() is not None:
+                        del elm.getparent()[0]
+                    continue
 
-    game_section = PERIOD_ID_TO_GAME_SECTION[period.id]
-    frame_sets = data_root.findall(
-        f"Positions/FrameSet[@GameSection='{game_section}']"
-    )
+                object_frames.frame_ids.append(frame_id)
+                object_frames.x.append(float(attr["X"]))
+                object_frames.y.append(float(attr["Y"]))
+                object_frames.speed.append(float(attr["S"]))
+                if object_frames.z is not None:
+                    object_frames.z.append(float(attr["Z"]))
+                    object_frames.ball_possession.append(
+                        int(attr["BallPossession"])
+                    )
+                    object_frames.ball_status.append(int(attr["BallStatus"]))
 
-    raw_frames = defaultdict(dict)
-    for frame_set in frame_sets:
-        key = (
-            "ball"
-            if frame_set.attrib["TeamId"] == "BALL"
-            else frame_set.attrib["PersonId"]
-        )
-        for frame in frame_set.iterchildren("Frame"):
-            attr = frame.attrib
-            frame_id = int(attr["N"])
-            raw_frames[frame_id][key] = attr
+                elm.clear(keep_tail=True)
+                while elm.getprevious() is not None:
+                    del elm.getparent()[0]
+        elif event == "start":
+            if elm.attrib["GameSection"] != game_section:
+                if game_section is not None:
+                    yield game_section, section_frames
+                    read_sections.add(game_section)
+
+                if (
+                    section_frame_ranges is not None
+                    and read_sections.issuperset(section_frame_ranges)
+                ):
+                    return
+
+                game_section = elm.attrib["GameSection"]
+                if game_section in read_sections:
+                    raise DeserializationError(
+                        f"FrameSets of game section {game_section} are "
+                        f"not contiguous"
+                    )
+                section_frames = {}
+                if section_frame_ranges is not None:
+                    # Frames of game sections that are not requested are
+                    # not kept
+                    frame_range = section_frame_ranges.get(
+                        game_section, (0, -1)
+                    )
+
+            is_ball = elm.attrib["TeamId"] == "BALL"
+            if (
+                not is_ball
+                and team_ids is not None
+                and elm.attrib["TeamId"] not in team_ids
+            ):
+                object_frames = None
+                continue
+
+            object_frames = _ObjectFrames(
+                frame_ids=array("q"),
+                x=array("d"),
+                y=array("d"),
+                speed=array("d"),
+                z=array("d") if is_ball else None,
+                ball_possession=array("b") if is_ball else None,
+                ball_status=array("b") if is_ball else None,
+            )
+            section_frames[
+                "ball" if is_ball else elm.attrib["PersonId"]
+            ] = object_frames
+        else:
+            elm.clear(keep_tail=True)
+            while elm.getprevious() is not None:
+                del elm.getparent()[0]
+
+    if game_section is not None:
+        yield game_section, section_frames
+
+
+def _iter_section_frames(
+    section_frames: Dict[str, _ObjectFrames]
+) -> Iterator[Tuple[int, List[Tuple[str, int]]]]:
+    """Yield the frame ids of a game section in order, with the (object,
+    index in its arrays) of all objects that have data for the frame."""
+
+    def _keyed_frame_ids(order: int, key: str, object_frames: _ObjectFrames):
+        # Keep the objects of a frame in the order of the FrameSets
+        for index, frame_id in enumerate(object_frames.frame_ids):
+            yield frame_id, order, key, index
 
-    return raw_frames
+    merged = heapq.merge(
+        *(
+            _keyed_frame_ids(order, key, object_frames)
+            for order, (key, object_frames) in enumerate(
+                section_frames.items()
+            )
+        )
+    )
+    for frame_id, frame_objects in groupby(merged, key=itemgetter(0)):
+        yield frame_id, [(key, index) for _, _, key, index in frame_objects]
 
 
 class SportecTrackingDataInputs(NamedTuple):
@@ -107,16 +218,29 @@ class SportecTrackingDataDeserializer(TrackingDataDeserializer):
         sample_rate: Optional[float] = None,
         coordinate_system: Optional[Union[str, Provider]] = None,
         only_alive: Optional[bool] = True,
+        target_frame_rate: Optional[float] = None,
+        periods: Optional[List[int]] = None,
+        start: Optional[Timestamp] = None,
+        end: Optional[Timestamp] = None,
+        objects: Optional[List[str]] = None,
     ):
-        super().__init__(limit, sample_rate, coordinate_system)
+        super().__init__(
+            limit,
+            sample_rate,
+            coordinate_system,
+            target_frame_rate,
+            periods,
+            start,
+            end,
+            objects,
+        )
         self.only_alive = only_alive
 
-    def deserialize(
+    def iter_records(
         self, inputs: SportecTrackingDataInputs
-    ) -> TrackingDataset:
+    ) -> TrackingDataStream:
         with performance_logging("load data", logger=logger):
             match_root = objectify.fromstring(inputs.meta_data.read())
-            data_root = objectify.fromstring(inputs.raw_data.read())
 
         with performance_logging("parse metadata", logger=logger):
             sportec_metadata = sportec_metadata_from_xml_elm(match_root)
@@ -127,97 +251,139 @@ class SportecTrackingDataDeserializer(TrackingDataDeserializer):
                 pitch_width=sportec_metadata.y_max,
             )
 
-        with performance_logging("parse raw data", logger=logger):
-
-            def _iter():
-                player_map = {}
-                for player in home_team.players:
-                    player_map[player.player_id] = player
-                for player in away_team.players:
-                    player_map[player.player_id] = player
-
-                sample = 1.0 / self.sample_rate
-
-                for period in periods:
-                    raw_frames = _read_section_data(data_root, period)
-
-                    # Since python 3.6 dict keep insertion order. Don't need to sort
-                    # on frame ID as it's already sorted.
-                    # Ball FrameSet is always first and contains ALL frame ids. This
-                    # makes sure even with substitutes the data is on order.
-                    for i, (frame_id, frame_data) in enumerate(
-                        sorted(raw_frames.items())
-                    ):
-                        if "ball" not in frame_data:
-                            # Frames without ball data are corrupt.
-                            continue
-
-                        ball_data = frame_data["ball"]
-                        if self.only_alive and ball_data["BallStatus"] != "1":
-                            continue
-
-                        if i % sample == 0:
-                            yield Frame(
-                                frame_id=frame_id,
-                                timestamp=timedelta(
-                                    seconds=(
-                                        frame_id
-                                        # Do subtraction with integers to prevent floating errors
-                                        - period.start_timestamp.seconds
-                                        * sportec_metadata.fps
-                                    )
-                                    / sportec_metadata.fps
-                                ),
-                                ball_owning_team=home_team
-                                if ball_data["BallPossession"] == "1"
-                                else away_team,
-                                ball_state=BallState.ALIVE
-                                if ball_data["BallStatus"] == "1"
-                                else BallState.DEAD,
-                                period=period,
-                                players_data={
-                                    player_map[player_id]: PlayerData(
-                                        coordinates=Point(
-                                            x=float(raw_player_data["X"]),
-                                            y=float(raw_player_data["Y"]),
-                                        ),
-                                        speed=float(raw_player_data["S"]),
-                                    )
-                                    for player_id, raw_player_data in frame_data.items()
-                                    if player_id != "ball"
-                                },
-                                other_data={},
-                                ball_coordinates=Point3D(
-                                    x=float(ball_data["X"]),
-                                    y=float(ball_data["Y"]),
-                                    z=float(ball_data["Z"]),
-                                ),
-                                ball_speed=float(ball_data["S"]),
+        def _section_frame_ranges(
+            window: FrameWindow,
+        ) -> Optional[Dict[str, Tuple[int, int]]]:
+            if not window:
+                return None
+
+            fps = sportec_metadata.fps
+            section_frame_ranges = {}
+            for period in periods:
+                if not window.includes_period(period.id):
+                    continue
+                period_start_frame_id = period.start_timestamp.seconds * fps
+                start_frame_id, end_frame_id = 0, sys.maxsize
+                if window.start is not None:
+                    start_frame_id = period_start_frame_id + math.ceil(
+                        window.start * fps / timedelta(seconds=1)
+                    )
+                if window.end is not None:
+                    end_frame_id = period_start_frame_id + math.floor(
+                        window.end * fps / timedelta(seconds=1)
+                    )
+                section_frame_ranges[PERIOD_ID_TO_GAME_SECTION[period.id]] = (
+                    start_frame_id,
+                    end_frame_id,
+                )
+            return section_frame_ranges
+
+        self.projection.validate(teams)
+
+        def _iter(window: FrameWindow, projection: ObjectProjection):
+            player_map = {}
+            for player in home_team.players:
+                player_map[player.player_id] = player
+            for player in away_team.players:
+                player_map[player.player_id] = player
+
+            periods_by_game_section = {
+                PERIOD_ID_TO_GAME_SECTION[period.id]: period
+                for period in periods
+            }
+
+            sampler = self.get_sampler(sportec_metadata.fps)
+
+            team_ids = None
+            if not projection.includes_all_teams(teams):
+                team_ids = {
+                    team.team_id
+                    for team in teams
+                    if projection.includes_team(team)
+                }
+
+            for game_section, section_frames in _iter_sections(
+                inputs.raw_data, _section_frame_ranges(window), team_ids
+            ):
+                period = periods_by_game_section.get(game_section)
+                if period is None:
+                    continue
+
+                ball_frames = section_frames.get("ball")
+                # Frame ids are sorted within a FrameSet. The ball FrameSet
+                # usually contains ALL frame ids, but frames of substitutes
+                # might not be in there.
+                for i, (frame_id, frame_objects) in enumerate(
+                    _iter_section_frames(section_frames)
+                ):
+                    ball_index = next(
+                        (
+                            index
+                            for key, index in frame_objects
+                            if key == "ball"
+                        ),
+                        None,
+                    )
+                    if ball_index is None:
+                        # Frames without ball data are corrupt.
+                        continue
+
+                    ball_status = ball_frames.ball_status[ball_index]
+                    if self.only_alive and ball_status != 1:
+                        continue
+
+                    if sampler.is_sampled(i):
+                        yield Frame(
+                            frame_id=frame_id,
+                            timestamp=timedelta(
+                                seconds=(
+                                    frame_id
+                                    # Do subtraction with integers to prevent floating errors
+                                    - period.start_timestamp.seconds
+                                    * sportec_metadata.fps
+                                )
+                                / sportec_metadata.fps
+                            ),
+                            ball_owning_team=home_team
+                            if ball_frames.ball_possession[ball_index] == 1
+                            else away_team,
+                            ball_state=BallState.ALIVE
+                            if ball_status == 1
+                            else BallState.DEAD,
+                            period=period,
+                            players_data={
+                                player_map[key]: PlayerData(
+                                    coordinates=Point(
+                                        x=section_frames[key].x[index],
+                                        y=section_frames[key].y[index],
+                                    ),
+                                    speed=section_frames[key].speed[index],
+                                )
+                                for key, index in frame_objects
+                                if key != "ball"
+                            },
+                            other_data={},
+                            ball_coordinates=Point3D(
+                                x=ball_frames.x[ball_index],
+                                y=ball_frames.y[ball_index],
+                                z=ball_frames.z[ball_index],
                             )
+                            if projection.includes_ball
+                            else None,
+                            ball_speed=ball_frames.speed[ball_index],
+                        )
 
-            frames = []
-            for n, frame in enumerate(_iter()):
-                frame = transformer.transform_frame(frame)
-                frames.append(frame)
+        def _iter_frames(window: FrameWindow, projection: ObjectProjection):
+            with performance_logging("parse raw data", logger=logger):
+                for n, frame in enumerate(_iter(window, projection)):
+                    yield transformer.transform_frame(frame)
 
-                if self.limit and n >= self.limit:
-                    break
+                    if self.limit and n >= self.limit:
+                        break
 
-        try:
-            first_frame = next(
-                frame for frame in frames if frame.period.id == 1
-            )
-            orientation = (
-                Orientation.HOME_AWAY
-                if attacking_direction_from_frame(first_frame)
-                == AttackingDirection.LTR
-                else Orientation.AWAY_HOME
-            )
-        except StopIteration:
-            warnings.warn(
-                "Could not determine orientation of dataset, defaulting to NOT_SET"
-            )
-            orientation = Orientation.NOT_SET
+        orientation, frames = self.detect_window_orientation(
+            _iter_frames, inputs.raw_data
+        )
 
         metadata = Metadata(
             teams=teams,
@@ -231,7 +397,4 @@ class SportecTrackingDataDeserializer(TrackingDataDeserializer):
             coordinate_system=transformer.get_to_coordinate_system(),
         )
 
-        return TrackingDataset(
-            records=frames,
-            metadata=metadata,
-        )
+        return TrackingDataStream(metadata=metadata, frames=frames)
@@ -1,19 +1,16 @@
-import json
 import logging
 from datetime import datetime, timedelta
-import warnings
-from typing import IO, Any, Dict, List, NamedTuple, Optional, Union
+from itertools import chain, islice
+from typing import IO, Any, Dict, List, NamedTuple, Optional, Tuple, Union
 
 from lxml import objectify
 
 from kloppy.domain import (
-    AttackingDirection,
     BallState,
     DatasetFlag,
     Frame,
     Ground,
     Metadata,
-    Orientation,
     Period,
     Player,
     PlayerData,
@@ -21,15 +18,21 @@ from kloppy.domain import (
     Point3D,
     Provider,
     Team,
-    TrackingDataset,
-    attacking_direction_from_frame,
+    TrackingDataStream,
 )
 from kloppy.utils import performance_logging
+from kloppy.infra.serializers import json_backend
 
 from .deserializer import TrackingDataDeserializer
+from .frame_index import iter_lines
+from .projection import ObjectProjection
+from .window import FrameWindow, Timestamp
 
 logger = logging.getLogger(__name__)
 
+# Number of lines used to determine the frame rate
+FRAME_RATE_SAMPLE_SIZE = 1000
+
 
 class StatsPerformInputs(NamedTuple):
     meta_data: IO[bytes]
@@ -43,8 +46,22 @@ class StatsPerformDeserializer(TrackingDataDeserializer[StatsPerformInputs]):
         sample_rate: Optional[float] = None,
         coordinate_system: Optional[Union[str, Provider]] = None,
         only_alive: Optional[bool] = True,
+        target_frame_rate: Optional[float] = None,
+        periods: Optional[List[int]] = None,
+        start: Optional[Timestamp] = None,
+        end: Optional[Timestamp] = None,
+        objects: Optional[List[str]] = None,
     ):
-        super().__init__(limit, sample_rate, coordinate_system)
+        super().__init__(
+            limit,
+            sample_rate,
+            coordinate_system,
+            target_frame_rate,
+            periods,
+            start,
+            end,
+            objects,
+        )
         self.only_alive = only_alive
 
     @property
@@ -70,7 +87,14 @@ class StatsPerformDeserializer(TrackingDataDeserializer[StatsPerformInputs]):
         return frame_rate
 
     @classmethod
-    def _frame_from_framedata(cls, teams_list, period, frame_data):
+    def _frame_from_framedata(
+        cls,
+        teams_list,
+        period,
+        frame_data,
+        team_indices: Tuple[int, ...] = (0, 1),
+        include_ball: bool = True,
+    ):
         components = frame_data[1].split(":")
         frame_info = components[0].split(";")
 
@@ -83,7 +107,7 @@ class StatsPerformDeserializer(TrackingDataDeserializer[StatsPerformInputs]):
         ball_state = BallState.ALIVE if match_status == 0 else BallState.DEAD
         ball_owning_team = None
 
-        if len(components) > 2:
+        if include_ball and len(components) > 2:
             ball_data = components[2].split(";")[0].split(",")
             ball_x, ball_y, ball_z = map(float, ball_data)
             ball_coordinates = Point3D(ball_x, ball_y, ball_z)
@@ -91,19 +115,22 @@ class StatsPerformDeserializer(TrackingDataDeserializer[StatsPerformInputs]):
             ball_coordinates = None
 
         players_data = {}
-        player_info = components[1].split(";")[:-1]
+        player_info = components[1].split(";")[:-1] if team_indices else []
         for player_data in player_info:
             player_data = player_data.split(",")
 
             team_side_id = int(player_data[0])
+            # Goalkeepers have id 3 and 4
+            if team_side_id > 2:
+                team_side_id = team_side_id - 3
+            if team_side_id not in team_indices:
+                continue
+
             player_id = player_data[1]
             jersey_no = int(player_data[2])
             x = float(player_data[3])
             y = float(player_data[4])
 
-            # Goalkeepers have id 3 and 4
-            if team_side_id > 2:
-                team_side_id = team_side_id - 3
             team = teams_list[team_side_id]
             player = team.get_player_by_id(player_id)
 
@@ -255,8 +282,7 @@ class StatsPerformDeserializer(TrackingDataDeserializer[StatsPerformInputs]):
                 )
         return parsed_players
 
-    def deserialize(self, inputs: StatsPerformInputs) -> TrackingDataset:
-        tracking_data = inputs.raw_data.read().decode("ascii").splitlines()
+    def iter_records(self, inputs: StatsPerformInputs) -> TrackingDataStream:
         meta_data = inputs.meta_data.read()
 
         with performance_logging("Loading meta data", logger=logger):
@@ -266,7 +292,7 @@ class StatsPerformDeserializer(TrackingDataDeserializer[StatsPerformInputs]):
                 parsed_teams = self.__parse_teams_from_xml(match)
                 parsed_players = self.__parse_players_from_xml(match)
             else:
-                match = json.loads(meta_data)
+                match = json_backend.loads(meta_data)
                 parsed_periods = self.__parse_periods_from_json(match)
                 parsed_teams = self.__parse_teams_from_json(match)
                 parsed_players = self.__parse_players_from_json(match)
@@ -307,51 +333,71 @@ class StatsPerformDeserializer(TrackingDataDeserializer[StatsPerformInputs]):
                 )
                 team.players.append(player)
             teams_list = list(teams.values())
-
-        with performance_logging("Loading tracking data", logger=logger):
-            frame_rate = self.__get_frame_rate(tracking_data)
-
-            transformer = self.get_transformer()
-
-            def _iter():
-                n = 0
-                sample = 1.0 / self.sample_rate
-
-                for line_ in tracking_data:
-                    splits = line_.split(";")[1].split(",")
-                    period_id = int(splits[1])
-                    period_ = periods[period_id]
-                    if n % sample == 0:
-                        yield period_, line_
-                    n += 1
-
-            frames = []
-            for n, frame_data in enumerate(_iter(), start=1):
-                period = frame_data[0]
-                frame = self._frame_from_framedata(
-                    teams_list, period, frame_data
-                )
-                frame = transformer.transform_frame(frame)
-                frames.append(frame)
-
-                if self.limit and n >= self.limit:
-                    break
-
-        try:
-            first_frame = next(
-                frame for frame in frames if frame.period.id == 1
+            self.projection.validate(teams_list)
+
+        def _iter_lines():
+            # Decode the lines lazily, so reading stops once the limit is
+            # reached
+            lines = (
+                line.decode("ascii").strip()
+                for line in iter_lines(inputs.raw_data)
             )
-            orientation = (
-                Orientation.HOME_AWAY
-                if attacking_direction_from_frame(first_frame)
-                == AttackingDirection.LTR
-                else Orientation.AWAY_HOME
-            )
-        except StopIteration:
-            warnings.warn(
-                "Could not determine orientation of dataset, defaulting to NOT_SET"
-            )
-            orientation = Orientation.NOT_SET
+            return (line for line in lines if line)
+
+        # The frame rate is determined from the first lines
+        raw_data_seekable = inputs.raw_data.seekable()
+        if raw_data_seekable:
+            raw_data_start = inputs.raw_data.tell()
+        tracking_data = _iter_lines()
+        first_lines = list(islice(tracking_data, FRAME_RATE_SAMPLE_SIZE))
+        if raw_data_seekable:
+            # Read the first lines again with the others
+            inputs.raw_data.seek(raw_data_start)
+        else:
+            tracking_data = chain(first_lines, tracking_data)
+
+        frame_rate = self.__get_frame_rate(first_lines)
+        transformer = self.get_transformer()
+        last_period_id = max(periods) if periods else None
+
+        def _iter(window: FrameWindow):
+            sampler = self.get_sampler(frame_rate)
+
+            lines = _iter_lines() if raw_data_seekable else tracking_data
+            for line_ in lines:
+                splits = line_.split(";")[1].split(",")
+                period_id = int(splits[1])
+                if window:
+                    # Skip the frames outside the window before parsing
+                    timestamp = timedelta(seconds=int(splits[0]) / 1000)
+                    if window.is_past(period_id, timestamp, last_period_id):
+                        break
+                    if not window.includes(period_id, timestamp):
+                        continue
+
+                if sampler.keep():
+                    yield periods[period_id], line_
+
+        def _iter_frames(window: FrameWindow, projection: ObjectProjection):
+            team_indices = projection.team_indices(teams_list)
+            with performance_logging("Loading tracking data", logger=logger):
+                for n, frame_data in enumerate(_iter(window), start=1):
+                    period = frame_data[0]
+                    frame = self._frame_from_framedata(
+                        teams_list,
+                        period,
+                        frame_data,
+                        team_indices,
+                        projection.includes_ball,
+                    )
+                    yield transformer.transform_frame(frame)
+
+                    if self.limit and n >= self.limit:
+                        break
+
+        orientation, frames = self.detect_window_orientation(
+            _iter_frames, inputs.raw_data
+        )
 
         meta_data = Metadata(
             teams=teams_list,
@@ -365,7 +411,4 @@ class StatsPerformDeserializer(TrackingDataDeserializer[StatsPerformInputs]):
             coordinate_system=transformer.get_to_coordinate_system(),
         )
 
-        return TrackingDataset(
-            records=frames,
-            metadata=meta_data,
-        )
+        return TrackingDataStream(metadata=meta_data, frames=frames)
@@ -1,28 +1,41 @@
 import logging
-from datetime import timedelta
+import os
 import warnings
-from typing import Dict, Optional, Union
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import timedelta
+from itertools import islice
+from typing import (
+    IO,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 import html
 
 from lxml import objectify
 
 from kloppy.domain import (
-    TrackingDataset,
+    TrackingDataStream,
     DatasetFlag,
-    AttackingDirection,
     Frame,
     Point,
     Point3D,
     Team,
     BallState,
     Period,
-    Orientation,
-    attacking_direction_from_frame,
     Metadata,
     Ground,
     Player,
     Provider,
     PlayerData,
+    Orientation,
 )
 from kloppy.exceptions import DeserializationError
 
@@ -30,9 +43,369 @@ from kloppy.utils import Readable, performance_logging
 
 from .common import TRACABInputs
 from ..deserializer import TrackingDataDeserializer
+from ..frame_index import FrameIndex, iter_lines
+from ..projection import ObjectProjection
+from ..window import FrameWindow, Timestamp, frame_range_includes_start
 
 logger = logging.getLogger(__name__)
 
+# Number of lines that are parsed at once
+BATCH_SIZE = 1000
+
+
+def _frame_index_key(line: bytes) -> Optional[Tuple[int, int]]:
+    frame_id, sep, _ = line.partition(b":")
+    if not sep:
+        return None
+    return int(frame_id), 0
+
+
+# (team index, jersey number, x, y, speed)
+RawPlayerData = Tuple[int, int, float, float, float]
+# (frame id, players, ball coordinates, ball owning team index, ball state)
+RawFrame = Tuple[
+    int, List[RawPlayerData], Tuple[float, float, float], int, BallState
+]
+
+
+# Indices of the home and away team
+ALL_TEAM_INDICES = (0, 1)
+
+
+def _parse_line(
+    line: str, team_indices: Tuple[int, ...] = ALL_TEAM_INDICES
+) -> RawFrame:
+    """Parse a line of raw data. Only the players of the teams at
+    `team_indices` are parsed."""
+    frame_id, players, ball = line.strip().split(":")[:3]
+    if not team_indices:
+        players = ""
+
+    players_data = []
+    for player_data in players.split(";")[:-1]:
+        team_id, target_id, jersey_no, x, y, speed = player_data.split(",")
+        team_id = int(team_id)
+
+        if team_id == 1:
+            team_index = 0
+        elif team_id == 0:
+            team_index = 1
+        elif team_id in (-1, 3, 4):
+            continue
+        else:
+            raise DeserializationError(f"Unknown Player Team ID: {team_id}")
+
+        if team_index not in team_indices:
+            continue
+        players_data.append(
+            (team_index, int(jersey_no), float(x), float(y), float(speed))
+        )
+
+    (
+        ball_x,
+        ball_y,
+        ball_z,
+        ball_speed,
+        ball_owning_team,
+        ball_state,
+    ) = ball.rstrip(";").split(",")[:6]
+
+    if ball_owning_team == "H":
+        ball_owning_team_index = 0
+    elif ball_owning_team == "A":
+        ball_owning_team_index = 1
+    else:
+        raise DeserializationError(
+            f"Unknown ball owning team: {ball_owning_team}"
+        )
+
+    if ball_state == "Alive":
+        ball_state = BallState.ALIVE
+    elif ball_state == "Dead":
+        ball_state = BallState.DEAD
+    else:
+        raise DeserializationError(f"Unknown ball state: {ball_state}")
+
+    return (
+        int(frame_id),
+        players_data,
+        (float(ball_x), float(ball_y), float(ball_z)),
+        ball_owning_team_index,
+        ball_state,
+    )
+
+
+def _iter_period_lines(
+    lines: Iterable[bytes],
+    periods: List[Tuple[timedelta, timedelta]],
+    frame_rate: int,
+    frame_range: Optional[Tuple[int, int]],
+    only_alive: bool,
+) -> Iterator[Tuple[int, str]]:
+    """Yield the (period index, line) of the lines within the (start, end)
+    timestamps of `periods`. Stops at the first line after the last period,
+    as the lines are ordered by frame id."""
+    for line_ in lines:
+        line_ = line_.strip().decode("ascii")
+        if not line_:
+            continue
+
+        frame_id = int(line_[:10].split(":", 1)[0])
+        timestamp = timedelta(seconds=frame_id / frame_rate)
+        if not periods or timestamp > periods[-1][1]:
+            break
+        if frame_range and not (frame_range[0] <= frame_id <= frame_range[1]):
+            continue
+        if only_alive and not line_.endswith("Alive;:"):
+            continue
+
+        for period_index, (start_timestamp, end_timestamp) in enumerate(
+            periods
+        ):
+            if start_timestamp <= timestamp <= end_timestamp:
+                yield period_index, line_
+
+
+class _ParsedLines(NamedTuple):
+    """Lines of raw data decoded into flat NumPy arrays (or lists when NumPy
+    is not installed). They are cheap to send from a worker process."""
+
+    period_indices: Sequence[int]
+    frame_ids: Sequence[int]
+    ball_coordinates: Sequence[float]  # x, y, z per frame
+    ball_owning_teams: Sequence[int]
+    ball_alive: Sequence[bool]
+    player_offsets: Sequence[int]  # start of the players of each frame
+    player_teams: Sequence[int]
+    player_jerseys: Sequence[int]
+    player_values: Sequence[float]  # x, y, speed per player
+
+    @classmethod
+    def from_raw_frames(
+        cls, raw_frames: Iterable[Tuple[int, RawFrame]]
+    ) -> "_ParsedLines":
+        parsed = cls([], [], [], [], [], [0], [], [], [])
+        for period_index, (
+            frame_id,
+            players_data,
+            ball_coordinates,
+            ball_owning_team_index,
+            ball_state,
+        ) in raw_frames:
+            parsed.period_indices.append(period_index)
+            parsed.frame_ids.append(frame_id)
+            parsed.ball_coordinates.extend(ball_coordinates)
+            parsed.ball_owning_teams.append(ball_owning_team_index)
+            parsed.ball_alive.append(ball_state == BallState.ALIVE)
+            for team_index, jersey_no, x, y, speed in players_data:
+                parsed.player_teams.append(team_index)
+                parsed.player_jerseys.append(jersey_no)
+                parsed.player_values.extend((x, y, speed))
+            parsed.player_offsets.append(len(parsed.player_teams))
+        return parsed
+
+    def raw_frames(self) -> Iterator[Tuple[int, RawFrame]]:
+        ball_coordinates = list(self.ball_coordinates)
+        player_offsets = list(self.player_offsets)
+        player_teams = list(self.player_teams)
+        player_jerseys = list(self.player_jerseys)
+        player_values = list(self.player_values)
+        for i, (
+            period_index,
+            frame_id,
+            ball_owning_team,
+            ball_alive,
+        ) in enumerate(
+            zip(
+                list(self.period_indices),
+                list(self.frame_ids),
+                list(self.ball_owning_teams),
+                list(self.ball_alive),
+            )
+        ):
+            players_data = [
+                (
+                    int(player_teams[j]),
+                    int(player_jerseys[j]),
+                    float(player_values[3 * j]),
+                    float(player_values[3 * j + 1]),
+                    float(player_values[3 * j + 2]),
+                )
+                for j in range(player_offsets[i], player_offsets[i + 1])
+            ]
+            yield int(period_index), (
+                int(frame_id),
+                players_data,
+                (
+                    float(ball_coordinates[3 * i]),
+                    float(ball_coordinates[3 * i + 1]),
+                    float(ball_coordinates[3 * i + 2]),
+                ),
+                int(ball_owning_team),
+                BallState.ALIVE if ball_alive else BallState.DEAD,
+            )
+
+    def select(self, indices: List[int]) -> "_ParsedLines":
+        """Only keep the frames at `indices`."""
+        raw_frames = list(self.raw_frames())
+        return self.from_raw_frames(raw_frames[i] for i in indices)
+
+
+def _parse_lines_numpy(
+    period_indices: Sequence[int],
+    lines: Sequence[str],
+    team_indices: Tuple[int, ...] = ALL_TEAM_INDICES,
+) -> Optional[_ParsedLines]:
+    """Decode the player and ball sections of all lines at once. Returns
+    None when a line is malformed."""
+    import numpy as np
+
+    sections = [line.split(":", 3) for line in lines]
+    if any(len(section) < 3 for section in sections):
+        return None
+
+    if team_indices:
+        players = [section[1] for section in sections]
+    else:
+        # Don't decode the players when no team is loaded
+        players = [""] * len(sections)
+    player_counts = np.fromiter(
+        (section.count(";") for section in players),
+        dtype=np.int64,
+        count=len(players),
+    )
+    player_text = "".join(players).replace(";", ",")
+    if player_text:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", DeprecationWarning)
+            try:
+                values = np.fromstring(player_text, dtype=float, sep=",")
+            except ValueError:
+                return None
+    else:
+        values = np.empty(0, dtype=float)
+    if values.size != player_counts.sum() * 6:
+        return None
+    values = values.reshape(-1, 6)
+
+    team_ids = values[:, 0].astype(np.int64)
+    on_pitch = (team_ids == 0) | (team_ids == 1)
+    unknown = ~(on_pitch | np.isin(team_ids, (-1, 3, 4)))
+    if unknown.any():
+        raise DeserializationError(
+            f"Unknown Player Team ID: {team_ids[unknown][0]}"
+        )
+
+    if len(team_indices) < len(ALL_TEAM_INDICES):
+        # Team id 1 is the home team (index 0), 0 the away team (index 1)
+        on_pitch &= np.isin(team_ids, [1 - index for index in team_indices])
+
+    frame_indices = np.repeat(np.arange(len(lines)), player_counts)[on_pitch]
+    player_offsets = np.zeros(len(lines) + 1, dtype=np.int64)
+    np.cumsum(
+        np.bincount(frame_indices, minlength=len(lines)),
+        out=player_offsets[1:],
+    )
+
+    balls = [section[2].rstrip(";").split(",")[:6] for section in sections]
+    ball_owning_teams = []
+    ball_alive = []
+    for ball in balls:
+        if ball[4] == "H":
+            ball_owning_teams.append(0)
+        elif ball[4] == "A":
+            ball_owning_teams.append(1)
+        else:
+            raise DeserializationError(f"Unknown ball owning team: {ball[4]}")
+
+        if ball[5] == "Alive":
+            ball_alive.append(True)
+        elif ball[5] == "Dead":
+            ball_alive.append(False)
+        else:
+            raise DeserializationError(f"Unknown ball state: {ball[5]}")
+
+    return _ParsedLines(
+        period_indices=np.asarray(period_indices, dtype=np.int64),
+        frame_ids=np.array(
+            [int(section[0]) for section in sections], dtype=np.int64
+        ),
+        ball_coordinates=np.array(
+            [ball[:3] for ball in balls], dtype=float
+        ).ravel(),
+        ball_owning_teams=np.array(ball_owning_teams, dtype=np.int8),
+        ball_alive=np.array(ball_alive, dtype=bool),
+        player_offsets=player_offsets,
+        player_teams=np.where(team_ids[on_pitch] == 1, 0, 1),
+        player_jerseys=values[on_pitch, 2].astype(np.int64),
+        player_values=values[on_pitch][:, 3:].ravel(),
+    )
+
+
+def _parse_lines(
+    period_indices: Sequence[int],
+    lines: Sequence[str],
+    team_indices: Tuple[int, ...] = ALL_TEAM_INDICES,
+) -> _ParsedLines:
+    try:
+        parsed = _parse_lines_numpy(period_indices, lines, team_indices)
+    except ImportError:
+        parsed = None
+
+    if parsed is None:
+        parsed = _ParsedLines.from_raw_frames(
+            (period_index, _parse_line(line, team_indices))
+            for period_index, line in zip(period_indices, lines)
+        )
+    return parsed
+
+
+def _parse_chunk(
+    path: str,
+    start: int,
+    end: int,
+    periods: List[Tuple[timedelta, timedelta]],
+    frame_rate: int,
+    frame_range: Optional[Tuple[int, int]],
+    only_alive: bool,
+    team_indices: Tuple[int, ...],
+) -> _ParsedLines:
+    with open(path, "rb") as fp:
+        period_lines = list(
+            _iter_period_lines(
+                iter_lines(fp, [(start, end)]),
+                periods,
+                frame_rate,
+                frame_range,
+                only_alive,
+            )
+        )
+    if not period_lines:
+        return _ParsedLines.from_raw_frames([])
+    return _parse_lines(*zip(*period_lines), team_indices)
+
+
+def _split_byte_ranges(
+    fp: IO[bytes], byte_ranges: List[Tuple[int, int]], n_chunks: int
+) -> List[Tuple[int, int]]:
+    """Split `byte_ranges` into about `n_chunks` ranges at line boundaries."""
+    chunk_size = max(
+        sum(end - start for start, end in byte_ranges) // n_chunks, 1
+    )
+
+    chunks = []
+    for start, end in byte_ranges:
+        while end - start > chunk_size:
+            fp.seek(start + chunk_size)
+            fp.readline()
+            boundary = fp.tell()
+            if boundary >= end:
+                break
+            chunks.append((start, boundary))
+            start = boundary
+        chunks.append((start, end))
+    return chunks
+
 
 class TRACABDatDeserializer(TrackingDataDeserializer[TRACABInputs]):
     def __init__(
@@ -41,9 +414,29 @@ class TRACABDatDeserializer(TrackingDataDeserializer[TRACABInputs]):
         sample_rate: Optional[float] = None,
         coordinate_system: Optional[Union[str, Provider]] = None,
         only_alive: Optional[bool] = True,
+        frame_range: Optional[Tuple[int, int]] = None,
+        periods: Optional[List[int]] = None,
+        use_frame_index: Optional[bool] = False,
+        n_workers: Optional[int] = None,
+        target_frame_rate: Optional[float] = None,
+        start: Optional[Timestamp] = None,
+        end: Optional[Timestamp] = None,
+        objects: Optional[List[str]] = None,
     ):
-        super().__init__(limit, sample_rate, coordinate_system)
+        super().__init__(
+            limit,
+            sample_rate,
+            coordinate_system,
+            target_frame_rate,
+            periods,
+            start,
+            end,
+            objects,
+        )
         self.only_alive = only_alive
+        self.frame_range = frame_range
+        self.use_frame_index = use_frame_index
+        self.n_workers = n_workers
 
     @property
     def provider(self) -> Provider:
@@ -51,78 +444,208 @@ class TRACABDatDeserializer(TrackingDataDeserializer[TRACABInputs]):
 
     @classmethod
     def _frame_from_line(cls, teams, period, line, frame_rate):
-        line = str(line)
-        frame_id, players, ball = line.strip().split(":")[:3]
-
-        players_data = {}
-
-        for player_data in players.split(";")[:-1]:
-            team_id, target_id, jersey_no, x, y, speed = player_data.split(",")
-            team_id = int(team_id)
+        return cls._create_frame(
+            teams, period, _parse_line(str(line)), frame_rate
+        )
 
-            if team_id == 1:
-                team = teams[0]
-            elif team_id == 0:
-                team = teams[1]
-            elif team_id in (-1, 3, 4):
-                continue
-            else:
-                raise DeserializationError(
-                    f"Unknown Player Team ID: {team_id}"
-                )
+    @classmethod
+    def _create_frame(
+        cls,
+        teams,
+        period,
+        raw_frame: RawFrame,
+        frame_rate,
+        include_ball: bool = True,
+    ):
+        (
+            frame_id,
+            raw_players_data,
+            ball_coordinates,
+            ball_owning_team_index,
+            ball_state,
+        ) = raw_frame
 
+        players_data = {}
+        for team_index, jersey_no, x, y, speed in raw_players_data:
+            team = teams[team_index]
             player = team.get_player_by_jersey_number(jersey_no)
             if player:
                 players_data[player] = PlayerData(
-                    coordinates=Point(float(x), float(y)), speed=float(speed)
+                    coordinates=Point(x, y), speed=speed
                 )
             else:
-                # continue
                 raise DeserializationError(
                     f"Player not found for player jersey no {jersey_no} of team: {team.name}"
                 )
 
-        (
-            ball_x,
-            ball_y,
-            ball_z,
-            ball_speed,
-            ball_owning_team,
-            ball_state,
-        ) = ball.rstrip(";").split(",")[:6]
-
-        frame_id = int(frame_id)
-
-        if ball_owning_team == "H":
-            ball_owning_team = teams[0]
-        elif ball_owning_team == "A":
-            ball_owning_team = teams[1]
-        else:
-            raise DeserializationError(
-                f"Unknown ball owning team: {ball_owning_team}"
-            )
-
-        if ball_state == "Alive":
-            ball_state = BallState.ALIVE
-        elif ball_state == "Dead":
-            ball_state = BallState.DEAD
-        else:
-            raise DeserializationError(f"Unknown ball state: {ball_state}")
-
         return Frame(
             frame_id=frame_id,
             timestamp=timedelta(seconds=frame_id / frame_rate)
             - period.start_timestamp,
-            ball_coordinates=Point3D(
-                float(ball_x), float(ball_y), float(ball_z)
-            ),
+            ball_coordinates=Point3D(*ball_coordinates)
+            if include_ball
+            else None,
             ball_state=ball_state,
-            ball_owning_team=ball_owning_team,
+            ball_owning_team=teams[ball_owning_team_index],
             players_data=players_data,
             period=period,
             other_data={},
         )
 
+    @classmethod
+    def _create_frames(
+        cls,
+        parsed: _ParsedLines,
+        periods: List[Period],
+        teams: List[Team],
+        players: Dict[Tuple[int, int], Player],
+        frame_rate: int,
+        transformer,
+        include_ball: bool = True,
+    ) -> List[Frame]:
+        """Create the (transformed) frames of a batch of parsed lines. The
+        coordinates are transformed at once, players are looked up by
+        (team index, jersey number) in `players` and the timestamps are
+        derived from the frame ids."""
+        try:
+            import numpy as np
+        except ImportError:
+            return [
+                transformer.transform_frame(
+                    cls._create_frame(
+                        teams,
+                        periods[period_index],
+                        raw_frame,
+                        frame_rate,
+                        include_ball,
+                    )
+                )
+                for period_index, raw_frame in parsed.raw_frames()
+            ]
+
+        period_indices = np.asarray(parsed.period_indices, dtype=np.int64)
+        frame_ids = np.asarray(parsed.frame_ids, dtype=np.int64)
+        ball_owning_teams = np.asarray(
+            parsed.ball_owning_teams, dtype=np.int64
+        )
+        player_offsets = np.asarray(parsed.player_offsets, dtype=np.int64)
+
+        period_starts = np.array(
+            [
+                period.start_timestamp // timedelta(microseconds=1)
+                for period in periods
+            ],
+            dtype=np.int64,
+        )
+        timestamps = (
+            np.rint(frame_ids * 1_000_000 / frame_rate).astype(np.int64)
+            - period_starts[period_indices]
+        )
+
+        # Look up every distinct (team index, jersey number) only once
+        player_codes = np.asarray(
+            parsed.player_jerseys, dtype=np.int64
+        ) * 2 + np.asarray(parsed.player_teams, dtype=np.int64)
+        unique_codes, player_indices = np.unique(
+            player_codes, return_inverse=True
+        )
+        unique_players = []
+        for code in unique_codes.tolist():
+            jersey_no, team_index = divmod(code, 2)
+            player = players.get((team_index, jersey_no))
+            if not player:
+                raise DeserializationError(
+                    f"Player not found for player jersey no {jersey_no} of team: {teams[team_index].name}"
+                )
+            unique_players.append(player)
+        frame_players = [unique_players[i] for i in player_indices.tolist()]
+
+        flips = np.array(
+            transformer.get_flips(
+                [
+                    (teams[team_index], periods[period_index])
+                    for team_index, period_index in zip(
+                        ball_owning_teams.tolist(), period_indices.tolist()
+                    )
+                ]
+            ),
+            dtype=bool,
+        )
+        ball_coordinates = np.asarray(
+            parsed.ball_coordinates, dtype=float
+        ).reshape(-1, 3)
+        ball_x, ball_y, ball_z = transformer.transform_coordinates(
+            ball_coordinates[:, 0],
+            ball_coordinates[:, 1],
+            ball_coordinates[:, 2],
+            flips,
+        )
+        player_values = np.asarray(parsed.player_values, dtype=float).reshape(
+            -1, 3
+        )
+        player_x, player_y, _ = transformer.transform_coordinates(
+            player_values[:, 0],
+            player_values[:, 1],
+            None,
+            np.repeat(flips, np.diff(player_offsets)),
+        )
+
+        players_data = [
+            PlayerData(coordinates=Point(x, y), speed=speed)
+            for x, y, speed in zip(
+                player_x.tolist(),
+                player_y.tolist(),
+                player_values[:, 2].tolist(),
+            )
+        ]
+        player_offsets = player_offsets.tolist()
+
+        frames = []
+        for i, (
+            period_index,
+            frame_id,
+            timestamp,
+            ball_owning_team_index,
+            ball_alive,
+            x,
+            y,
+            z,
+        ) in enumerate(
+            zip(
+                period_indices.tolist(),
+                frame_ids.tolist(),
+                timestamps.tolist(),
+                ball_owning_teams.tolist(),
+                np.asarray(parsed.ball_alive, dtype=bool).tolist(),
+                ball_x.tolist(),
+                ball_y.tolist(),
+                ball_z.tolist(),
+            )
+        ):
+            start, end = player_offsets[i], player_offsets[i + 1]
+            frames.append(
+                Frame(
+                    frame_id=frame_id,
+                    timestamp=timedelta(microseconds=timestamp),
+                    ball_coordinates=Point3D(x, y, z)
+                    if include_ball
+                    else None,
+                    ball_state=BallState.ALIVE
+                    if ball_alive
+                    else BallState.DEAD,
+                    ball_owning_team=teams[ball_owning_team_index],
+                    players_data=dict(
+                        zip(
+                            frame_players[start:end],
+                            players_data[start:end],
+                        )
+                    ),
+                    period=periods[period_index],
+                    other_data={},
+                )
+            )
+        return frames
+
     @staticmethod
     def __validate_inputs(inputs: Dict[str, Readable]):
         if "metadata" not in inputs:
@@ -157,7 +680,7 @@ class TRACABDatDeserializer(TrackingDataDeserializer[TRACABInputs]):
 
         return team
 
-    def deserialize(self, inputs: TRACABInputs) -> TrackingDataset:
+    def iter_records(self, inputs: TRACABInputs) -> TrackingDataStream:
         with performance_logging("Loading metadata", logger=logger):
             meta_data = objectify.fromstring(inputs.meta_data.read())
             match = meta_data.match
@@ -190,59 +713,223 @@ class TRACABDatDeserializer(TrackingDataDeserializer[TRACABInputs]):
             )
             teams = [home_team, away_team]
 
-        with performance_logging("Loading data", logger=logger):
-            transformer = self.get_transformer(
-                pitch_length=pitch_size_width, pitch_width=pitch_size_height
+            # (team index, jersey number) -> player
+            players = {}
+            for team_index, team in enumerate(teams):
+                for player in team.players:
+                    players.setdefault((team_index, player.jersey_no), player)
+
+        self.projection.validate(teams)
+
+        transformer = self.get_transformer(
+            pitch_length=pitch_size_width, pitch_width=pitch_size_height
+        )
+
+        frame_index = (
+            FrameIndex.for_file(inputs.raw_data, _frame_index_key)
+            if self.use_frame_index
+            else None
+        )
+
+        def _byte_ranges(
+            periods_: List[Period], frame_range, window: FrameWindow
+        ):
+            if not frame_index:
+                return None
+
+            frame_ranges = []
+            for start_frame_id, end_frame_id in window.frame_id_ranges(
+                periods_, frame_rate
+            ):
+                if frame_range:
+                    start_frame_id = max(start_frame_id, frame_range[0])
+                    end_frame_id = min(end_frame_id, frame_range[1])
+                frame_ranges.append((start_frame_id, end_frame_id))
+            return frame_index.byte_ranges(frame_ranges)
+
+        def _iter_parsed(
+            periods_: List[Period],
+            frame_range,
+            window: FrameWindow,
+            projection: ObjectProjection,
+        ):
+            period_bounds = [window.clip(p) for p in periods_]
+            lines = self.get_sampler(frame_rate).sample(
+                _iter_period_lines(
+                    iter_lines(
+                        inputs.raw_data,
+                        _byte_ranges(periods_, frame_range, window),
+                    ),
+                    period_bounds,
+                    frame_rate,
+                    frame_range,
+                    self.only_alive,
+                )
             )
+            if self.limit:
+                lines = islice(lines, self.limit + 1)
 
-            def _iter():
-                n = 0
-                sample = 1.0 / self.sample_rate
-
-                for line_ in inputs.raw_data.readlines():
-                    line_ = line_.strip().decode("ascii")
-                    if not line_:
-                        continue
-
-                    frame_id = int(line_[:10].split(":", 1)[0])
-                    if self.only_alive and not line_.endswith("Alive;:"):
-                        continue
-
-                    for period_ in periods:
-                        if (
-                            period_.start_timestamp
-                            <= timedelta(seconds=frame_id / frame_rate)
-                            <= period_.end_timestamp
-                        ):
-                            if n % sample == 0:
-                                yield period_, line_
-                            n += 1
-
-            frames = []
-            for n, (period, line) in enumerate(_iter()):
-                frame = self._frame_from_line(teams, period, line, frame_rate)
-
-                frame = transformer.transform_frame(frame)
-                frames.append(frame)
-
-                if self.limit and n >= self.limit:
+            while True:
+                batch = list(islice(lines, BATCH_SIZE))
+                if not batch:
                     break
+                yield _parse_lines(
+                    *zip(*batch), projection.team_indices(teams)
+                )
 
-        try:
-            first_frame = next(
-                frame for frame in frames if frame.period.id == 1
+        def _iter_parsed_parallel(
+            periods_: List[Period], frame_range, path: str
+        ):
+            period_bounds = [self.window.clip(p) for p in periods_]
+            byte_ranges = _byte_ranges(periods_, frame_range, self.window)
+            with open(path, "rb") as fp:
+                if byte_ranges is None:
+                    byte_ranges = [
+                        (inputs.raw_data.tell(), os.fstat(fp.fileno()).st_size)
+                    ]
+                # Use more chunks than workers to balance the load
+                chunks = iter(
+                    _split_byte_ranges(fp, byte_ranges, self.n_workers * 4)
+                )
+
+            sampler = self.get_sampler(frame_rate)
+            n = 0
+            n_frames = 0
+
+            executor = ProcessPoolExecutor(max_workers=self.n_workers)
+            pending = deque()
+            try:
+                while True:
+                    # Keep a limited number of chunks in flight so the
+                    # memory usage doesn't depend on the file size
+                    for chunk in islice(
+                        chunks, self.n_workers * 2 - len(pending)
+                    ):
+                        pending.append(
+                            executor.submit(
+                                _parse_chunk,
+                                path,
+                                chunk[0],
+                                chunk[1],
+                                period_bounds,
+                                frame_rate,
+                                frame_range,
+                                self.only_alive,
+                                self.projection.team_indices(teams),
+                            )
+                        )
+                    if not pending:
+                        break
+
+                    parsed = pending.popleft().result()
+                    size = len(parsed.frame_ids)
+
+                    # Sample over all frames, not per chunk
+                    indices = [
+                        i for i in range(size) if sampler.is_sampled(n + i)
+                    ]
+                    n += size
+                    if self.limit:
+                        indices = indices[: self.limit + 1 - n_frames]
+                    if len(indices) != size:
+                        parsed = parsed.select(indices)
+                    n_frames += len(indices)
+
+                    yield parsed
+
+                    if self.limit and n_frames > self.limit:
+                        break
+            finally:
+                for future in pending:
+                    future.cancel()
+                executor.shutdown()
+
+        def _iter_frames(
+            periods_: List[Period],
+            parsed_batches: Iterable[_ParsedLines],
+            projection: ObjectProjection,
+        ):
+            with performance_logging("Loading data", logger=logger):
+                for parsed in parsed_batches:
+                    yield from self._create_frames(
+                        parsed,
+                        periods_,
+                        teams,
+                        players,
+                        frame_rate,
+                        transformer,
+                        projection.includes_ball,
+                    )
+
+        loaded_periods = [
+            period for period in periods if self.window.clip(period)
+        ]
+
+        def _iter_loaded_frames():
+            path = getattr(inputs.raw_data, "name", None)
+            if self.n_workers and self.n_workers > 1:
+                if isinstance(path, str) and os.path.isfile(path):
+                    return _iter_frames(
+                        loaded_periods,
+                        _iter_parsed_parallel(
+                            loaded_periods, self.frame_range, path
+                        ),
+                        self.projection,
+                    )
+                logger.info(
+                    "Raw data is not a local file. Parsing it in a single process"
+                )
+            return _iter_frames(
+                loaded_periods,
+                _iter_parsed(
+                    loaded_periods,
+                    self.frame_range,
+                    self.window,
+                    self.projection,
+                ),
+                self.projection,
+            )
+
+        first_periods = [period for period in periods if period.id == 1]
+        if (
+            first_periods
+            and (
+                first_periods[0] not in loaded_periods
+                or not frame_range_includes_start(
+                    self.frame_range, first_periods[0], frame_rate
+                )
+                or self.projection
             )
-            orientation = (
-                Orientation.HOME_AWAY
-                if attacking_direction_from_frame(first_frame)
-                == AttackingDirection.LTR
-                else Orientation.AWAY_HOME
+            and inputs.raw_data.seekable()
+        ):
+            # The orientation is defined by the players in the first frame of
+            # the first period, which is not loaded (completely). Only read
+            # up to that frame to determine it.
+            raw_data_start = inputs.raw_data.tell()
+            orientation, first_period_frames = self.detect_orientation(
+                _iter_frames(
+                    first_periods,
+                    _iter_parsed(
+                        first_periods, None, FrameWindow(), ObjectProjection()
+                    ),
+                    ObjectProjection(),
+                )
             )
-        except StopIteration:
+            first_period_frames.close()
+            inputs.raw_data.seek(raw_data_start)
+
+            frames = _iter_loaded_frames()
+        elif self.projection:
             warnings.warn(
-                "Could not determine orientation of dataset, defaulting to NOT_SET"
+                "Could not determine orientation of dataset of which not all "
+                "objects are loaded, defaulting to NOT_SET"
             )
             orientation = Orientation.NOT_SET
+            frames = _iter_loaded_frames()
+        else:
+            orientation, frames = self.detect_orientation(
+                _iter_loaded_frames()
+            )
 
         metadata = Metadata(
             teams=teams,
@@ -256,7 +943,4 @@ class TRACABDatDeserializer(TrackingDataDeserializer[TRACABInputs]):
             coordinate_system=transformer.get_to_coordinate_system(),
         )
 
-        return TrackingDataset(
-            records=frames,
-            metadata=metadata,
-        )
+        return TrackingDataStream(metadata=metadata, frames=frames)
@@ -1,35 +1,33 @@
 import logging
-import warnings
-import json
 import html
 from datetime import timedelta
-from typing import Dict, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 from kloppy.domain import (
-    TrackingDataset,
+    TrackingDataStream,
     DatasetFlag,
-    AttackingDirection,
     Frame,
     Point,
     Point3D,
     Team,
     BallState,
     Period,
-    Orientation,
     Metadata,
     Ground,
     Player,
     Provider,
     PlayerData,
     Position,
-    attacking_direction_from_frame,
 )
 from kloppy.exceptions import DeserializationError
 
 from kloppy.utils import Readable, performance_logging
+from kloppy.infra.serializers import json_backend
 
 from .common import TRACABInputs
 from ..deserializer import TrackingDataDeserializer
+from ..projection import ObjectProjection
+from ..window import FrameWindow, Timestamp
 
 logger = logging.getLogger(__name__)
 
@@ -41,26 +39,52 @@ class TRACABJSONDeserializer(TrackingDataDeserializer[TRACABInputs]):
         sample_rate: Optional[float] = None,
         coordinate_system: Optional[Union[str, Provider]] = None,
         only_alive: Optional[bool] = True,
+        incremental: Optional[bool] = False,
+        target_frame_rate: Optional[float] = None,
+        periods: Optional[List[int]] = None,
+        start: Optional[Timestamp] = None,
+        end: Optional[Timestamp] = None,
+        objects: Optional[List[str]] = None,
     ):
-        super().__init__(limit, sample_rate, coordinate_system)
+        super().__init__(
+            limit,
+            sample_rate,
+            coordinate_system,
+            target_frame_rate,
+            periods,
+            start,
+            end,
+            objects,
+        )
         self.only_alive = only_alive
+        self.incremental = incremental
 
     @property
     def provider(self) -> Provider:
         return Provider.TRACAB
 
     @classmethod
-    def _create_frame(cls, teams, period, raw_frame, frame_rate):
+    def _create_frame(
+        cls,
+        teams,
+        period,
+        raw_frame,
+        frame_rate,
+        team_indices: Tuple[int, ...] = (0, 1),
+        include_ball: bool = True,
+    ):
         frame_id = raw_frame["FrameCount"]
         raw_players_data = raw_frame["PlayerPositions"]
         raw_ball_position = raw_frame["BallPosition"][0]
 
         players_data = {}
         for player_data in raw_players_data:
-            if player_data["Team"] == 1:
-                team = teams[0]
-            elif player_data["Team"] == 0:
-                team = teams[1]
+            if player_data["Team"] in (0, 1):
+                # Team id 1 is the home team, 0 the away team
+                team_index = 1 - player_data["Team"]
+                if team_index not in team_indices:
+                    continue
+                team = teams[team_index]
             elif player_data["Team"] in (-1, 3, 4):
                 continue
             else:
@@ -109,7 +133,9 @@ class TRACABJSONDeserializer(TrackingDataDeserializer[TRACABInputs]):
             frame_id=frame_id,
             timestamp=timedelta(seconds=frame_id / frame_rate)
             - period.start_timestamp,
-            ball_coordinates=Point3D(ball_x, ball_y, ball_z),
+            ball_coordinates=Point3D(ball_x, ball_y, ball_z)
+            if include_ball
+            else None,
             ball_state=ball_state,
             ball_owning_team=ball_owning_team,
             ball_speed=ball_speed,
@@ -166,9 +192,10 @@ class TRACABJSONDeserializer(TrackingDataDeserializer[TRACABInputs]):
 
         return team
 
-    def deserialize(self, inputs: TRACABInputs) -> TrackingDataset:
-        meta_data = json.load(inputs.meta_data)
-        raw_data = json.load(inputs.raw_data)
+    def iter_records(self, inputs: TRACABInputs) -> TrackingDataStream:
+        meta_data = json_backend.load(inputs.meta_data)
+        if not self.incremental:
+            raw_frames = json_backend.load(inputs.raw_data)["FrameData"]
 
         with performance_logging("Loading metadata", logger=logger):
             frame_rate = meta_data["FrameRate"]
@@ -195,62 +222,73 @@ class TRACABJSONDeserializer(TrackingDataDeserializer[TRACABInputs]):
             home_team = self.create_team(meta_data["HomeTeam"], Ground.HOME)
             away_team = self.create_team(meta_data["AwayTeam"], Ground.AWAY)
             teams = [home_team, away_team]
+            self.projection.validate(teams)
 
             transformer = self.get_transformer(
                 pitch_length=pitch_size_length, pitch_width=pitch_size_width
             )
 
-        with performance_logging("Loading data", logger=logger):
-            raw_data = raw_data["FrameData"]
-
-            def _iter():
-                n = 0
-                sample = 1.0 / self.sample_rate
-
-                for frame in raw_data:
-                    if (
-                        self.only_alive
-                        and frame["BallPosition"][0]["BallStatus"] == "Dead"
-                    ):
-                        continue
-
-                    frame_id = frame["FrameCount"]
-                    for _period in periods:
-                        if (
-                            _period.start_timestamp
-                            <= timedelta(seconds=frame_id / frame_rate)
-                            <= _period.end_timestamp
-                        ):
-                            if n % sample == 0:
-                                yield _period, frame
-                            n += 1
-
-            frames = []
-            for n, (_period, _frame) in enumerate(_iter()):
-                frame = self._create_frame(teams, _period, _frame, frame_rate)
+        def _iter(window: FrameWindow):
+            sampler = self.get_sampler(frame_rate)
+            # (period, start timestamp, end timestamp) of the periods within
+            # the window
+            period_bounds = []
+            for period in periods:
+                bounds = window.clip(period)
+                if bounds:
+                    period_bounds.append((period, *bounds))
+            if not period_bounds:
+                return
+
+            if self.incremental:
+                # Decode the frames one at a time while iterating, instead of
+                # keeping the decoded document in memory
+                frames = json_backend.iter_array_items(
+                    inputs.raw_data, "FrameData"
+                )
+            else:
+                frames = raw_frames
+
+            for frame in frames:
+                frame_id = frame["FrameCount"]
+                timestamp = timedelta(seconds=frame_id / frame_rate)
+                if timestamp > period_bounds[-1][2]:
+                    # Frames are ordered, so all next frames are outside
+                    # of the window
+                    break
 
-                frame = transformer.transform_frame(frame)
+                if (
+                    self.only_alive
+                    and frame["BallPosition"][0]["BallStatus"] == "Dead"
+                ):
+                    continue
+
+                for _period, start_timestamp, end_timestamp in period_bounds:
+                    if start_timestamp <= timestamp <= end_timestamp:
+                        if sampler.keep():
+                            yield _period, frame
+
+        def _iter_frames(window: FrameWindow, projection: ObjectProjection):
+            team_indices = projection.team_indices(teams)
+            with performance_logging("Loading data", logger=logger):
+                for n, (_period, _frame) in enumerate(_iter(window)):
+                    frame = self._create_frame(
+                        teams,
+                        _period,
+                        _frame,
+                        frame_rate,
+                        team_indices,
+                        projection.includes_ball,
+                    )
 
-                frames.append(frame)
+                    yield transformer.transform_frame(frame)
 
-                if self.limit and n >= self.limit:
-                    break
+                    if self.limit and n >= self.limit:
+                        break
 
-        try:
-            first_frame = next(
-                frame for frame in frames if frame.period.id == 1
-            )
-            orientation = (
-                Orientation.HOME_AWAY
-                if attacking_direction_from_frame(first_frame)
-                == AttackingDirection.LTR
-                else Orientation.AWAY_HOME
-            )
-        except StopIteration:
-            warnings.warn(
-                "Could not determine orientation of dataset, defaulting to NOT_SET"
-            )
-            orientation = Orientation.NOT_SET
+        orientation, frames = self.detect_window_orientation(
+            _iter_frames, inputs.raw_data
+        )
 
         metadata = Metadata(
             teams=teams,
@@ -264,7 +302,4 @@ class TRACABJSONDeserializer(TrackingDataDeserializer[TRACABInputs]):
             coordinate_system=transformer.get_to_coordinate_system(),
         )
 
-        return TrackingDataset(
-            records=frames,
-            metadata=metadata,
-        )
+        return TrackingDataStream(metadata=metadata, frames=frames)
@@ -0,0 +1,143 @@
+import math
+from datetime import timedelta
+from typing import List, Optional, Tuple, Union
+
+from kloppy.domain import Period
+from kloppy.exceptions import KloppyParameterError
+
+Timestamp = Union[timedelta, float]
+
+
+def _to_timedelta(timestamp: Optional[Timestamp]) -> Optional[timedelta]:
+    if timestamp is None or isinstance(timestamp, timedelta):
+        return timestamp
+    return timedelta(seconds=timestamp)
+
+
+class FrameWindow:
+    """
+    Selects the frames to load by period and by time within the period.
+
+    Deserializers evaluate the window against the frame id (and the period)
+    of a raw frame, before the frame is created. As the frames in raw data
+    are ordered, they stop reading once they are past the window.
+
+    Arguments:
+        periods: only include the frames of these period ids
+        start: only include the frames at or after this time (a timedelta or
+            seconds) from the start of their period
+        end: only include the frames at or before this time from the start
+            of their period
+    """
+
+    def __init__(
+        self,
+        periods: Optional[List[int]] = None,
+        start: Optional[Timestamp] = None,
+        end: Optional[Timestamp] = None,
+    ):
+        self.periods = periods
+        self.start = _to_timedelta(start)
+        self.end = _to_timedelta(end)
+        if (
+            self.start is not None
+            and self.end is not None
+            and self.start > self.end
+        ):
+            raise KloppyParameterError(
+                f"start ({self.start}) must not be after end ({self.end})"
+            )
+
+    def __bool__(self):
+        return bool(self.periods) or self.has_time_window
+
+    @property
+    def has_time_window(self) -> bool:
+        return self.start is not None or self.end is not None
+
+    def includes_period(self, period_id: int) -> bool:
+        return not self.periods or period_id in self.periods
+
+    def includes(self, period_id: int, timestamp: timedelta) -> bool:
+        """Whether the frame at `timestamp` from the start of period
+        `period_id` is within the window."""
+        return (
+            self.includes_period(period_id)
+            and (self.start is None or timestamp >= self.start)
+            and (self.end is None or timestamp <= self.end)
+        )
+
+    def is_past(
+        self,
+        period_id: int,
+        timestamp: timedelta,
+        last_period_id: Optional[int] = None,
+    ) -> bool:
+        """Whether the frames after the frame at `timestamp` from the start
+        of period `period_id` are all outside of the window.
+
+        `last_period_id` is the last period of the data, when known.
+        """
+        if self.periods:
+            last_period_id = max(self.periods)
+        if last_period_id is None:
+            return False
+        return period_id > last_period_id or (
+            period_id == last_period_id
+            and self.end is not None
+            and timestamp > self.end
+        )
+
+    def clip(self, period: Period) -> Optional[Tuple[timedelta, timedelta]]:
+        """Return the (start, end) timestamps of `period` within the window,
+        or None when the period is not included."""
+        if not self.includes_period(period.id):
+            return None
+
+        start_timestamp = period.start_timestamp
+        end_timestamp = period.end_timestamp
+        if self.start is not None:
+            start_timestamp = max(
+                start_timestamp, period.start_timestamp + self.start
+            )
+        if self.end is not None:
+            end_timestamp = min(
+                end_timestamp, period.start_timestamp + self.end
+            )
+        if start_timestamp > end_timestamp:
+            return None
+        return start_timestamp, end_timestamp
+
+    def frame_id_ranges(
+        self, periods: List[Period], frame_rate: float
+    ) -> List[Tuple[int, int]]:
+        """Return the (inclusive) frame id ranges of the included parts of
+        `periods`, for data in which the frame id is the number of frames
+        since the start of the recording."""
+        frame_id_ranges = []
+        for period in periods:
+            bounds = self.clip(period)
+            if bounds is None:
+                continue
+            start_timestamp, end_timestamp = bounds
+            frame_id_ranges.append(
+                (
+                    math.floor(start_timestamp.total_seconds() * frame_rate),
+                    math.ceil(end_timestamp.total_seconds() * frame_rate),
+                )
+            )
+        return frame_id_ranges
+
+
+def frame_range_includes_start(
+    frame_range: Optional[Tuple[int, int]], period: Period, frame_rate: float
+) -> bool:
+    """Whether the (inclusive) frame id range `frame_range` includes the
+    first frame of `period`, for data in which the frame id is the number of
+    frames since the start of the recording."""
+    if not frame_range:
+        return True
+    start_frame_id = math.floor(
+        period.start_timestamp.total_seconds() * frame_rate
+    )
+    return frame_range[0] <= start_frame_id <= frame_range[1]
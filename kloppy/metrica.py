@@ -2,5 +2,7 @@ from ._providers.metrica import (
     load_event,
     load_tracking_csv,
     load_tracking_epts,
+    iter_tracking_csv,
+    iter_tracking_epts,
     load_open_data,
 )
@@ -1 +1 @@
-from ._providers.secondspectrum import load
+from ._providers.secondspectrum import load, iter_frames
@@ -1 +1 @@
-from ._providers.skillcorner import load, load_open_data
+from ._providers.skillcorner import load, iter_frames, load_open_data
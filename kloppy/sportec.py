@@ -1 +1,6 @@
-from ._providers.sportec import load, load_event, load_tracking
+from ._providers.sportec import (
+    load,
+    load_event,
+    load_tracking,
+    iter_tracking,
+)
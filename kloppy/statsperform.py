@@ -1 +1 @@
-from ._providers.statsperform import load
+from ._providers.statsperform import load, iter_frames
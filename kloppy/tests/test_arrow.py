@@ -0,0 +1,290 @@
+import subprocess
+import sys
+
+import pytest
+
+import kloppy
+from kloppy import (
+    arrow,
+    load_events,
+    load_tracking,
+    save_events,
+    save_tracking,
+    secondspectrum,
+    statsbomb,
+    statsperform,
+    tracab,
+    wyscout,
+)
+from kloppy.domain import (
+    ColumnarFrames,
+    EventType,
+    PassQualifier,
+    PassType,
+    Point3D,
+)
+from kloppy.domain.models.statsbomb.event import (
+    StatsBombEventFactory,
+    StatsBombPassEvent,
+)
+from kloppy.exceptions import DeserializationError, KloppyParameterError
+
+pytest.importorskip("pyarrow")
+
+
+class TestArrowTracking:
+    @pytest.fixture
+    def dataset(self, base_dir):
+        return tracab.load(
+            meta_data=base_dir / "files/tracab_meta.xml",
+            raw_data=base_dir / "files/tracab_raw.dat",
+            only_alive=False,
+        )
+
+    @pytest.mark.parametrize("extension", ["parquet", "arrow"])
+    def test_round_trip(self, dataset, tmp_path, extension):
+        path = tmp_path / f"tracking.{extension}"
+        save_tracking(dataset, path)
+        loaded_dataset = load_tracking(path)
+
+        assert isinstance(loaded_dataset.records, ColumnarFrames)
+        assert len(loaded_dataset) == len(dataset)
+        for frame, loaded_frame in zip(dataset, loaded_dataset):
+            assert loaded_frame.frame_id == frame.frame_id
+            assert loaded_frame.timestamp == frame.timestamp
+            assert loaded_frame.period.id == frame.period.id
+            assert loaded_frame.ball_state == frame.ball_state
+            assert loaded_frame.ball_owning_team == frame.ball_owning_team
+            assert loaded_frame.ball_coordinates == frame.ball_coordinates
+            assert loaded_frame.players_data == frame.players_data
+
+        metadata = dataset.metadata
+        loaded_metadata = loaded_dataset.metadata
+        assert loaded_metadata.periods == metadata.periods
+        assert loaded_metadata.orientation == metadata.orientation
+        assert loaded_metadata.provider == metadata.provider
+        assert loaded_metadata.flags == metadata.flags
+        assert loaded_metadata.frame_rate == metadata.frame_rate
+        assert loaded_metadata.coordinate_system == metadata.coordinate_system
+        assert [team.team_id for team in loaded_metadata.teams] == [
+            team.team_id for team in metadata.teams
+        ]
+
+        # The players of the frames are the players of the metadata
+        home_team = loaded_metadata.teams[0]
+        player = next(
+            player
+            for player in loaded_dataset[0].players_data
+            if player.team.ground == home_team.ground
+        )
+        assert home_team.get_player_by_id(player.player_id) is player
+
+    def test_memory_mapped(self, dataset, tmp_path):
+        path = str(tmp_path / "tracking.arrow")
+        save_tracking(dataset, path)
+        records = load_tracking(path).records
+
+        # The arrays are backed by the memory mapped file
+        for array in (records.timestamp, records.player_coordinates):
+            assert not array.flags.owndata
+            assert not array.flags.writeable
+
+        # The frames can be transformed and filtered
+        transformed_dataset = load_tracking(path).transform(
+            to_coordinate_system="tracab"
+        )
+        assert len(transformed_dataset) == len(dataset)
+        assert len(
+            load_tracking(path).filter(lambda frame: frame.ball_state)
+        ) == len(dataset)
+
+    def test_integer_team_ids(self, base_dir, tmp_path):
+        dataset = secondspectrum.load(
+            meta_data=base_dir / "files/second_spectrum_fake_metadata.xml",
+            raw_data=base_dir / "files/second_spectrum_fake_data.jsonl",
+            additional_meta_data=base_dir
+            / "files/second_spectrum_fake_metadata.json",
+            only_alive=False,
+        )
+        path = tmp_path / "tracking.parquet"
+        save_tracking(dataset, path)
+        loaded_dataset = load_tracking(path)
+
+        assert [frame.ball_owning_team for frame in loaded_dataset] == [
+            frame.ball_owning_team for frame in dataset
+        ]
+
+    def test_periods_by_id(self, base_dir, tmp_path):
+        dataset = statsperform.load(
+            meta_data=base_dir / "files/statsperform_ma1_metadata.xml",
+            raw_data=base_dir / "files/statsperform_ma25_tracking.txt",
+            only_alive=False,
+        )
+        path = tmp_path / "tracking.parquet"
+        save_tracking(dataset, path)
+        loaded_dataset = load_tracking(path)
+
+        assert loaded_dataset.metadata.periods == dataset.metadata.periods
+        assert len(loaded_dataset) == len(dataset)
+        for frame, loaded_frame in zip(dataset, loaded_dataset):
+            assert loaded_frame.frame_id == frame.frame_id
+            assert loaded_frame.period == frame.period
+            assert loaded_frame.players_data == frame.players_data
+
+    def test_format(self, dataset, tmp_path):
+        path = tmp_path / "tracking.bin"
+        with pytest.raises(KloppyParameterError):
+            save_tracking(dataset, path)
+
+        save_tracking(dataset, path, format="arrow")
+        assert len(load_tracking(path, format="arrow")) == len(dataset)
+
+        with pytest.raises(KloppyParameterError):
+            load_tracking(path, format="csv")
+
+    def test_not_written_by_kloppy(self, tmp_path):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        path = tmp_path / "tracking.parquet"
+        pq.write_table(pa.table({"frame_id": [1, 2]}), path)
+        with pytest.raises(DeserializationError):
+            load_tracking(path)
+
+
+class TestArrowEvents:
+    @pytest.fixture
+    def dataset(self, base_dir):
+        return statsbomb.load(
+            lineup_data=base_dir / "files/statsbomb_lineup.json",
+            event_data=base_dir / "files/statsbomb_event.json",
+        )
+
+    @pytest.mark.parametrize("extension", ["parquet", "arrow"])
+    def test_round_trip(self, dataset, tmp_path, extension):
+        path = tmp_path / f"events.{extension}"
+        save_events(dataset, path)
+        loaded_dataset = load_events(path)
+
+        assert len(loaded_dataset.events) == len(dataset.events)
+        for event, loaded_event in zip(dataset.events, loaded_dataset.events):
+            assert loaded_event.event_id == event.event_id
+            assert loaded_event.event_type == event.event_type
+            assert loaded_event.event_name == event.event_name
+            assert loaded_event.period == event.period
+            assert loaded_event.timestamp == event.timestamp
+            assert loaded_event.team == event.team
+            assert loaded_event.player == event.player
+            assert loaded_event.coordinates == event.coordinates
+            assert loaded_event.result == event.result
+            assert loaded_event.related_event_ids == event.related_event_ids
+            assert loaded_event.raw_event == event.raw_event
+            if event.qualifiers is None:
+                assert loaded_event.qualifiers is None
+            else:
+                assert sorted(map(repr, loaded_event.qualifiers)) == sorted(
+                    map(repr, event.qualifiers)
+                )
+
+        metadata = dataset.metadata
+        loaded_metadata = loaded_dataset.metadata
+        assert loaded_metadata.periods == metadata.periods
+        assert loaded_metadata.orientation == metadata.orientation
+        assert loaded_metadata.provider == metadata.provider
+        assert loaded_metadata.coordinate_system == metadata.coordinate_system
+        assert loaded_metadata.teams[0].players == metadata.teams[0].players
+
+    def test_event_attributes(self, dataset, tmp_path):
+        path = tmp_path / "events.parquet"
+        save_events(dataset, path)
+        loaded_dataset = load_events(path)
+
+        pass_event = dataset.find(
+            lambda event: event.event_type == EventType.PASS
+            and event.receiver_player
+            and PassType.CROSS in event.get_qualifier_values(PassQualifier)
+        )
+        loaded_pass_event = loaded_dataset.get_event_by_id(pass_event.event_id)
+        assert loaded_pass_event.event_type == EventType.PASS
+        assert loaded_pass_event.receiver_player == pass_event.receiver_player
+        assert (
+            loaded_pass_event.receiver_coordinates
+            == pass_event.receiver_coordinates
+        )
+        assert (
+            loaded_pass_event.receive_timestamp == pass_event.receive_timestamp
+        )
+        assert sorted(
+            loaded_pass_event.get_qualifier_values(PassQualifier),
+            key=repr,
+        ) == sorted(pass_event.get_qualifier_values(PassQualifier), key=repr)
+
+        # Freeze frames of shots are stored with their players
+        shot_event = dataset.find("shot")
+        loaded_shot_event = loaded_dataset.get_event_by_id(shot_event.event_id)
+        assert isinstance(loaded_shot_event.result_coordinates, Point3D)
+        assert (
+            loaded_shot_event.result_coordinates
+            == shot_event.result_coordinates
+        )
+        assert len(loaded_shot_event.freeze_frame.players_data) == len(
+            shot_event.freeze_frame.players_data
+        )
+
+    def test_integer_ids(self, base_dir, tmp_path):
+        # Wyscout v3 has integer event ids, and string ids for the
+        # synthetic events
+        dataset = wyscout.load(
+            event_data=base_dir / "files/wyscout_events_v3.json",
+            data_version="V3",
+        )
+        path = tmp_path / "events.parquet"
+        save_events(dataset, path)
+        loaded_dataset = load_events(path)
+
+        assert [event.event_id for event in loaded_dataset.events] == [
+            event.event_id for event in dataset.events
+        ]
+        assert [
+            event.related_event_ids for event in loaded_dataset.events
+        ] == [event.related_event_ids for event in dataset.events]
+        assert isinstance(loaded_dataset.events[0].event_id, int)
+        assert (
+            loaded_dataset.get_event_by_id(dataset.events[0].event_id)
+            is not None
+        )
+
+    def test_event_factory(self, dataset, tmp_path):
+        path = tmp_path / "events.parquet"
+        save_events(dataset, path)
+        loaded_dataset = load_events(
+            path, event_factory=StatsBombEventFactory()
+        )
+
+        assert isinstance(loaded_dataset.find("pass"), StatsBombPassEvent)
+
+    def test_dataset_type(self, dataset, tmp_path):
+        path = tmp_path / "events.parquet"
+        save_events(dataset, path)
+        with pytest.raises(DeserializationError):
+            load_tracking(path)
+
+
+def test_lazy_import():
+    # Importing kloppy doesn't import the Arrow serializers and the domain
+    # models they depend on
+    subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, kloppy; "
+            "assert 'kloppy.domain' not in sys.modules; "
+            "assert 'kloppy._providers.arrow' not in sys.modules",
+        ],
+        check=True,
+    )
+
+    assert kloppy.save_tracking is arrow.save_tracking
+    assert kloppy.load_events is arrow.load_events
+    with pytest.raises(AttributeError):
+        kloppy.load_parquet
@@ -1,7 +1,19 @@
+import math
+import sys
+from io import BytesIO, StringIO
+
 import pytest
-from kloppy import opta
+from kloppy import opta, statsbomb, tracab
 from kloppy.config import set_config, get_config, config_context, reset_config
-from kloppy.domain import KloppyCoordinateSystem, OptaCoordinateSystem
+from kloppy.domain import (
+    ColumnarFrames,
+    KloppyCoordinateSystem,
+    OptaCoordinateSystem,
+)
+from kloppy.exceptions import KloppyParameterError
+from kloppy.infra import dataset_cache
+from kloppy.infra.serializers import json_backend
+from kloppy.infra.serializers.event.opta import OptaDeserializer
 
 
 class TestConfig:
@@ -51,3 +63,151 @@ class TestConfig:
         assert isinstance(
             dataset.metadata.coordinate_system, OptaCoordinateSystem
         )
+
+    @pytest.mark.parametrize("backend", ["auto", "json", "orjson"])
+    def test_json_backend(self, backend: str, base_dir):
+        if backend == "orjson":
+            pytest.importorskip("orjson")
+
+        with config_context("json.backend", backend):
+            assert json_backend.loads(b'{"a": [1, 2.5, null]}') == {
+                "a": [1, 2.5, None]
+            }
+            # Documents rejected by fast backends are decoded by the json module
+            assert math.isnan(json_backend.loads("NaN"))
+
+            dataset = statsbomb.load(
+                event_data=base_dir / "files/statsbomb_event.json",
+                lineup_data=base_dir / "files/statsbomb_lineup.json",
+            )
+
+        with config_context("json.backend", "json"):
+            json_dataset = statsbomb.load(
+                event_data=base_dir / "files/statsbomb_event.json",
+                lineup_data=base_dir / "files/statsbomb_lineup.json",
+            )
+
+        assert [event.raw_event for event in dataset.events] == [
+            event.raw_event for event in json_dataset.events
+        ]
+
+    @pytest.mark.parametrize("chunk_size", range(1, 12))
+    def test_json_iter_items(self, chunk_size: int):
+        # The chunks split the numbers at different positions
+        document = '[1, 12.5e3, 1234, {"a": 5}, true, -7, 0.25, 123456789]'
+        items = [1, 12.5e3, 1234, {"a": 5}, True, -7, 0.25, 123456789]
+
+        assert (
+            list(
+                json_backend.iter_items(
+                    BytesIO(document.encode()), chunk_size=chunk_size
+                )
+            )
+            == items
+        )
+        assert (
+            list(
+                json_backend.iter_array_items(
+                    StringIO(f'{{"b": 12, "items": {document}}}'),
+                    "items",
+                    chunk_size=chunk_size,
+                )
+            )
+            == items
+        )
+
+    def test_json_backend_not_installed(self, monkeypatch):
+        monkeypatch.setitem(sys.modules, "ujson", None)
+        monkeypatch.setattr(json_backend, "_loads_functions", {})
+
+        with config_context("json.backend", "ujson"):
+            with pytest.raises(ImportError, match="pip install ujson"):
+                json_backend.loads("{}")
+
+        with config_context("json.backend", "bson"):
+            with pytest.raises(KloppyParameterError):
+                json_backend.loads("{}")
+
+    def test_dataset_cache(
+        self, f24_data: str, f7_data: str, tmp_path, monkeypatch
+    ):
+        set_config("dataset_cache", str(tmp_path))
+
+        dataset = opta.load(f24_data=f24_data, f7_data=f7_data)
+        assert len(list(tmp_path.iterdir())) == 1
+
+        def _deserialize(*args, **kwargs):
+            raise AssertionError("The inputs are parsed again")
+
+        with monkeypatch.context() as m:
+            m.setattr(OptaDeserializer, "deserialize", _deserialize)
+            cached_dataset = opta.load(f24_data=f24_data, f7_data=f7_data)
+
+        assert [
+            (type(event), event.event_id, event.coordinates)
+            for event in cached_dataset.events
+        ] == [
+            (type(event), event.event_id, event.coordinates)
+            for event in dataset.events
+        ]
+        assert cached_dataset.metadata.teams == dataset.metadata.teams
+
+        # Other arguments and config are cached separately
+        opta.load(f24_data=f24_data, f7_data=f7_data, event_types=["pass"])
+        with config_context("coordinate_system", "opta"):
+            dataset = opta.load(f24_data=f24_data, f7_data=f7_data)
+        assert isinstance(
+            dataset.metadata.coordinate_system, OptaCoordinateSystem
+        )
+        assert len(list(tmp_path.iterdir())) == 3
+
+    @pytest.mark.parametrize("has_pyarrow", [True, False])
+    def test_dataset_cache_tracking(
+        self, base_dir, tmp_path, monkeypatch, has_pyarrow
+    ):
+        def _load():
+            return tracab.load(
+                meta_data=base_dir / "files/tracab_meta.xml",
+                raw_data=base_dir / "files/tracab_raw.dat",
+                only_alive=False,
+            )
+
+        monkeypatch.setattr(dataset_cache, "_has_pyarrow", lambda: has_pyarrow)
+        dataset = _load()
+        with config_context("dataset_cache", str(tmp_path)):
+            _load()
+            # Tracking datasets are cached in columnar form
+            (cache_file,) = tmp_path.iterdir()
+            assert cache_file.suffix == (".arrow" if has_pyarrow else ".pkl")
+            cached_dataset = _load()
+            with config_context("tracking.storage", "columnar"):
+                columnar_cached_dataset = _load()
+
+        # Cached datasets are returned with the configured storage
+        assert not cached_dataset.is_columnar
+        assert isinstance(columnar_cached_dataset.records, ColumnarFrames)
+        for loaded_dataset in (cached_dataset, columnar_cached_dataset):
+            assert len(loaded_dataset) == len(dataset)
+            for frame, cached_frame in zip(dataset, loaded_dataset):
+                assert cached_frame.frame_id == frame.frame_id
+                assert cached_frame.timestamp == frame.timestamp
+                assert cached_frame.ball_coordinates == frame.ball_coordinates
+                assert cached_frame.players_data == frame.players_data
+
+        # Changes to the frames of a cached dataset are kept
+        cached_dataset.records[0].ball_coordinates = None
+        assert cached_dataset.records[0].ball_coordinates is None
+
+    def test_dataset_cache_write_error(
+        self, f24_data: str, f7_data: str, tmp_path, monkeypatch
+    ):
+        def _dump(*args, **kwargs):
+            raise TypeError("cannot pickle")
+
+        monkeypatch.setattr(dataset_cache.pickle, "dump", _dump)
+        with config_context("dataset_cache", str(tmp_path)):
+            dataset = opta.load(f24_data=f24_data, f7_data=f7_data)
+
+        # The parsed dataset is returned, without leaving files behind
+        assert len(dataset.events) > 0
+        assert list(tmp_path.iterdir()) == []
@@ -1,5 +1,8 @@
+import copy
 import os
+import pickle
 import sys
+from datetime import timedelta
 from pathlib import Path
 
 import pytest
@@ -27,6 +30,7 @@ from kloppy.domain import (
     Player,
     PlayerData,
     Point3D,
+    DatasetTransformer,
 )
 
 from kloppy import opta, tracab, statsbomb
@@ -138,6 +142,212 @@ class TestHelpers:
             )
         )
 
+    def test_to_columnar(self):
+        tracking_data = self._get_tracking_dataset()
+
+        columnar_data = tracking_data.to_columnar()
+
+        assert columnar_data.is_columnar
+        assert len(columnar_data) == 2
+        assert columnar_data.records.players == list(
+            tracking_data.frames[1].players_data.keys()
+        )
+        assert columnar_data.frames[0].players_data == {}
+        assert columnar_data.frames[0].ball_coordinates == Point3D(
+            x=100, y=-50, z=0
+        )
+        assert (
+            columnar_data.frames[1].players_data
+            == tracking_data.frames[1].players_data
+        )
+        assert columnar_data.frames[1].other_data == {"extra_data": 1}
+        assert columnar_data.frames[1].prev().frame_id == 1
+        assert columnar_data.frames[-1].frame_id == 2
+        assert [frame.frame_id for frame in columnar_data.frames[:1]] == [1]
+
+    def test_columnar_to_dict(self):
+        tracking_data = self._get_tracking_dataset()
+        columnar_data = tracking_data.to_columnar()
+
+        items = columnar_data.to_dict()
+        expected_items = dict(tracking_data.to_dict())
+        # Columnar frames store the timestamps as durations
+        assert items.pop("timestamp") == [
+            timedelta(seconds=0.1),
+            timedelta(seconds=0.2),
+        ]
+        del expected_items["timestamp"]
+        assert items == expected_items
+
+        assert columnar_data.to_dict("frame_id", "home_1_*") == {
+            "frame_id": [1, 2],
+            "home_1_x": [None, 15],
+            "home_1_y": [None, 35],
+            "home_1_d": [None, 0.03],
+            "home_1_s": [None, 10.5],
+            "home_1_extra_data": [None, 1],
+        }
+
+    def test_columnar_to_df(self):
+        """
+        Make sure the data frames of columnar frames have typed columns
+        """
+        import pandas as pd
+        import polars as pl
+
+        columnar_data = self._get_tracking_dataset().to_columnar()
+
+        df = columnar_data.to_df()
+        assert pd.api.types.is_timedelta64_dtype(df["timestamp"])
+        assert isinstance(df["ball_owning_team_id"].dtype, pd.CategoricalDtype)
+        assert df["ball_owning_team_id"].tolist() == ["home", "away"]
+        assert df["home_1_x"].isna().tolist() == [True, False]
+
+        df = columnar_data.to_df(engine="pandas[pyarrow]")
+        assert isinstance(df.dtypes["timestamp"], pd.ArrowDtype)
+
+        df = columnar_data.to_df(engine="polars")
+        assert df.schema["timestamp"] == pl.Duration("us")
+        assert df["frame_id"].to_list() == [1, 2]
+
+        # Function columns are built from the frames
+        df = columnar_data.to_df(
+            "frame_id", ball_x=lambda frame: frame.ball_coordinates.x
+        )
+        assert df["ball_x"].tolist() == [100, 0]
+
+    def test_compact_tracking_records(self):
+        tracking_data = self._get_tracking_dataset()
+        frame = tracking_data.frames[1]
+        player_data = next(iter(frame.players_data.values()))
+
+        # slotted classes don't carry a __dict__ per instance
+        assert not hasattr(frame, "__dict__")
+        assert not hasattr(player_data, "__dict__")
+        assert not hasattr(player_data.coordinates, "__dict__")
+        assert not hasattr(frame.ball_coordinates, "__dict__")
+
+        # frames are still linked to the dataset
+        assert frame.dataset is tracking_data
+        assert frame.prev() is tracking_data.frames[0]
+
+        point = Point3D(x=1, y=2, z=3)
+        assert pickle.loads(pickle.dumps(point)) == point
+        assert pickle.loads(pickle.dumps(player_data)) == player_data
+
+    def test_pickle_tracking_records(self, base_dir):
+        # players without other data share the same empty mapping, also
+        # after pickling or copying them
+        player_data = PlayerData(coordinates=Point(x=1, y=2))
+        other_player_data = PlayerData(coordinates=Point(x=3, y=4))
+        assert player_data.other_data == {}
+        assert player_data.other_data is other_player_data.other_data
+        for copied_player_data in (
+            pickle.loads(pickle.dumps(player_data)),
+            copy.deepcopy(player_data),
+        ):
+            assert copied_player_data == player_data
+            assert copied_player_data.other_data is player_data.other_data
+
+        dataset = tracab.load(
+            meta_data=base_dir / "files/tracab_meta.xml",
+            raw_data=base_dir / "files/tracab_raw.dat",
+            only_alive=False,
+        )
+        unpickled_dataset = pickle.loads(pickle.dumps(dataset))
+        assert len(unpickled_dataset) == len(dataset)
+        assert (
+            unpickled_dataset.records[0].players_data
+            == dataset.records[0].players_data
+        )
+        assert len(copy.deepcopy(dataset)) == len(dataset)
+
+    def test_record_linking(self):
+        tracking_data = self._get_tracking_dataset()
+        first_frame, second_frame = tracking_data.records
+
+        # records are linked to the dataset, whichever way they are read
+        for read in (
+            lambda records: [records[1]],
+            lambda records: [records[-1]],
+            lambda records: records[::-1],
+            lambda records: list(records),
+            lambda records: list(reversed(records)),
+            lambda records: records.copy(),
+            lambda records: records + [],
+            lambda records: [] + records,
+            lambda records: records * 1,
+        ):
+            tracking_data = self._get_tracking_dataset()
+            frames = read(tracking_data.records)
+            assert len(frames) >= 1
+            assert all(frame.dataset is tracking_data for frame in frames)
+
+        tracking_data = self._get_tracking_dataset()
+        first_frame, second_frame = tracking_data.records
+        assert second_frame.prev() is first_frame
+        assert first_frame.prev() is None
+        assert first_frame.next() is second_frame
+        assert second_frame.next() is None
+
+        # records that leave the dataset lose their neighbours, the others
+        # keep finding them through their index
+        tracking_data = self._get_tracking_dataset()
+        popped_frame = tracking_data.records.pop(0)
+        assert popped_frame.dataset is tracking_data
+        assert popped_frame.next() is None
+        assert tracking_data.records[0].prev() is None
+        tracking_data.records.insert(0, popped_frame)
+        assert tracking_data.records[1].prev() is popped_frame
+        tracking_data.records.reverse()
+        assert tracking_data.records[1].prev().frame_id == 2
+
+        # filtered records keep pointing to their original neighbours
+        tracking_data = self._get_tracking_dataset()
+        first_frame, second_frame = tracking_data.records
+        filtered_data = tracking_data.filter(lambda frame: frame.frame_id == 2)
+        assert filtered_data.frames[0].prev() is first_frame
+
+        # no deeply linked object graph to pickle
+        unpickled_data = pickle.loads(pickle.dumps(tracking_data))
+        assert unpickled_data.frames[1].prev().frame_id == 1
+        assert unpickled_data.frames[1].dataset is unpickled_data
+
+    def test_transform_frames(self):
+        tracking_data = self._get_tracking_dataset()
+        transformer = DatasetTransformer(
+            from_pitch_dimensions=tracking_data.metadata.pitch_dimensions,
+            from_orientation=tracking_data.metadata.orientation,
+            to_pitch_dimensions=NormalizedPitchDimensions(
+                x_dim=Dimension(min=0, max=1),
+                y_dim=Dimension(min=0, max=1),
+                pitch_length=105,
+                pitch_width=68,
+            ),
+            to_orientation=Orientation.AWAY_HOME,
+        )
+
+        # the batch transformation matches the per frame transformation
+        expected_frames = [
+            transformer.transform_frame(frame) for frame in tracking_data
+        ]
+        transformed_frames = transformer.transform_frames(
+            tracking_data.records
+        )
+        columnar_frames = transformer.transform_frames(
+            tracking_data.to_columnar().records
+        )
+        for expected_frame, frame, columnar_frame in zip(
+            expected_frames, transformed_frames, columnar_frames
+        ):
+            assert frame.ball_coordinates == expected_frame.ball_coordinates
+            assert frame.players_data == expected_frame.players_data
+            assert (
+                columnar_frame.ball_coordinates
+                == expected_frame.ball_coordinates
+            )
+            assert columnar_frame.players_data == expected_frame.players_data
+
     def test_transform_to_pitch_dimensions(self):
         tracking_data = self._get_tracking_dataset()
 
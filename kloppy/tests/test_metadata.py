@@ -1,4 +1,6 @@
 from math import sqrt
+
+import numpy as np
 import pytest
 
 from kloppy.domain import (
@@ -9,6 +11,7 @@ from kloppy.domain import (
     OptaPitchDimensions,
     Unit,
     MetricPitchDimensions,
+    CoordinateTransformPlan,
 )
 from kloppy.domain.services.transformers import DatasetTransformer
 
@@ -117,6 +120,62 @@ class TestPitchdimensions:
         )
         assert distance == sqrt(120**2 + 80**2)
 
+    def test_metric_base_transform(self):
+        pitch = OptaPitchDimensions()
+
+        # the transformation is computed once and cached
+        transform = pitch.metric_base_transform(105, 68)
+        assert pitch.metric_base_transform(105, 68) is transform
+        assert pitch.metric_base_transform(105, 68, inverse=True) is not (
+            transform
+        )
+
+        assert transform.transform_point(Point(11.5, 50)) == Point(11, 34)
+        assert transform.transform_point(Point3D(0, 50, 38)) == Point3D(
+            0, 34, 2.44
+        )
+
+        # the array entry point gives the same result
+        x, y, z = transform.transform_array(
+            np.array([11.5, 0, 60, -10]),
+            np.array([50, 50, 61, 110]),
+            np.array([np.nan, 38, 0, 0]),
+        )
+        for i, point in enumerate(
+            [Point(11.5, 50), Point(0, 50), Point(60, 61), Point(-10, 110)]
+        ):
+            expected_point = transform.transform_point(point)
+            assert x[i] == expected_point.x
+            assert y[i] == expected_point.y
+        assert z[1] == pytest.approx(2.44)
+        assert np.isnan(z[0])
+
+    def test_coordinate_transform_plan(self):
+        from_pitch = OptaPitchDimensions()
+        to_pitch = MetricPitchDimensions(
+            x_dim=Dimension(0, 105),
+            y_dim=Dimension(0, 68),
+            pitch_length=105,
+            pitch_width=68,
+            standardized=False,
+        )
+        plan = CoordinateTransformPlan(from_pitch, to_pitch, 105, 68)
+
+        transformed_point = plan.transform_point(Point(17, 78.9))
+        assert transformed_point == to_pitch.from_metric_base(
+            from_pitch.to_metric_base(Point(17, 78.9))
+        )
+        x, y, _ = plan.transform_array(np.array([17]), np.array([78.9]))
+        assert x[0] == transformed_point.x
+        assert y[0] == transformed_point.y
+
+        flipped_plan = CoordinateTransformPlan(
+            from_pitch, to_pitch, 105, 68, flip_y=True
+        )
+        flipped_point = flipped_plan.transform_point(Point(17, 78.9))
+        assert flipped_point.x == transformed_point.x
+        assert flipped_point.y == pytest.approx(68 - transformed_point.y)
+
     def test_transform(self):
         transformer = DatasetTransformer(
             from_pitch_dimensions=OptaPitchDimensions(),
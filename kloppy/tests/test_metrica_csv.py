@@ -9,9 +9,11 @@ from kloppy.domain import (
     Orientation,
     Point,
     DatasetType,
+    Ground,
 )
 
 from kloppy import metrica
+from kloppy.infra.serializers.tracking import metrica_csv
 
 
 class TestMetricaCsvTracking:
@@ -80,3 +82,50 @@ class TestMetricaCsvTracking:
             player.player_id
             for player in dataset.records[3].players_data.keys()
         ]
+
+    def test_window(self, home_data: str, away_data: str):
+        dataset = metrica.load_tracking_csv(
+            home_data=home_data,
+            away_data=away_data,
+            periods=[2],
+            end=timedelta(seconds=0.08),
+        )
+        assert [frame.frame_id for frame in dataset] == [145004, 145005]
+        assert [period.id for period in dataset.metadata.periods] == [2]
+        # The orientation is still determined from the first period
+        assert dataset.metadata.orientation == Orientation.HOME_AWAY
+
+    def test_objects(self, home_data: str, away_data: str):
+        dataset = metrica.load_tracking_csv(
+            home_data=home_data, away_data=away_data, objects=["away"]
+        )
+        assert dataset.records[0].ball_coordinates is None
+        assert {
+            player.team.ground
+            for frame in dataset
+            for player in frame.players_data
+        } == {Ground.AWAY}
+        # The orientation is still determined from the players of both teams
+        assert dataset.metadata.orientation == Orientation.HOME_AWAY
+
+    def test_join_lines(self, home_data, away_data, monkeypatch):
+        def _data_lines(path):
+            return path.read_text().splitlines()[3:]
+
+        home_lines = _data_lines(home_data)
+        away_lines = _data_lines(away_data)
+        rows = metrica_csv._join_lines(home_lines, away_lines, 14, 14)
+
+        def _no_numpy(*args):
+            raise ImportError
+
+        # Without NumPy the lines are decoded one at a time
+        monkeypatch.setattr(metrica_csv, "_join_lines_numpy", _no_numpy)
+        fallback_rows = metrica_csv._join_lines(home_lines, away_lines, 14, 14)
+        assert len(rows) == len(fallback_rows) == 6
+        for row, fallback_row in zip(rows, fallback_rows):
+            assert list(row) == pytest.approx(fallback_row, nan_ok=True)
+
+        monkeypatch.undo()
+        with pytest.raises(ValueError, match="frame_id mismatch"):
+            metrica_csv._join_lines(home_lines[1:], away_lines[:-1], 14, 14)
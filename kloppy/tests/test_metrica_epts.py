@@ -18,6 +18,7 @@ from kloppy.infra.serializers.tracking.metrica_epts.metadata import (
     _load_provider,
 )
 from kloppy.infra.serializers.tracking.metrica_epts.reader import (
+    _LineDecoder,
     build_regex,
     read_raw_data,
 )
@@ -48,6 +49,37 @@ class TestMetricaEPTSTracking:
 
         assert result is not None
 
+    def test_line_decoder(self, base_dir):
+        with open(
+            base_dir / "files/epts_metrica_metadata.xml", "rb"
+        ) as metadata_fp:
+            metadata = load_metadata(metadata_fp)
+
+        decoder = _LineDecoder(
+            metadata.data_format_specifications[0],
+            metadata.player_channels,
+            metadata.sensors,
+        )
+
+        lines = []
+        for file_name in (
+            "epts_metrica_tracking.txt",
+            # Empty values can't be decoded by NumPy
+            "epts_metrica_tracking_with_empty_values.txt",
+        ):
+            with open(base_dir / "files" / file_name, "rb") as raw_data:
+                lines.extend(line.strip().decode("ascii") for line in raw_data)
+
+        rows = decoder.decode(lines)
+        assert len(rows) == len(lines)
+        for line, row in zip(lines, rows):
+            expected = decoder._decode_regex(line)
+            assert row.keys() == expected.keys()
+            for key, value in expected.items():
+                assert row[key] == value or (
+                    row[key] != row[key] and value != value
+                )
+
     def test_provider_name_recognition(self, base_dir):
         with open(
             base_dir / "files/epts_metrica_metadata.xml", "rb"
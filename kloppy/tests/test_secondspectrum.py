@@ -1,4 +1,5 @@
 import logging
+import shutil
 from datetime import timedelta
 from pathlib import Path
 
@@ -125,3 +126,115 @@ class TestSecondSpectrumTracking:
         assert pitch_dimensions.x_dim.max == 1.0
         assert pitch_dimensions.y_dim.min == 0.0
         assert pitch_dimensions.y_dim.max == 1.0
+
+    def test_frame_index(
+        self,
+        meta_data: Path,
+        raw_data: Path,
+        additional_meta_data: Path,
+        tmp_path: Path,
+    ):
+        indexed_raw_data = tmp_path / "second_spectrum_fake_data.jsonl"
+        shutil.copy(raw_data, indexed_raw_data)
+
+        dataset = secondspectrum.load(
+            meta_data=meta_data,
+            raw_data=indexed_raw_data,
+            additional_meta_data=additional_meta_data,
+            only_alive=False,
+        )
+
+        for use_frame_index in (False, True, True):
+            second_period = secondspectrum.load(
+                meta_data=meta_data,
+                raw_data=indexed_raw_data,
+                additional_meta_data=additional_meta_data,
+                only_alive=False,
+                periods=[2],
+                use_frame_index=use_frame_index,
+            )
+            assert len(second_period) == 189
+            assert all(frame.period.id == 2 for frame in second_period)
+            assert (
+                second_period.metadata.orientation
+                == dataset.metadata.orientation
+            )
+
+            frame_range = secondspectrum.load(
+                meta_data=meta_data,
+                raw_data=indexed_raw_data,
+                additional_meta_data=additional_meta_data,
+                only_alive=False,
+                frame_range=(74000, 75200),
+                use_frame_index=use_frame_index,
+            )
+            assert [frame.frame_id for frame in frame_range] == [
+                frame.frame_id
+                for frame in dataset
+                if 74000 <= frame.frame_id <= 75200
+            ]
+            assert {frame.period.id for frame in frame_range} == {1, 2}
+
+            # orientation is determined from the first period, which is not
+            # part of the frame range
+            second_period_frame_ids = [
+                frame.frame_id for frame in dataset if frame.period.id == 2
+            ]
+            second_period_range = secondspectrum.load(
+                meta_data=meta_data,
+                raw_data=indexed_raw_data,
+                additional_meta_data=additional_meta_data,
+                only_alive=False,
+                frame_range=(
+                    second_period_frame_ids[0],
+                    second_period_frame_ids[-1],
+                ),
+                use_frame_index=use_frame_index,
+            )
+            assert [
+                frame.frame_id for frame in second_period_range
+            ] == second_period_frame_ids
+            assert (
+                second_period_range.metadata.orientation
+                == dataset.metadata.orientation
+            )
+
+        assert (
+            tmp_path / "second_spectrum_fake_data.jsonl.kloppy-idx"
+        ).exists()
+
+    def test_window(
+        self,
+        meta_data: Path,
+        raw_data: Path,
+        additional_meta_data: Path,
+    ):
+        dataset = secondspectrum.load(
+            meta_data=meta_data,
+            raw_data=raw_data,
+            additional_meta_data=additional_meta_data,
+            only_alive=False,
+        )
+
+        windowed_dataset = secondspectrum.load(
+            meta_data=meta_data,
+            raw_data=raw_data,
+            additional_meta_data=additional_meta_data,
+            only_alive=False,
+            periods=[2],
+            start=timedelta(seconds=1000),
+            end=1700,
+        )
+        assert len(windowed_dataset) == 44
+        assert [frame.frame_id for frame in windowed_dataset] == [
+            frame.frame_id
+            for frame in dataset
+            if frame.period.id == 2
+            and timedelta(seconds=1000)
+            <= frame.timestamp
+            <= timedelta(seconds=1700)
+        ]
+        assert (
+            windowed_dataset.metadata.orientation
+            == dataset.metadata.orientation
+        )
@@ -1,3 +1,4 @@
+import json
 from datetime import timedelta
 from pathlib import Path
 
@@ -132,3 +133,140 @@ class TestSkillCornerTracking:
 
         assert len(dataset.records) == 34783
         assert dataset.records[0].timestamp == timedelta(seconds=11.2)
+
+    @pytest.fixture
+    def small_raw_data(self, base_dir) -> Path:
+        return base_dir / "files/skillcorner_structured_data_small.json"
+
+    @pytest.fixture
+    def small_raw_data_jsonl(self, base_dir) -> Path:
+        return base_dir / "files/skillcorner_structured_data_small.jsonl"
+
+    @pytest.mark.parametrize(
+        "options",
+        [
+            dict(),
+            dict(include_empty_frames=True),
+            dict(periods=[2]),
+            dict(limit=5),
+        ],
+    )
+    def test_incremental(
+        self, meta_data: Path, small_raw_data: Path, options: dict
+    ):
+        dataset = skillcorner.load(
+            meta_data=meta_data, raw_data=small_raw_data, **options
+        )
+        incremental_dataset = skillcorner.load(
+            meta_data=meta_data,
+            raw_data=small_raw_data,
+            incremental=True,
+            **options,
+        )
+
+        assert len(incremental_dataset) == len(dataset)
+        for frame, incremental_frame in zip(dataset, incremental_dataset):
+            assert incremental_frame.frame_id == frame.frame_id
+            assert incremental_frame.timestamp == frame.timestamp
+            assert incremental_frame.ball_coordinates == frame.ball_coordinates
+            assert incremental_frame.players_data == frame.players_data
+        assert (
+            incremental_dataset.metadata.orientation
+            == dataset.metadata.orientation
+        )
+        assert incremental_dataset.metadata.periods == dataset.metadata.periods
+
+    @pytest.mark.parametrize(
+        "options",
+        [
+            dict(),
+            dict(limit=3),
+            dict(periods=[1], end=timedelta(seconds=0.5)),
+            dict(incremental=True, limit=3),
+        ],
+    )
+    def test_periods(
+        self,
+        meta_data: Path,
+        small_raw_data: Path,
+        small_raw_data_jsonl: Path,
+        options: dict,
+    ):
+        for raw_data in (small_raw_data, small_raw_data_jsonl):
+            dataset = skillcorner.load(
+                meta_data=meta_data, raw_data=raw_data, **options
+            )
+
+            # The periods have their full bounds, also when the load stops
+            # early
+            assert [
+                (period.id, period.start_timestamp, period.end_timestamp)
+                for period in dataset.metadata.periods
+            ] == [
+                (1, timedelta(seconds=1), timedelta(seconds=2.9)),
+                (2, timedelta(seconds=10), timedelta(seconds=11.9)),
+            ]
+            assert dataset.metadata.orientation == Orientation.HOME_AWAY
+            assert dataset.records[0].frame_id == 10
+            assert dataset.records[0].timestamp == timedelta(seconds=0)
+
+    def test_periods_without_time(
+        self, meta_data: Path, small_raw_data: Path, tmp_path: Path
+    ):
+        with open(small_raw_data) as f:
+            raw_frames = json.load(f)
+        # A frame without a time doesn't change the bounds of its period
+        raw_frames.insert(
+            3,
+            {
+                "frame": 5,
+                "period": 1,
+                "possession": {"trackable_object": None, "group": None},
+                "data": [],
+                "time": None,
+            },
+        )
+        raw_data = tmp_path / "structured_data.json"
+        raw_data.write_text(json.dumps(raw_frames))
+
+        dataset = skillcorner.load(meta_data=meta_data, raw_data=raw_data)
+
+        first_period = dataset.metadata.periods[0]
+        assert first_period.start_timestamp == timedelta(seconds=1)
+        assert first_period.end_timestamp == timedelta(seconds=2.9)
+
+    def test_small_deserialization(
+        self, meta_data: Path, small_raw_data: Path
+    ):
+        dataset = skillcorner.load(
+            meta_data=meta_data,
+            raw_data=small_raw_data,
+            coordinates="skillcorner",
+        )
+
+        # the empty frame of each period is skipped
+        assert len(dataset) == 38
+        assert dataset.records[20].frame_id == 101
+        assert dataset.records[20].timestamp == timedelta(seconds=0.1)
+        assert dataset.records[20].period.id == 2
+
+        home_player = dataset.metadata.teams[0].get_player_by_id("2395")
+        assert dataset.records[1].players_data[
+            home_player
+        ].coordinates == Point(x=-9.9, y=-20.0)
+        assert dataset.records[1].ball_coordinates == Point3D(
+            x=0.2, y=-0.1, z=0.1
+        )
+        # missing ball z-coordinate is identified as None
+        assert dataset.records[0].ball_coordinates == Point3D(
+            x=0.0, y=0.0, z=None
+        )
+
+        # anonymous players are the same player in all frames
+        anon_players = {
+            player
+            for frame in dataset
+            for player in frame.players_data
+            if player.player_id == "home_anon_75"
+        }
+        assert len(anon_players) == 1
@@ -203,3 +203,29 @@ class TestSportecTrackingData:
             only_alive=True,
         )
         assert len(dataset) == 199
+
+    def test_load_window(self, raw_data: Path, meta_data: Path):
+        dataset = sportec.load_tracking(
+            raw_data=raw_data,
+            meta_data=meta_data,
+            coordinates="sportec",
+            only_alive=False,
+        )
+
+        windowed_dataset = sportec.load_tracking(
+            raw_data=raw_data,
+            meta_data=meta_data,
+            coordinates="sportec",
+            only_alive=False,
+            periods=[2],
+            start=0.5,
+            end=timedelta(seconds=1),
+        )
+        assert [frame.frame_id for frame in windowed_dataset] == list(
+            range(100013, 100026)
+        )
+        assert windowed_dataset.records[0].timestamp == timedelta(seconds=0.52)
+        assert (
+            windowed_dataset.metadata.orientation
+            == dataset.metadata.orientation
+        )
@@ -1,9 +1,14 @@
+from io import BytesIO
 from pathlib import Path
 from datetime import datetime, timedelta
 
 import pytest
 
 from kloppy import statsperform
+from kloppy.config import config_context
+from kloppy.infra.serializers.tracking import (
+    statsperform as statsperform_deserializer,
+)
 from kloppy.domain import (
     AttackingDirection,
     DatasetType,
@@ -37,6 +42,30 @@ def raw_data(base_dir) -> Path:
     ],
 )
 class TestStatsPerformTracking:
+    def test_limit_stops_reading(
+        self, meta_data: Path, raw_data: Path, monkeypatch
+    ):
+        class _BytesIO(BytesIO):
+            def close(self):
+                self.position = self.tell()
+                super().close()
+
+        monkeypatch.setattr(
+            statsperform_deserializer, "FRAME_RATE_SAMPLE_SIZE", 10
+        )
+        raw_data_fp = _BytesIO(raw_data.read_bytes())
+
+        dataset = statsperform.load(
+            meta_data=meta_data,
+            raw_data=raw_data_fp,
+            only_alive=False,
+            limit=5,
+        )
+
+        assert len(dataset.records) == 5
+        assert dataset.metadata.frame_rate == 10
+        assert raw_data_fp.position < len(raw_data.read_bytes()) / 2
+
     def test_correct_deserialization(self, meta_data: Path, raw_data: Path):
         dataset = statsperform.load(
             meta_data=meta_data,
@@ -141,3 +170,28 @@ class TestStatsPerformTracking:
         assert pitch_dimensions.x_dim.max == 1.0
         assert pitch_dimensions.y_dim.min == 0.0
         assert pitch_dimensions.y_dim.max == 1.0
+
+    def test_columnar_storage(self, meta_data: Path, raw_data: Path):
+        dataset = statsperform.load(
+            meta_data=meta_data,
+            raw_data=raw_data,
+            only_alive=False,
+        )
+        with config_context("tracking.storage", "columnar"):
+            columnar_dataset = statsperform.load(
+                meta_data=meta_data,
+                raw_data=raw_data,
+                only_alive=False,
+            )
+
+        for converted_dataset in (dataset.to_columnar(), columnar_dataset):
+            assert converted_dataset.is_columnar
+            assert len(converted_dataset) == len(dataset)
+            for frame, columnar_frame in zip(dataset, converted_dataset):
+                assert columnar_frame.frame_id == frame.frame_id
+                assert columnar_frame.timestamp == frame.timestamp
+                assert columnar_frame.period == frame.period
+                assert (
+                    columnar_frame.ball_coordinates == frame.ball_coordinates
+                )
+                assert columnar_frame.players_data == frame.players_data
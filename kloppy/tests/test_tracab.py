@@ -1,3 +1,4 @@
+import shutil
 from pathlib import Path
 from datetime import timedelta
 
@@ -22,6 +23,14 @@ from kloppy.domain import (
 )
 
 from kloppy import tracab
+from kloppy.config import config_context
+from kloppy.exceptions import DeserializationError, KloppyParameterError
+from kloppy.infra.serializers.tracking.sampling import Sampler
+from kloppy.infra.serializers.tracking.window import FrameWindow
+from kloppy.infra.serializers.tracking.tracab.tracab_dat import (
+    _parse_line,
+    _parse_lines,
+)
 
 
 @pytest.fixture(scope="session")
@@ -134,6 +143,106 @@ class TestTracabJSONTracking:
             player_home_1
         ].coordinates == Point(x=1.0019047619047619, y=0.49602941176470583)
 
+    @pytest.mark.parametrize(
+        "options",
+        [dict(only_alive=False), dict(only_alive=True), dict(limit=2)],
+    )
+    def test_incremental(
+        self, json_meta_data: Path, json_raw_data: Path, options: dict
+    ):
+        dataset = tracab.load(
+            meta_data=json_meta_data, raw_data=json_raw_data, **options
+        )
+        incremental_dataset = tracab.load(
+            meta_data=json_meta_data,
+            raw_data=json_raw_data,
+            incremental=True,
+            **options,
+        )
+
+        assert len(incremental_dataset) == len(dataset)
+        for frame, incremental_frame in zip(dataset, incremental_dataset):
+            assert incremental_frame.frame_id == frame.frame_id
+            assert incremental_frame.timestamp == frame.timestamp
+            assert incremental_frame.ball_coordinates == frame.ball_coordinates
+            assert incremental_frame.players_data == frame.players_data
+        assert (
+            incremental_dataset.metadata.orientation
+            == dataset.metadata.orientation
+        )
+
+    @pytest.mark.parametrize("incremental", [False, True])
+    def test_window(
+        self, json_meta_data: Path, json_raw_data: Path, incremental: bool
+    ):
+        dataset = tracab.load(
+            meta_data=json_meta_data,
+            raw_data=json_raw_data,
+            only_alive=False,
+        )
+
+        windowed_dataset = tracab.load(
+            meta_data=json_meta_data,
+            raw_data=json_raw_data,
+            only_alive=False,
+            incremental=incremental,
+            periods=[2],
+            end=timedelta(seconds=1),
+        )
+        assert [frame.frame_id for frame in windowed_dataset] == [
+            frame.frame_id
+            for frame in dataset
+            if frame.period.id == 2 and frame.timestamp <= timedelta(seconds=1)
+        ]
+        assert (
+            windowed_dataset.metadata.orientation
+            == dataset.metadata.orientation
+        )
+
+    @pytest.mark.parametrize("incremental", [False, True])
+    def test_objects(
+        self, json_meta_data: Path, json_raw_data: Path, incremental: bool
+    ):
+        dataset = tracab.load(
+            meta_data=json_meta_data,
+            raw_data=json_raw_data,
+            only_alive=False,
+        )
+        home_team, away_team = dataset.metadata.teams
+
+        ball_dataset = tracab.load(
+            meta_data=json_meta_data,
+            raw_data=json_raw_data,
+            only_alive=False,
+            incremental=incremental,
+            objects=["ball"],
+        )
+        assert [frame.ball_coordinates for frame in ball_dataset] == [
+            frame.ball_coordinates for frame in dataset
+        ]
+        assert all(not frame.players_data for frame in ball_dataset)
+        assert (
+            ball_dataset.metadata.orientation == dataset.metadata.orientation
+        )
+
+        away_dataset = tracab.load(
+            meta_data=json_meta_data,
+            raw_data=json_raw_data,
+            only_alive=False,
+            incremental=incremental,
+            objects=[away_team.team_id],
+        )
+        for away_frame, frame in zip(away_dataset, dataset):
+            assert away_frame.ball_coordinates is None
+            assert away_frame.players_data == {
+                player: player_data
+                for player, player_data in frame.players_data.items()
+                if player.team == away_team
+            }
+        assert (
+            away_dataset.metadata.orientation == dataset.metadata.orientation
+        )
+
 
 class TestTracabDATTracking:
     def test_correct_deserialization(
@@ -223,3 +332,396 @@ class TestTracabDATTracking:
         assert dataset.records[0].players_data[
             player_home_1
         ].coordinates == Point(x=1.0019047619047619, y=0.49602941176470583)
+
+    def test_columnar_storage(self, xml_meta_data: Path, dat_raw_data: Path):
+        dataset = tracab.load(
+            meta_data=xml_meta_data,
+            raw_data=dat_raw_data,
+            coordinates="tracab",
+            only_alive=False,
+        )
+        with config_context("tracking.storage", "columnar"):
+            columnar_dataset = tracab.load(
+                meta_data=xml_meta_data,
+                raw_data=dat_raw_data,
+                coordinates="tracab",
+                only_alive=False,
+            )
+
+        assert columnar_dataset.is_columnar
+        assert len(columnar_dataset) == len(dataset)
+        assert columnar_dataset.records.player_coordinates.shape == (
+            7,
+            len(columnar_dataset.records.players),
+            2,
+        )
+        for frame, columnar_frame in zip(dataset, columnar_dataset):
+            assert columnar_frame.frame_id == frame.frame_id
+            assert columnar_frame.timestamp == frame.timestamp
+            assert columnar_frame.period == frame.period
+            assert columnar_frame.ball_state == frame.ball_state
+            assert columnar_frame.ball_owning_team == frame.ball_owning_team
+            assert columnar_frame.ball_coordinates == frame.ball_coordinates
+            assert columnar_frame.players_data == frame.players_data
+
+        # frames are linked to the dataset
+        frame = columnar_dataset.frames[1]
+        assert frame.prev().frame_id == dataset.frames[0].frame_id
+        assert frame.next().frame_id == dataset.frames[2].frame_id
+        assert columnar_dataset.frames[0].prev() is None
+        assert frame.attacking_direction == AttackingDirection.RTL
+
+    def test_iter_frames(self, xml_meta_data: Path, dat_raw_data: Path):
+        dataset = tracab.load(
+            meta_data=xml_meta_data, raw_data=dat_raw_data, only_alive=False
+        )
+
+        with open(xml_meta_data, "rb") as meta_data_fp, open(
+            dat_raw_data, "rb"
+        ) as raw_data_fp:
+            stream = tracab.iter_frames(
+                meta_data=meta_data_fp,
+                raw_data=raw_data_fp,
+                only_alive=False,
+                file_format="dat",
+            )
+            # metadata is available before any frame is parsed
+            assert stream.metadata.orientation == Orientation.AWAY_HOME
+            assert stream.metadata.periods == dataset.metadata.periods
+
+            frames = list(stream)
+
+        assert len(frames) == len(dataset.records)
+        for frame, dataset_frame in zip(frames, dataset.records):
+            assert frame.frame_id == dataset_frame.frame_id
+            assert frame.players_data == dataset_frame.players_data
+            assert frame.ball_coordinates == dataset_frame.ball_coordinates
+
+    def test_iter_frames_closes_files(
+        self, xml_meta_data: Path, dat_raw_data: Path
+    ):
+        stream = tracab.iter_frames(
+            meta_data=xml_meta_data, raw_data=dat_raw_data, only_alive=False
+        )
+        with stream:
+            frame = next(iter(stream))
+            assert frame.frame_id == 1848508
+
+        with pytest.raises(StopIteration):
+            next(iter(stream))
+
+    def test_frame_index(
+        self, xml_meta_data: Path, dat_raw_data: Path, tmp_path: Path
+    ):
+        raw_data = tmp_path / "tracab_raw.dat"
+        shutil.copy(dat_raw_data, raw_data)
+
+        dataset = tracab.load(
+            meta_data=xml_meta_data, raw_data=raw_data, only_alive=False
+        )
+
+        for use_frame_index in (False, True, True):
+            second_period = tracab.load(
+                meta_data=xml_meta_data,
+                raw_data=raw_data,
+                only_alive=False,
+                periods=[2],
+                use_frame_index=use_frame_index,
+            )
+            assert [frame.frame_id for frame in second_period] == [
+                frame.frame_id for frame in dataset if frame.period.id == 2
+            ]
+            # orientation is still determined from the first period
+            assert (
+                second_period.metadata.orientation
+                == dataset.metadata.orientation
+            )
+
+            frame_range = tracab.load(
+                meta_data=xml_meta_data,
+                raw_data=raw_data,
+                only_alive=False,
+                frame_range=(1848509, 1916408),
+                use_frame_index=use_frame_index,
+            )
+            assert [frame.frame_id for frame in frame_range] == [
+                1848509,
+                1848510,
+                1916408,
+            ]
+            assert frame_range.records[0].players_data == (
+                dataset.records[1].players_data
+            )
+
+            # orientation is determined from the first period, which is not
+            # part of the frame range
+            second_period_frame_ids = [
+                frame.frame_id for frame in dataset if frame.period.id == 2
+            ]
+            second_period_range = tracab.load(
+                meta_data=xml_meta_data,
+                raw_data=raw_data,
+                only_alive=False,
+                frame_range=(
+                    second_period_frame_ids[0],
+                    second_period_frame_ids[-1],
+                ),
+                use_frame_index=use_frame_index,
+            )
+            assert [
+                frame.frame_id for frame in second_period_range
+            ] == second_period_frame_ids
+            assert (
+                second_period_range.metadata.orientation
+                == dataset.metadata.orientation
+            )
+
+        assert (tmp_path / "tracab_raw.dat.kloppy-idx").exists()
+
+    @pytest.mark.parametrize(
+        "options",
+        [
+            dict(only_alive=False),
+            dict(only_alive=True),
+            dict(only_alive=False, sample_rate=1 / 2),
+            dict(only_alive=False, limit=2),
+            dict(only_alive=False, periods=[2], use_frame_index=True),
+            dict(only_alive=False, start=0.04, end=2716),
+        ],
+    )
+    def test_n_workers(
+        self,
+        xml_meta_data: Path,
+        dat_raw_data: Path,
+        tmp_path: Path,
+        options: dict,
+    ):
+        raw_data = tmp_path / "tracab_raw.dat"
+        shutil.copy(dat_raw_data, raw_data)
+
+        dataset = tracab.load(
+            meta_data=xml_meta_data, raw_data=raw_data, **options
+        )
+        parallel_dataset = tracab.load(
+            meta_data=xml_meta_data, raw_data=raw_data, n_workers=2, **options
+        )
+
+        assert len(parallel_dataset) == len(dataset)
+        for frame, parallel_frame in zip(dataset, parallel_dataset):
+            assert parallel_frame.frame_id == frame.frame_id
+            assert parallel_frame.period == frame.period
+            assert parallel_frame.timestamp == frame.timestamp
+            assert parallel_frame.ball_state == frame.ball_state
+            assert parallel_frame.ball_owning_team == frame.ball_owning_team
+            assert parallel_frame.ball_coordinates == frame.ball_coordinates
+            assert parallel_frame.players_data == frame.players_data
+
+    @pytest.mark.parametrize("use_frame_index", [False, True])
+    def test_window(
+        self,
+        xml_meta_data: Path,
+        dat_raw_data: Path,
+        tmp_path: Path,
+        use_frame_index: bool,
+    ):
+        raw_data = tmp_path / "tracab_raw.dat"
+        shutil.copy(dat_raw_data, raw_data)
+
+        dataset = tracab.load(
+            meta_data=xml_meta_data, raw_data=raw_data, only_alive=False
+        )
+
+        windowed_dataset = tracab.load(
+            meta_data=xml_meta_data,
+            raw_data=raw_data,
+            only_alive=False,
+            start=0.04,
+            end=timedelta(seconds=2716),
+            use_frame_index=use_frame_index,
+        )
+        assert [frame.frame_id for frame in windowed_dataset] == [
+            1848509,
+            1848510,
+            1916408,
+            1942115,
+        ]
+        assert all(
+            timedelta(seconds=0.04) <= frame.timestamp
+            and frame.timestamp <= timedelta(seconds=2716)
+            for frame in windowed_dataset
+        )
+
+        first_period = tracab.load(
+            meta_data=xml_meta_data,
+            raw_data=raw_data,
+            only_alive=False,
+            periods=[1],
+            end=1,
+            use_frame_index=use_frame_index,
+        )
+        assert [frame.frame_id for frame in first_period] == [
+            1848508,
+            1848509,
+            1848510,
+        ]
+        assert first_period.metadata.periods == dataset.metadata.periods
+
+        with pytest.raises(KloppyParameterError):
+            tracab.load(
+                meta_data=xml_meta_data, raw_data=raw_data, start=2, end=1
+            )
+
+    @pytest.mark.parametrize(
+        "options",
+        [
+            dict(),
+            dict(use_frame_index=True),
+            dict(n_workers=2),
+            dict(periods=[2]),
+        ],
+    )
+    def test_objects(
+        self,
+        xml_meta_data: Path,
+        dat_raw_data: Path,
+        tmp_path: Path,
+        options: dict,
+    ):
+        raw_data = tmp_path / "tracab_raw.dat"
+        shutil.copy(dat_raw_data, raw_data)
+
+        dataset = tracab.load(
+            meta_data=xml_meta_data,
+            raw_data=raw_data,
+            only_alive=False,
+            periods=options.get("periods"),
+        )
+
+        home_dataset = tracab.load(
+            meta_data=xml_meta_data,
+            raw_data=raw_data,
+            only_alive=False,
+            objects=["home"],
+            **options,
+        )
+        assert len(home_dataset) == len(dataset)
+        for home_frame, frame in zip(home_dataset, dataset):
+            assert home_frame.frame_id == frame.frame_id
+            assert home_frame.ball_coordinates is None
+            assert home_frame.players_data == {
+                player: player_data
+                for player, player_data in frame.players_data.items()
+                if player.team.ground == Ground.HOME
+            }
+        # The orientation is determined with all players
+        assert (
+            home_dataset.metadata.orientation == dataset.metadata.orientation
+        )
+
+        ball_dataset = tracab.load(
+            meta_data=xml_meta_data,
+            raw_data=raw_data,
+            only_alive=False,
+            objects=["ball"],
+            **options,
+        )
+        assert [frame.ball_coordinates for frame in ball_dataset] == [
+            frame.ball_coordinates for frame in dataset
+        ]
+        assert all(not frame.players_data for frame in ball_dataset)
+
+        with pytest.raises(KloppyParameterError, match="Unknown objects"):
+            tracab.load(
+                meta_data=xml_meta_data,
+                raw_data=raw_data,
+                objects=["referee"],
+            )
+
+    def test_bulk_parse_lines(self, dat_raw_data: Path):
+        lines = [
+            line.strip()
+            for line in dat_raw_data.read_text().splitlines()
+            if line.strip()
+        ]
+        parsed = _parse_lines([0] * len(lines), lines)
+
+        assert list(parsed.raw_frames()) == [
+            (0, _parse_line(line)) for line in lines
+        ]
+
+        with pytest.raises(
+            DeserializationError, match="Unknown Player Team ID: 2"
+        ):
+            _parse_lines([0], [lines[0].replace("0,2,19", "2,2,19", 1)])
+
+        # Malformed lines are parsed one by one, so they fail the same way
+        with pytest.raises(ValueError):
+            _parse_lines([0], [lines[0].replace(";", ",1;", 1)])
+
+    def test_target_frame_rate(self, xml_meta_data: Path, dat_raw_data: Path):
+        dataset = tracab.load(
+            meta_data=xml_meta_data,
+            raw_data=dat_raw_data,
+            only_alive=False,
+            target_frame_rate=12.5,
+        )
+        sampled_dataset = tracab.load(
+            meta_data=xml_meta_data,
+            raw_data=dat_raw_data,
+            only_alive=False,
+            sample_rate=1 / 2,
+        )
+        assert dataset.metadata.frame_rate == 25
+        assert [frame.frame_id for frame in dataset] == [
+            frame.frame_id for frame in sampled_dataset
+        ]
+
+        with pytest.raises(KloppyParameterError):
+            tracab.load(
+                meta_data=xml_meta_data,
+                raw_data=dat_raw_data,
+                sample_rate=1 / 2,
+                target_frame_rate=12.5,
+            )
+
+
+@pytest.mark.parametrize(
+    "sample_rate,expected",
+    [
+        (1 / 3, [0, 3, 6, 9]),
+        (2 / 3, [0, 2, 3, 5, 6, 8, 9]),
+        (0.3, [0, 4, 7, 10]),
+        (1, list(range(11))),
+        (2, list(range(11))),
+    ],
+)
+def test_sampler(sample_rate: float, expected: list):
+    assert list(Sampler(sample_rate).sample(range(11))) == expected
+    assert (
+        list(Sampler.for_frame_rate(25, 25 * sample_rate).sample(range(11)))
+        == expected
+    )
+
+
+def test_frame_window():
+    period = Period(
+        id=2,
+        start_timestamp=timedelta(seconds=100),
+        end_timestamp=timedelta(seconds=200),
+    )
+
+    window = FrameWindow(start=10, end=timedelta(seconds=20))
+    assert window.includes(1, timedelta(seconds=10))
+    assert not window.includes(1, timedelta(seconds=21))
+    assert window.clip(period) == (
+        timedelta(seconds=110),
+        timedelta(seconds=120),
+    )
+    assert window.frame_id_ranges([period], 25) == [(2750, 3000)]
+    assert not window.is_past(2, timedelta(seconds=30))
+    assert window.is_past(2, timedelta(seconds=30), last_period_id=2)
+
+    window = FrameWindow(periods=[1])
+    assert window.clip(period) is None
+    assert window.is_past(2, timedelta(0))
+    assert not FrameWindow()
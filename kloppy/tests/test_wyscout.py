@@ -21,6 +21,11 @@ from kloppy.domain import (
 )
 
 from kloppy import wyscout
+from kloppy._providers.wyscout import identify_deserializer
+from kloppy.infra.serializers.event.wyscout import (
+    WyscoutDeserializerV2,
+    WyscoutDeserializerV3,
+)
 
 
 @pytest.fixture(scope="session")
@@ -42,6 +47,25 @@ def test_correct_auto_recognize_deserialization(
     assert dataset.records[2].coordinates == Point(36.0, 78.0)
 
 
+def test_identify_deserializer_reads_first_event(
+    event_v2_data: Path, event_v3_data: Path
+):
+    with open(event_v3_data, "rb") as event_data_fp:
+        assert identify_deserializer(event_data_fp) == WyscoutDeserializerV3
+        # The file is rewound, so it can be passed to the deserializer
+        assert event_data_fp.tell() == 0
+
+    # Only the start of the file is decoded
+    with open(event_v2_data, "rb") as event_data_fp:
+        truncated_event_data = event_data_fp.read(2000)
+    assert identify_deserializer(truncated_event_data) == WyscoutDeserializerV2
+
+    # An opened file is read only once
+    with open(event_v2_data, "rb") as event_data_fp:
+        dataset = wyscout.load(event_data=event_data_fp, coordinates="wyscout")
+    assert dataset.records[2].coordinates == Point(29.0, 6.0)
+
+
 class TestWyscoutV2:
     """Tests related to deserialization of Wyscout V2 data."""
 
@@ -1 +1 @@
-from ._providers.tracab import load
+from ._providers.tracab import load, iter_frames
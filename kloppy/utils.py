@@ -1,6 +1,7 @@
 import re
 import time
 from contextlib import contextmanager
+from dataclasses import fields
 from io import BytesIO
 from typing import BinaryIO, Union
 import functools
@@ -85,6 +86,56 @@ def docstring_inherit_attributes(parent):
     return inherit
 
 
+def add_slots(cls):
+    """
+    Class decorator that rebuilds a dataclass with `__slots__` for all its
+    fields. This is the equivalent of `@dataclass(slots=True)`, which is only
+    available from Python 3.10 onwards. Must be applied on top of the
+    `@dataclass` decorator.
+
+    Instances of the resulting class don't have a `__dict__`, which makes
+    them a lot smaller and faster to create. Fields that are already
+    declared as slot by a parent class are not redeclared.
+    """
+    if "__slots__" in cls.__dict__:
+        raise TypeError(f"{cls.__name__} already specifies __slots__")
+
+    inherited_slots = set()
+    for base in cls.__mro__[1:-1]:
+        slots = base.__dict__.get("__slots__", ())
+        inherited_slots.update((slots,) if isinstance(slots, str) else slots)
+
+    cls_dict = dict(cls.__dict__)
+    field_names = tuple(
+        f.name for f in fields(cls) if f.name not in inherited_slots
+    )
+    cls_dict["__slots__"] = field_names
+    for field_name in field_names:
+        # Defaults are already part of the generated __init__. The class
+        # attributes holding them would conflict with the slot descriptors.
+        cls_dict.pop(field_name, None)
+    cls_dict.pop("__dict__", None)
+    cls_dict.pop("__weakref__", None)
+
+    new_cls = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+    new_cls.__qualname__ = cls.__qualname__
+
+    if cls.__dataclass_params__.frozen:
+        # Default pickling of slotted objects uses setattr, which is not
+        # allowed on frozen dataclasses.
+        def __getstate__(self):
+            return [getattr(self, f.name) for f in fields(self)]
+
+        def __setstate__(self, state):
+            for f, value in zip(fields(self), state):
+                object.__setattr__(self, f.name, value)
+
+        new_cls.__getstate__ = __getstate__
+        new_cls.__setstate__ = __setstate__
+
+    return new_cls
+
+
 string_types = (type(b""), type(""))
 
 